@@ -0,0 +1,16 @@
+import logging
+
+from fastapi import APIRouter
+
+from app.core.db_pool import get_pool_status
+from app.models.base import get_engine
+from app.schemas import admin as admin_schema
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/admin/metrics", tags=["admin-metrics"])
+
+
+@router.get("/pool", response_model=admin_schema.PoolMetricsResponse)
+async def get_pool_metrics():
+    """DB 커넥션 풀 메트릭 조회 API (사용 중/오버플로/대기 시간/연결 오류)"""
+    return get_pool_status(get_engine().pool)
@@ -1,10 +1,11 @@
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import http_cache
 from app.crud import sub_topic as sub_topic_crud
-from app.models.base import get_db
+from app.models.base import get_db, get_read_db
 from app.schemas import core_content_auto as auto_schema
 from app.schemas import sub_topic as sub_topic_schema
 from app.services import core_content_service
@@ -17,12 +18,14 @@ admin_router = APIRouter(prefix="/admin/core-content", tags=["admin-core-content
 @router.get("/{sub_topic_id}", response_model=sub_topic_schema.SubTopicCoreContentResponse)
 async def get_core_content(
     sub_topic_id: int,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
 ):
     """세부항목 핵심 정보 조회 API (관리 페이지용, 목록 형식)
     
     관리 페이지에서 등록/수정을 위해 사용되므로, 세부항목이 없어도 빈 값으로 반환합니다.
-    핵심 정보는 구분자로 분리되어 배열로 반환됩니다.
+    핵심 정보는 항목 단위로 최신순 배열로 반환됩니다.
     """
     logger.info(f"세부항목 핵심 정보 조회 시작: sub_topic_id={sub_topic_id}")
     
@@ -46,8 +49,26 @@ async def get_core_content(
             },
         )
     
-    # 핵심 정보를 구분자로 분리하여 배열로 변환
-    core_contents = sub_topic_crud.parse_core_contents(sub_topic.core_content, sub_topic.source_type)
+    # 항목 추가/세부항목 수정 시 updated_at과 항목 수가 바뀌므로 항목을 읽기 전에 검증
+    etag = http_cache.compute_etag(
+        "core-content", sub_topic.id, sub_topic.name, sub_topic.core_content_count, sub_topic.updated_at
+    )
+    if http_cache.is_not_modified(request, etag, sub_topic.updated_at):
+        return http_cache.not_modified_response(
+            etag, sub_topic.updated_at, http_cache.REVALIDATE_CACHE_CONTROL
+        )
+    http_cache.set_cache_headers(
+        response, etag, sub_topic.updated_at, http_cache.REVALIDATE_CACHE_CONTROL
+    )
+    
+    # 핵심 정보 항목을 최신순으로 스트리밍하여 목록 구성
+    core_contents: list[sub_topic_schema.CoreContentItem] = []
+    async for item in sub_topic_crud.stream_core_content_items(db, sub_topic_id):
+        core_contents.append(sub_topic_schema.CoreContentItem(
+            index=len(core_contents),
+            core_content=item.content,
+            source_type=item.source_type,
+        ))
     
     logger.info(f"세부항목 핵심 정보 조회 완료: sub_topic_id={sub_topic_id}, name={sub_topic.name}, core_contents_count={len(core_contents)}")
     
@@ -55,9 +76,7 @@ async def get_core_content(
     return sub_topic_schema.SubTopicCoreContentResponse(
         id=sub_topic.id,
         name=sub_topic.name,
-        core_contents=[
-            sub_topic_schema.CoreContentItem(**item) for item in core_contents
-        ],
+        core_contents=core_contents,
         updated_at=sub_topic.updated_at
     )
 
@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.base import get_db
+from app.core.responses import model_json_response
+from app.exceptions import ExamSessionNotFoundError
+from app.models.base import get_db, get_read_db, is_read_replica
 from app.schemas import exam as exam_schema, quiz as quiz_schema
 from app.services import exam_service
 
@@ -14,7 +16,7 @@ async def start_exam(
     db: AsyncSession = Depends(get_db),
 ):
     """시험 시작 API"""
-    return await exam_service.start_exam(db, request)
+    return model_json_response(await exam_service.start_exam(db, request))
 
 
 @router.post("/submit", response_model=exam_schema.ExamRecordResponse)
@@ -23,13 +25,29 @@ async def submit_answer(
     db: AsyncSession = Depends(get_db),
 ):
     """답안 제출 API"""
-    return await exam_service.submit_answer(db, request)
+    return model_json_response(await exam_service.submit_answer(db, request))
+
+
+@router.post("/submit-batch", response_model=exam_schema.ExamResponse)
+async def submit_answers_batch(
+    request: exam_schema.ExamSubmitBatchRequest,
+    db: AsyncSession = Depends(get_db),
+):
+    """답안 일괄 제출 API (채점 결과를 시험 결과 형식으로 반환)"""
+    return model_json_response(await exam_service.submit_answers_batch(db, request))
 
 
 @router.get("/{exam_session_id}", response_model=exam_schema.ExamResponse)
 async def get_exam_result(
     exam_session_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
+    primary_db: AsyncSession = Depends(get_db),
 ):
     """시험 결과 조회 API"""
-    return await exam_service.get_exam_result(db, exam_session_id)
+    try:
+        return model_json_response(await exam_service.get_exam_result(db, exam_session_id))
+    except ExamSessionNotFoundError:
+        if not is_read_replica(db):
+            raise
+        # 복제 지연으로 방금 시작한 시험이 아직 없을 수 있으므로 primary에서 재조회
+        return model_json_response(await exam_service.get_exam_result(primary_db, exam_session_id))
@@ -0,0 +1,50 @@
+from fastapi import APIRouter, Depends, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.responses import model_json_response
+from app.crud import job as job_crud
+from app.exceptions import JobNotFoundError
+from app.models.base import get_db
+from app.models.job import Job
+from app.schemas import job as job_schema
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+# 202 응답을 원하는 클라이언트가 보내는 Prefer 헤더 값 (RFC 7240)
+RESPOND_ASYNC = "respond-async"
+
+
+def prefers_async(request: Request) -> bool:
+    """Prefer 헤더에 respond-async가 있는지 확인"""
+    prefer = request.headers.get("prefer", "")
+    return any(
+        token.split(";", 1)[0].strip().lower() == RESPOND_ASYNC
+        for token in prefer.split(",")
+    )
+
+
+def job_accepted_response(request: Request, job: Job) -> Response:
+    """작업 접수 응답 (202, Location: 작업 상태 조회 URL)"""
+    response = model_json_response(
+        job_schema.JobResponse.model_validate(job),
+        status_code=status.HTTP_202_ACCEPTED,
+    )
+    response.headers["Location"] = str(request.url_for("get_job", job_id=job.id).path)
+    response.headers["Preference-Applied"] = RESPOND_ASYNC
+    return response
+
+
+@router.get("/{job_id}", response_model=job_schema.JobResponse)
+async def get_job(
+    job_id: str,
+    db: AsyncSession = Depends(get_db),
+):
+    """비동기 작업 상태/진행률/결과 조회 API"""
+    job = await job_crud.get_job(db, job_id)
+    if not job:
+        raise JobNotFoundError(job_id)
+    response = model_json_response(job_schema.JobResponse.model_validate(job))
+    if job.status in (job_crud.JOB_QUEUED, job_crud.JOB_RUNNING):
+        # 진행 중인 작업은 폴링 간격 힌트 제공
+        response.headers["Retry-After"] = "2"
+    return response
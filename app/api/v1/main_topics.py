@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import http_cache
 from app.crud import main_topic as main_topic_crud
-from app.models.base import get_db
+from app.models.base import get_read_db
 from app.schemas import main_topic as main_topic_schema
 
 router = APIRouter(prefix="/main-topics", tags=["main-topics"])
@@ -13,9 +14,18 @@ ADSP_SUBJECT_ID = 1
 
 @router.get("", response_model=main_topic_schema.MainTopicListResponse)
 async def get_all_main_topics(
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
 ):
-    """주요항목 목록 조회 API (ADsP 전용)"""
+    """주요항목 목록 조회 API (ADsP 전용, ETag 조건부 요청 지원)"""
+    count, last_modified = await main_topic_crud.get_main_topics_version(db)
+    etag = http_cache.compute_etag("main-topics", count, last_modified)
+    # 삭제는 last_modified에 드러나지 않으므로 If-Modified-Since는 판정에 쓰지 않음 (ETag만 사용)
+    if http_cache.is_not_modified(request, etag):
+        return http_cache.not_modified_response(etag, last_modified)
+    http_cache.set_cache_headers(response, etag, last_modified)
+    
     main_topics = await main_topic_crud.get_all_main_topics(db)
     main_topic_responses = [
         main_topic_schema.MainTopicResponse.model_validate(mt) for mt in main_topics
@@ -29,7 +39,7 @@ async def get_all_main_topics(
 @router.get("/{main_topic_id}", response_model=main_topic_schema.MainTopicResponse)
 async def get_main_topic(
     main_topic_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """주요항목 상세 조회 API"""
     main_topic = await main_topic_crud.get_main_topic_by_id(db, main_topic_id)
@@ -1,14 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.v1.jobs import job_accepted_response, prefers_async
+from app.core.config import settings
+from app.core.deadline import request_deadline
+from app.core.responses import model_json_response
 from app.crud import quiz as quiz_crud, subject as subject_crud
 from app.exceptions import InvalidQuizRequestError, QuizNotFoundError
-from app.models.base import get_db
-from app.schemas import quiz as quiz_schema, subject as subject_schema
-from app.services import quiz_service
+from app.models.base import get_db, get_read_db, is_read_replica
+from app.schemas import job as job_schema, quiz as quiz_schema, subject as subject_schema
+from app.services import job_service, quiz_service
 
 router = APIRouter(prefix="/quiz", tags=["quiz"])
 
+# Prefer: respond-async 요청 시 작업 접수 응답
+ASYNC_JOB_RESPONSES = {
+    status.HTTP_202_ACCEPTED: {
+        "model": job_schema.JobResponse,
+        "description": "Prefer: respond-async 요청 시 작업 접수 (GET /jobs/{job_id}로 결과 조회)",
+    },
+}
+
 
 @router.get("/subjects", response_model=subject_schema.SubjectListResponse)
 async def get_subjects(
@@ -20,63 +32,122 @@ async def get_subjects(
     return subject_schema.SubjectListResponse(subjects=subject_responses, total=len(subject_responses))
 
 
-@router.post("/generate", response_model=quiz_schema.QuizResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/generate",
+    response_model=quiz_schema.QuizResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(request_deadline(settings.request_timeout_default))],
+)
 async def generate_quiz(
     request: quiz_schema.QuizCreateRequest,
     db: AsyncSession = Depends(get_db),
 ):
     """문제 생성 API (프론트엔드 호환: camelCase 필드명 지원, subject_id 선택 필드)"""
-    return await quiz_service.generate_quiz(db, request)
+    return model_json_response(
+        await quiz_service.generate_quiz(db, request),
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+@router.get("", response_model=quiz_schema.QuizBatchResponse)
+async def get_quizzes(
+    ids: str = Query(..., description="콤마로 구분된 문제 ID 리스트 (예: '3,1,2', 응답은 이 순서를 따름)"),
+    db: AsyncSession = Depends(get_read_db),
+    primary_db: AsyncSession = Depends(get_db),
+):
+    """문제 일괄 조회 API (학습 세션 복원/오답 복습용, 없는 ID는 missing_ids로 반환)"""
+    try:
+        quiz_ids = [int(id_str.strip()) for id_str in ids.split(",") if id_str.strip()]
+    except ValueError:
+        raise InvalidQuizRequestError("ids는 콤마로 구분된 숫자 리스트여야 합니다 (예: '1,2,3')")
+    if not quiz_ids:
+        raise InvalidQuizRequestError("ids에 조회할 문제 ID가 없습니다")
+    if len(quiz_ids) > quiz_schema.MAX_BATCH_QUIZ_IDS_QUERY:
+        raise InvalidQuizRequestError(
+            f"ids는 최대 {quiz_schema.MAX_BATCH_QUIZ_IDS_QUERY}개까지 조회할 수 있습니다 (더 많으면 POST /quiz/batch 사용)"
+        )
+    return model_json_response(
+        await quiz_service.get_quizzes_by_ids(db, quiz_ids, primary_db if is_read_replica(db) else None)
+    )
+
+
+@router.post("/batch", response_model=quiz_schema.QuizBatchResponse)
+async def get_quizzes_batch(
+    request: quiz_schema.QuizBatchRequest,
+    db: AsyncSession = Depends(get_read_db),
+    primary_db: AsyncSession = Depends(get_db),
+):
+    """문제 일괄 조회 API (긴 ID 목록용 POST 본문 버전)"""
+    return model_json_response(
+        await quiz_service.get_quizzes_by_ids(db, request.ids, primary_db if is_read_replica(db) else None)
+    )
 
 
 @router.get("/dashboard", response_model=quiz_schema.QuizDashboardResponse)
 async def get_quiz_dashboard(
-    db: AsyncSession = Depends(get_db),
+    validation_page: int = Query(1, ge=1, description="검증 필요 문제 페이지 번호"),
+    validation_limit: int = Query(20, ge=1, le=100, description="검증 필요 문제 페이지당 항목 수"),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """관리자 대시보드 API: 문제 목록과 카테고리 매칭 상태 시각화"""
-    return await quiz_service.get_quiz_dashboard(db)
+    return model_json_response(
+        await quiz_service.get_quiz_dashboard(db, validation_page, validation_limit)
+    )
 
 
 @router.get("/{quiz_id}", response_model=quiz_schema.QuizResponse)
 async def get_quiz(
     quiz_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
+    primary_db: AsyncSession = Depends(get_db),
 ):
     """문제 조회 API"""
     from app.crud import quiz_validation as validation_crud
     
     quiz = await quiz_crud.get_quiz_by_id(db, quiz_id)
+    if not quiz and is_read_replica(db):
+        # 복제 지연으로 방금 생성된 문제가 아직 없을 수 있으므로 primary에서 재조회
+        db = primary_db
+        quiz = await quiz_crud.get_quiz_by_id(db, quiz_id)
     if not quiz:
         raise QuizNotFoundError(quiz_id)
 
     # validation_status 포함하여 반환
     validation_statuses = await validation_crud.get_latest_validation_statuses(db, [quiz.id])
-    validation_status = validation_statuses.get(quiz.id, "pending")
-    
-    quiz_dict = {
-        "id": quiz.id,
-        "subject_id": quiz.subject_id,
-        "question": quiz.question,
-        "options": quiz.options,
-        "correct_answer": quiz.correct_answer,
-        "explanation": quiz.explanation,
-        "source_url": quiz.source_url,
-        "created_at": quiz.created_at,
-        "validation_status": validation_status,
-    }
-    return quiz_schema.QuizResponse.model_validate(quiz_dict)
-
-
-@router.post("/generate-study", response_model=quiz_schema.StudyModeQuizListResponse, status_code=status.HTTP_201_CREATED)
+    return model_json_response(
+        quiz_schema.QuizResponse.from_quiz(quiz, validation_statuses.get(quiz.id, "pending"))
+    )
+
+
+@router.post(
+    "/generate-study",
+    response_model=quiz_schema.StudyModeQuizListResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses=ASYNC_JOB_RESPONSES,
+    dependencies=[Depends(request_deadline(settings.request_timeout_study))],
+)
 async def generate_study_quizzes(
     request: quiz_schema.StudyModeQuizCreateRequest,
+    http_request: Request,
     db: AsyncSession = Depends(get_db),
 ):
-    """학습 모드 문제 생성 API (10개 일괄 생성, 캐싱 지원)"""
-    return await quiz_service.generate_study_quizzes(db, request)
+    """학습 모드 문제 생성 API (10개 일괄 생성, 캐싱 지원, Prefer: respond-async면 비동기 작업으로 처리)"""
+    if prefers_async(http_request):
+        job = await job_service.job_worker_pool.enqueue(
+            db, job_service.JOB_GENERATE_STUDY, request.model_dump(mode="json")
+        )
+        return job_accepted_response(http_request, job)
+    return model_json_response(
+        await quiz_service.generate_study_quizzes(db, request),
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
-@router.get("/study/next", response_model=quiz_schema.QuizResponse)
+@router.get(
+    "/study/next",
+    response_model=quiz_schema.QuizResponse,
+    dependencies=[Depends(request_deadline(settings.request_timeout_default))],
+)
 async def get_next_study_quiz(
     sub_topic_id: int,
     exclude_quiz_ids: str | None = None,  # 콤마로 구분된 문제 ID 리스트 (예: "1,2,3")
@@ -91,7 +162,7 @@ async def get_next_study_quiz(
         except ValueError:
             raise InvalidQuizRequestError("exclude_quiz_ids는 콤마로 구분된 숫자 리스트여야 합니다 (예: '1,2,3')")
     
-    return await quiz_service.get_next_study_quiz(db, sub_topic_id, exclude_ids)
+    return model_json_response(await quiz_service.get_next_study_quiz(db, sub_topic_id, exclude_ids))
 
 
 @router.put("/{quiz_id}", response_model=quiz_schema.QuizResponse)
@@ -101,25 +172,20 @@ async def update_quiz(
     db: AsyncSession = Depends(get_db),
 ):
     """문제 수정 API (카테고리 검증 후 수정 가능)"""
-    import json
-    
     quiz = await quiz_crud.get_quiz_by_id(db, quiz_id)
     if not quiz:
         raise QuizNotFoundError(quiz_id)
     
-    # options를 JSON 문자열로 변환
-    options_json = None
+    # options를 JSONB 저장용 dict 리스트로 변환
+    options_data = None
     if request.options is not None:
-        options_json = json.dumps(
-            [{"index": opt.index, "text": opt.text} for opt in request.options],
-            ensure_ascii=False
-        )
+        options_data = [{"index": opt.index, "text": opt.text} for opt in request.options]
     
     updated_quiz = await quiz_crud.update_quiz(
         db,
         quiz_id,
         question=request.question,
-        options=options_json,
+        options=options_data,
         correct_answer=request.correct_answer,
         explanation=request.explanation,
         sub_topic_id=request.sub_topic_id,
@@ -131,38 +197,51 @@ async def update_quiz(
     # validation_status 포함하여 반환
     from app.crud import quiz_validation as validation_crud
     validation_statuses = await validation_crud.get_latest_validation_statuses(db, [quiz_id])
-    validation_status = validation_statuses.get(quiz_id, "pending")
-    
-    quiz_dict = {
-        "id": updated_quiz.id,
-        "subject_id": updated_quiz.subject_id,
-        "question": updated_quiz.question,
-        "options": updated_quiz.options,
-        "correct_answer": updated_quiz.correct_answer,
-        "explanation": updated_quiz.explanation,
-        "source_url": updated_quiz.source_url,
-        "created_at": updated_quiz.created_at,
-        "validation_status": validation_status,
-    }
-    return quiz_schema.QuizResponse.model_validate(quiz_dict)
-
-
-@router.post("/{quiz_id}/validate", response_model=quiz_schema.QuizValidationResponse)
+    return model_json_response(
+        quiz_schema.QuizResponse.from_quiz(updated_quiz, validation_statuses.get(quiz_id, "pending"))
+    )
+
+
+@router.post(
+    "/{quiz_id}/validate",
+    response_model=quiz_schema.QuizValidationResponse,
+    responses=ASYNC_JOB_RESPONSES,
+    dependencies=[Depends(request_deadline(settings.request_timeout_default))],
+)
 async def validate_quiz(
     quiz_id: int,
+    http_request: Request,
     db: AsyncSession = Depends(get_db),
 ):
-    """문제 검증 API: Gemini로 생성된 문제가 카테고리에 맞는지 재검증"""
+    """문제 검증 API: Gemini로 생성된 문제가 카테고리에 맞는지 재검증 (Prefer: respond-async 지원)"""
+    if prefers_async(http_request):
+        if not await quiz_crud.get_quiz_by_id(db, quiz_id):
+            raise QuizNotFoundError(quiz_id)
+        job = await job_service.job_worker_pool.enqueue(db, job_service.JOB_VALIDATE, {"quiz_id": quiz_id})
+        return job_accepted_response(http_request, job)
     return await quiz_service.validate_quiz(db, quiz_id)
 
 
-@router.post("/{quiz_id}/correction", response_model=quiz_schema.QuizCorrectionResponse)
+@router.post(
+    "/{quiz_id}/correction",
+    response_model=quiz_schema.QuizCorrectionResponse,
+    responses=ASYNC_JOB_RESPONSES,
+    dependencies=[Depends(request_deadline(settings.request_timeout_default))],
+)
 async def request_quiz_correction(
     quiz_id: int,
     request: quiz_schema.QuizCorrectionRequest,
+    http_request: Request,
     db: AsyncSession = Depends(get_db),
 ):
-    """문제 수정 요청 API: 사용자 피드백을 Gemini로 검증 후 수정"""
+    """문제 수정 요청 API: 사용자 피드백을 Gemini로 검증 후 수정 (Prefer: respond-async 지원)"""
     # URL의 quiz_id를 사용 (request의 quiz_id는 무시)
     request.quiz_id = quiz_id
+    if prefers_async(http_request):
+        if not await quiz_crud.get_quiz_by_id(db, quiz_id):
+            raise QuizNotFoundError(quiz_id)
+        job = await job_service.job_worker_pool.enqueue(
+            db, job_service.JOB_CORRECTION, request.model_dump(mode="json")
+        )
+        return job_accepted_response(http_request, job)
     return await quiz_service.request_quiz_correction(db, request)
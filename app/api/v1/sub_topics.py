@@ -1,10 +1,11 @@
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import http_cache
 from app.crud import main_topic as main_topic_crud, sub_topic as sub_topic_crud
-from app.models.base import get_db
+from app.models.base import get_db, get_read_db
 from app.schemas import sub_topic as sub_topic_schema
 
 logger = logging.getLogger(__name__)
@@ -14,9 +15,11 @@ router = APIRouter(prefix="/main-topics", tags=["main-topics"])
 @router.get("/{main_topic_id}/sub-topics", response_model=sub_topic_schema.SubTopicListResponse)
 async def get_sub_topics(
     main_topic_id: int,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
 ):
-    """세부항목 목록 조회 API"""
+    """세부항목 목록 조회 API (ETag 조건부 요청 지원)"""
     # 주요항목 존재 확인
     main_topic = await main_topic_crud.get_main_topic_by_id(db, main_topic_id)
     if not main_topic:
@@ -25,6 +28,13 @@ async def get_sub_topics(
             detail=f"주요항목을 찾을 수 없습니다: {main_topic_id}",
         )
     
+    count, last_modified = await sub_topic_crud.get_sub_topics_version(db, main_topic_id)
+    etag = http_cache.compute_etag("sub-topics", main_topic_id, count, last_modified)
+    # 삭제는 last_modified에 드러나지 않으므로 If-Modified-Since는 판정에 쓰지 않음 (ETag만 사용)
+    if http_cache.is_not_modified(request, etag):
+        return http_cache.not_modified_response(etag, last_modified)
+    http_cache.set_cache_headers(response, etag, last_modified)
+    
     sub_topics = await sub_topic_crud.get_sub_topics_by_main_topic_id(db, main_topic_id)
     sub_topic_responses = [
         sub_topic_schema.SubTopicResponse.model_validate(st) for st in sub_topics
@@ -96,17 +106,21 @@ async def append_sub_topic_core_content(
             },
         )
     
-    logger.info(f"세부항목 핵심 정보 추가 완료: sub_topic_id={sub_topic_id}, source_type={request.source_type}, 기존 데이터 존재 여부: {sub_topic.core_content is not None}")
+    logger.info(f"세부항목 핵심 정보 추가 완료: sub_topic_id={sub_topic_id}, source_type={request.source_type}, 항목 수: {updated_sub_topic.core_content_count}")
     
-    # 핵심 정보를 구분자로 분리하여 배열로 변환
-    core_contents = sub_topic_crud.parse_core_contents(updated_sub_topic.core_content, updated_sub_topic.source_type)
+    # 핵심 정보 항목을 최신순으로 조회
+    core_contents: list[sub_topic_schema.CoreContentItem] = []
+    async for item in sub_topic_crud.stream_core_content_items(db, sub_topic_id):
+        core_contents.append(sub_topic_schema.CoreContentItem(
+            index=len(core_contents),
+            core_content=item.content,
+            source_type=item.source_type,
+        ))
     
     # 목록 형식으로 응답 생성
     return sub_topic_schema.SubTopicCoreContentResponse(
         id=updated_sub_topic.id,
         name=updated_sub_topic.name,
-        core_contents=[
-            sub_topic_schema.CoreContentItem(**item) for item in core_contents
-        ],
+        core_contents=core_contents,
         updated_at=updated_sub_topic.updated_at
     )
@@ -1,8 +1,9 @@
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import http_cache
 from app.crud import subject as subject_crud
 from app.models.base import get_db
 from app.schemas import subject as subject_schema
@@ -14,10 +15,18 @@ router = APIRouter(prefix="/subjects", tags=["subjects"])
 
 @router.get("", response_model=list[subject_schema.SubjectResponse])
 async def get_subjects(
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
 ):
-    """과목 목록 조회 API (ADsP 전용, 하위 호환성 유지)"""
+    """과목 목록 조회 API (ADsP 전용, 하위 호환성 유지, ETag 조건부 요청 지원)"""
     try:
+        # 문제 개수가 포함되어 과목 수정 시각만으로는 변경을 알 수 없으므로 ETag만 사용
+        etag = http_cache.compute_etag("subjects", *await subject_crud.get_subjects_version(db))
+        if http_cache.is_not_modified(request, etag):
+            return http_cache.not_modified_response(etag)
+        http_cache.set_cache_headers(response, etag)
+        
         subjects_data = await subject_crud.get_all_subjects_with_quiz_count(db)
         return [subject_schema.SubjectResponse.model_validate(subject) for subject in subjects_data]
     except Exception as e:
@@ -3,8 +3,9 @@ from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.responses import model_json_response
 from app.crud import wrong_answer as wrong_answer_crud
-from app.models.base import get_db
+from app.models.base import get_db, get_read_db
 from app.schemas import wrong_answer as wrong_answer_schema
 
 router = APIRouter(prefix="/wrong-answers", tags=["wrong-answers"])
@@ -52,7 +53,7 @@ async def get_wrong_answers(
     limit: int = Query(20, ge=1, le=100, description="페이지당 항목 수"),
     sort: str = Query("saved_at", description="정렬 기준 (created_at 또는 saved_at)"),
     order: str = Query("desc", description="정렬 순서 (asc 또는 desc)"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """오답노트 조회 API (필터링, 페이지네이션, 정렬)"""
     if sort not in ("created_at", "saved_at"):
@@ -79,7 +80,7 @@ async def get_wrong_answers(
     
     total_pages = (total + limit - 1) // limit if limit > 0 else 0
     
-    return wrong_answer_schema.WrongAnswerListResponse(
+    return model_json_response(wrong_answer_schema.WrongAnswerListResponse(
         wrong_answers=[
             wrong_answer_schema.WrongAnswerResponse.model_validate(wa) for wa in wrong_answers
         ],
@@ -87,7 +88,7 @@ async def get_wrong_answers(
         page=page,
         limit=limit,
         total_pages=total_pages,
-    )
+    ))
 
 
 @router.delete("/{wrong_answer_id}", response_model=wrong_answer_schema.WrongAnswerDeleteResponse)
@@ -132,7 +133,7 @@ async def delete_wrong_answers_batch(
 
 @router.get("/stats", response_model=wrong_answer_schema.WrongAnswerStatsResponse)
 async def get_wrong_answer_stats(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """오답노트 통계 API"""
     stats = await wrong_answer_crud.get_wrong_answer_stats(db)
@@ -0,0 +1,202 @@
+"""응답 압축 미들웨어 (Accept-Encoding 협상: br > gzip)
+
+대시보드/오답노트처럼 큰 JSON 응답은 전송 크기가 지연의 대부분을 차지합니다.
+- minimum_size 미만의 단일 본문 응답은 압축하지 않음 (작은 응답은 압축 비용이 더 큼)
+- 스트리밍 응답(more_body=True)은 청크마다 flush하며 압축 (Content-Length 제거)
+- 이미 인코딩된 응답, 206/304 응답, 이미 압축된 형식(이미지 등)과 SSE는 그대로 전달
+- 압축한 응답의 강한 ETag는 약한 ETag로 바꿈 (표현이 달라지므로, 조건부 요청은 약한 비교)
+- 304도 200과 같은 캐시 키/검증자를 갖도록 Vary를 붙이고, 인코딩이 협상되었으면 ETag를 약하게 바꿈
+- brotli는 선택 의존성 (pip install ".[speedups]"), 없으면 gzip만 협상
+"""
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - 선택 의존성
+    brotli = None
+
+# 압축하지 않는 content-type (이미 압축되었거나 스트림 이벤트)
+EXCLUDED_CONTENT_TYPE_PREFIXES = (
+    "image/",
+    "video/",
+    "audio/",
+    "font/",
+    "text/event-stream",
+    "application/zip",
+    "application/gzip",
+)
+
+
+class _GzipEncoder:
+    """gzip 스트리밍 인코더"""
+    name = "gzip"
+
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes, *, final: bool) -> bytes:
+        flush_mode = zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH
+        return self._compressor.compress(data) + self._compressor.flush(flush_mode)
+
+
+class _BrotliEncoder:
+    """brotli 스트리밍 인코더"""
+    name = "br"
+
+    def __init__(self, quality: int) -> None:
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes, *, final: bool) -> bytes:
+        chunk = self._compressor.process(data)
+        return chunk + (self._compressor.finish() if final else self._compressor.flush())
+
+
+def parse_accept_encoding(header: str) -> dict[str, float]:
+    """Accept-Encoding 헤더를 {인코딩: q값}으로 파싱"""
+    encodings = {}
+    for item in header.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        encodings[name] = quality
+    return encodings
+
+
+def negotiate_encoding(header: str, brotli_available: bool = brotli is not None) -> str | None:
+    """지원하는 인코딩 중 클라이언트가 허용한 것 선택 (동일 q값이면 br 우선)"""
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get("*", 0.0)
+    candidates = ["br", "gzip"] if brotli_available else ["gzip"]
+    best, best_quality = None, 0.0
+    for name in candidates:
+        quality = accepted.get(name, wildcard)
+        if quality > best_quality:
+            best, best_quality = name, quality
+    return best
+
+
+class CompressionMiddleware:
+    """협상된 인코딩으로 응답 본문을 압축하는 ASGI 미들웨어"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # 협상 실패(None)여도 압축 가능한 응답에는 Vary를 붙여야 하므로 responder를 거침
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def create_encoder(self, encoding: str) -> _GzipEncoder | _BrotliEncoder:
+        if encoding == "br":
+            return _BrotliEncoder(self.brotli_quality)
+        return _GzipEncoder(self.gzip_level)
+
+
+class _CompressionResponder:
+    """요청 하나의 응답 메시지를 가로채 압축"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str | None, send: Send) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self.start_message: Message | None = None
+        self.encoder: _GzipEncoder | _BrotliEncoder | None = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            self.start_message = message
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "").lower()
+            self.passthrough = (
+                "content-encoding" in headers
+                or message["status"] in (204, 206, 304)
+                or content_type.startswith(EXCLUDED_CONTENT_TYPE_PREFIXES)
+            )
+            if self.passthrough:
+                if message["status"] == 304 and "content-encoding" not in headers:
+                    self._prepare_not_modified(message)
+                await self._send(message)
+            return
+
+        if self.passthrough:
+            await self._send(message)
+            return
+        if message_type != "http.response.body":
+            # 본문 없이 오는 메시지(pathsend 등)는 압축하지 않음
+            if self.start_message is not None:
+                await self._send(self.start_message)
+                self.start_message = None
+            self.passthrough = True
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start_message is not None:
+            # 첫 본문 메시지: 압축 여부를 결정한 뒤 헤더 전송
+            start_message, self.start_message = self.start_message, None
+            headers = MutableHeaders(raw=start_message["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            if self.encoding is None or (not more_body and len(body) < self.middleware.minimum_size):
+                self.passthrough = True
+                await self._send(start_message)
+                await self._send(message)
+                return
+
+            self.encoder = self.middleware.create_encoder(self.encoding)
+            headers["Content-Encoding"] = self.encoder.name
+            _weaken_etag(headers)
+            if "content-length" in headers:
+                del headers["Content-Length"]
+            compressed = self.encoder.compress(body, final=not more_body)
+            if not more_body:
+                headers["Content-Length"] = str(len(compressed))
+            await self._send(start_message)
+            await self._send({**message, "body": compressed})
+            return
+
+        # 스트리밍 응답의 이후 청크
+        await self._send({**message, "body": self.encoder.compress(body, final=not more_body)})
+
+    def _prepare_not_modified(self, message: Message) -> None:
+        """304에 압축된 200과 같은 Vary/ETag 적용 (캐시가 인코딩별 표현을 섞지 않도록)"""
+        headers = MutableHeaders(raw=message["headers"])
+        headers.add_vary_header("Accept-Encoding")
+        if self.encoding is not None:
+            _weaken_etag(headers)
+
+
+def _weaken_etag(headers: MutableHeaders) -> None:
+    """강한 ETag를 약한 ETag로 변경 (압축으로 표현이 달라짐)"""
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["ETag"] = f"W/{etag}"
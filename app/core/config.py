@@ -14,13 +14,82 @@ class Settings(BaseSettings):
     db_user: str = ""
     db_password: str = ""
 
+    # Database 커넥션 풀
+    db_pool_size: int = 5  # 상시 유지 커넥션 수
+    db_max_overflow: int = 10  # pool_size 초과 시 추가로 허용할 커넥션 수
+    db_pool_timeout: float = 30.0  # 커넥션 대기 최대 시간 (초)
+    db_pool_recycle: int = 1800  # 커넥션 재생성 주기 (초, -1이면 비활성화)
+    db_pool_pre_ping: bool = True  # 체크아웃 시 커넥션 유효성 확인
+    db_statement_cache_size: int = 100  # asyncpg prepared statement 캐시 크기 (PgBouncer transaction 모드면 0)
+    db_echo: bool | None = None  # SQL 로그 출력 (None이면 development 환경에서만)
+
+    # 서버 시작 시 준비 작업 (커넥션 생성, 분류 체계 캐시 적재, 자주 쓰는 쿼리 컴파일)
+    startup_prewarm: bool = True
+    db_prewarm_connections: int | None = None  # 미리 열어둘 커넥션 수 (None이면 db_pool_size)
+    startup_prewarm_timeout: float = 10.0  # 준비 작업 최대 시간 (초, 초과하면 건너뛰고 시작)
+
+    # 읽기 전용 복제본 (쉼표 구분, 비어 있으면 primary 사용)
+    database_read_urls: str = ""
+    read_replica_cooldown: float = 30.0  # 연결 실패한 복제본을 제외할 시간 (초)
+
+    # 분류 체계(과목/주요항목/세부항목) 캐시
+    taxonomy_cache_ttl: float = 300.0  # 변경 확인과 무관하게 다시 읽는 주기 (초)
+    taxonomy_cache_check_interval: float = 5.0  # 다른 프로세스의 변경(행 수/max(updated_at))을 확인하는 주기 (초)
+
+    # YouTube 자막 캐시 (LRU + youtube_transcripts 테이블)
+    transcript_cache_ttl: float = 30 * 24 * 3600.0  # 자막 보관 시간 (초, 기본 30일)
+    transcript_negative_cache_ttl: float = 3600.0  # 자막 없음 결과 보관 시간 (초, 자막이 나중에 추가될 수 있음)
+    transcript_cache_memory_size: int = 128  # 프로세스 로컬 LRU 항목 수
+    transcript_purge_interval: float = 3600.0  # 만료된 자막 행 삭제 주기 (초, 작업 워커의 주기적 복구와 함께 실행)
+    transcript_fetch_workers: int = 4  # 자막 추출 스레드 수 (동시 추출 수 제한)
+    transcript_fetch_timeout: float = 15.0  # 자막 추출 1회 제한 시간 (초, 스레드 대기 포함)
+    transcript_fetch_max_retries: int = 2  # 일시적 오류 재시도 횟수
+    transcript_fetch_backoff: float = 0.5  # 재시도 기본 대기 시간 (초, 시도마다 2배)
+
+    # HTTP 캐싱 (카탈로그 GET 응답의 Cache-Control max-age, 초)
+    catalog_cache_max_age: int = 60
+
+    # 응답 압축 (Accept-Encoding 협상, 이 크기 미만 응답은 압축하지 않음, bytes)
+    compression_minimum_size: int = 1024
+    compression_gzip_level: int = 6  # 1(빠름) ~ 9(작음)
+    compression_brotli_quality: int = 4  # 0 ~ 11 (brotli 설치 시)
+
+    # Prometheus 메트릭 (/metrics)
+    metrics_enabled: bool = True
+    event_loop_lag_interval: float = 0.5  # 이벤트 루프 지연 측정 주기 (초)
+
+    # 요청당 SQL 쿼리 추적 (Server-Timing 헤더, N+1 감지)
+    server_timing_header: bool | None = None  # 응답에 DB 쿼리 수/시간 Server-Timing 헤더 추가 (None이면 development에서만, 내부 정보 노출 방지)
+    query_budget_max_queries: int = 30  # 요청당 최대 쿼리 수
+    query_budget_repeat_limit: int = 5  # 같은 형태의 쿼리 최대 반복 횟수
+    query_budget_action: str | None = None  # off | log | raise (None이면 development에서 log, 그 외 off)
+
+    # 준비 상태 확인 (/ready, 로드밸런서가 트래픽을 뺄 기준)
+    readiness_db_timeout: float = 1.0  # DB 왕복 확인 제한 시간 (초, 커넥션 대기 포함)
+    readiness_pool_saturation_threshold: float = 0.9  # 커넥션 풀 사용률이 이 값 이상이면 503
+
     # AI Provider (Gemini)
     gemini_api_key: str = ""
+    gemini_max_concurrent: int = 2  # 동시 Gemini API 요청 수 (GEMINI_MAX_CONCURRENT)
+    gemini_limiter_backend: str = "local"  # local: 프로세스별 제한 | lease: DB 임대로 전체 프로세스 합계 제한
+    gemini_lease_ttl: float = 60.0  # 임대 만료 시간 (초, 종료된 프로세스의 슬롯 회수 기준)
+    gemini_lease_poll_interval: float = 0.2  # 슬롯이 없을 때 재시도 간격 (초)
     
     # Gemini API 토큰 절약 설정
     auto_validate_quiz: bool = False  # 자동 검증 활성화 여부 (기본값: 비활성화)
     auto_validate_sample_rate: float = 0.1  # 자동 검증 샘플링 비율 (0.0-1.0, 기본값: 10%)
 
+    # 요청 데드라인 (초, X-Request-Timeout 헤더로 재정의 가능)
+    request_timeout_default: float = 60.0  # AI 호출 라우트 기본값
+    request_timeout_study: float = 120.0  # 학습 모드 일괄 생성 기본값
+    request_timeout_max: float = 300.0  # 헤더로 요청 가능한 최대값
+
+    # 비동기 작업 (Prefer: respond-async 요청, 202 + GET /jobs/{id})
+    job_worker_concurrency: int = 2  # 동시에 실행할 작업 수 (워커 태스크 수)
+    job_timeout: float = 600.0  # 작업 하나의 처리 시간 제한 (초, 요청 데드라인 대신 적용)
+    job_max_attempts: int = 2  # 재시작으로 중단된 작업을 다시 실행할 최대 시도 횟수
+    job_lease_ttl: float = 60.0  # 실행 중 작업의 임대 시간 (초, 1/3 주기로 연장, 만료되면 다른 프로세스가 복구)
+
     # Security
     secret_key: str = ""
     algorithm: str = "HS256"
@@ -31,9 +100,25 @@ class Settings(BaseSettings):
     # Environment
     environment: str = "development"
 
+    @property
+    def query_budget_mode(self) -> str:
+        if self.query_budget_action is not None:
+            return self.query_budget_action
+        return "log" if self.environment == "development" else "off"
+
+    @property
+    def server_timing_enabled(self) -> bool:
+        if self.server_timing_header is not None:
+            return self.server_timing_header
+        return self.environment == "development"
+
     @property
     def allowed_origins_list(self) -> list[str]:
         return [origin.strip() for origin in self.allowed_origins.split(",")]
 
+    @property
+    def database_read_urls_list(self) -> list[str]:
+        return [url.strip() for url in self.database_read_urls.split(",") if url.strip()]
+
 
 settings = Settings()
@@ -0,0 +1,104 @@
+"""계측 커넥션 풀
+
+커넥션 획득 대기 시간, 타임아웃, 연결 실패를 기록하여
+지연 시간 급증이 풀 고갈 때문인지 확인할 수 있게 합니다.
+"""
+import time
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.metrics import Counter, Gauge, Histogram, MetricFamily
+
+
+class PoolMetrics:
+    """커넥션 풀 메트릭"""
+
+    def __init__(self) -> None:
+        self.checkouts = Counter()
+        self.timeouts = Counter()
+        self.connect_errors = Counter()
+        self.wait_time = Histogram()
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """획득 대기 시간/오류를 기록하는 AsyncAdaptedQueuePool"""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.metrics.timeouts.inc()
+            raise
+        except Exception:
+            self.metrics.connect_errors.inc()
+            raise
+        finally:
+            self.metrics.wait_time.observe(time.perf_counter() - start)
+        self.metrics.checkouts.inc()
+        return connection
+
+    def recreate(self) -> "InstrumentedAsyncPool":
+        # dispose 등으로 풀이 재생성되어도 누적 메트릭 유지
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def get_pool_status(pool: Any) -> dict:
+    """풀 상태와 메트릭 스냅샷"""
+    status: dict = {
+        "pool_class": pool.__class__.__name__,
+        "pool_size": None,
+        "checked_out": None,
+        "checked_in": None,
+        "overflow": None,
+        "max_overflow": None,
+    }
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        status.update(
+            pool_size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=max(0, pool.overflow()),
+            max_overflow=pool._max_overflow,
+        )
+
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        status.update(
+            checkouts=metrics.checkouts.value,
+            timeouts=metrics.timeouts.value,
+            connect_errors=metrics.connect_errors.value,
+            wait_time=metrics.wait_time.snapshot(),
+        )
+    return status
+
+
+def pool_metric_families(pool: Any) -> list[MetricFamily]:
+    """/metrics 수집 함수용 풀 상태 메트릭 (스크레이프 시점의 값)"""
+    status = get_pool_status(pool)
+    families = []
+    for key in ("pool_size", "checked_out", "checked_in", "overflow"):
+        if status[key] is not None:
+            gauge = Gauge()
+            gauge.set(status[key])
+            families.append(MetricFamily(f"db_pool_{key}", f"커넥션 풀 {key}", "gauge").attach(gauge))
+
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        families.extend([
+            MetricFamily("db_pool_checkouts_total", "커넥션 획득 수", "counter").attach(metrics.checkouts),
+            MetricFamily("db_pool_timeouts_total", "커넥션 획득 타임아웃 수", "counter").attach(metrics.timeouts),
+            MetricFamily(
+                "db_pool_connect_errors_total", "커넥션 연결 실패 수", "counter"
+            ).attach(metrics.connect_errors),
+            MetricFamily("db_pool_wait_seconds", "커넥션 획득 대기 시간", "histogram").attach(metrics.wait_time),
+        ])
+    return families
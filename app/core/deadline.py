@@ -0,0 +1,66 @@
+"""요청 단위 데드라인 관리
+
+요청 시작 시 남은 처리 예산을 contextvar에 기록하고, 서비스/AI 레이어는
+재시도 및 백오프 전에 남은 시간을 확인하여 클라이언트 타임아웃 이후의 작업을 중단합니다.
+"""
+import time
+from contextvars import ContextVar
+
+from fastapi import Request
+
+from app.core.config import settings
+from app.exceptions import DeadlineExceededError
+
+# 클라이언트가 허용하는 처리 시간(초)을 전달하는 헤더
+DEADLINE_HEADER = "X-Request-Timeout"
+
+_deadline: ContextVar[float | None] = ContextVar("request_deadline", default=None)
+
+
+def set_deadline(timeout_seconds: float | None) -> None:
+    """현재 컨텍스트의 데드라인 설정 (None이면 제한 없음)"""
+    if timeout_seconds is None:
+        _deadline.set(None)
+        return
+    _deadline.set(time.monotonic() + max(0.0, timeout_seconds))
+
+
+def get_remaining() -> float | None:
+    """남은 시간(초) 반환 (데드라인이 없으면 None)"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def is_expired() -> bool:
+    """데드라인 초과 여부"""
+    remaining = get_remaining()
+    return remaining is not None and remaining <= 0
+
+
+def ensure_time_left(operation: str, required_seconds: float = 0.0) -> None:
+    """남은 시간이 required_seconds 이하이면 DeadlineExceededError 발생"""
+    remaining = get_remaining()
+    if remaining is not None and remaining <= required_seconds:
+        raise DeadlineExceededError(f"요청 처리 시간이 초과되었습니다: {operation}")
+
+
+def request_deadline(default_seconds: float):
+    """라우트별 기본 데드라인을 설정하는 의존성 생성
+
+    X-Request-Timeout 헤더(초)가 있으면 우선 사용하되 request_timeout_max로 제한합니다.
+    """
+    async def dependency(request: Request) -> None:
+        timeout = default_seconds
+        header_value = request.headers.get(DEADLINE_HEADER)
+        if header_value:
+            try:
+                requested = float(header_value)
+                if requested > 0:
+                    timeout = requested
+            except ValueError:
+                pass
+        set_deadline(min(timeout, settings.request_timeout_max))
+
+    return dependency
@@ -0,0 +1,94 @@
+"""검증자(ETag/Last-Modified) 기반 HTTP 캐싱
+
+카탈로그 응답은 관리자가 수정하기 전까지 모든 클라이언트에 같은 내용을 돌려줍니다.
+응답 본문 대신 행 버전(개수, 최대 updated_at 등)으로 강한 ETag를 만들고,
+If-None-Match/If-Modified-Since가 일치하면 본문 조회·직렬화 없이 304를 반환합니다.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response, status
+
+from app.core.config import settings
+from app.core.metrics import record_cache
+
+# 응답 형식이 바뀌면 올려서 기존 ETag를 무효화
+REPRESENTATION_VERSION = "1"
+
+# CDN/리버스 프록시가 따를 수 있는 Cache-Control
+# 카탈로그: 짧게 캐시하고 만료 후 ETag로 재검증
+CATALOG_CACHE_CONTROL = f"public, max-age={settings.catalog_cache_max_age}, must-revalidate"
+# 관리 화면용: 항상 재검증 (변경이 바로 보여야 함)
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+
+
+def compute_etag(*version_parts: object) -> str:
+    """행 버전으로 강한 ETag 생성 (응답 본문 직렬화 없이)"""
+    raw = "|".join(str(part) for part in (REPRESENTATION_VERSION, *version_parts))
+    return f'"{hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]}"'
+
+
+def _to_utc(value: datetime) -> datetime:
+    """타임존 없는 값(SQLite)은 UTC로 간주, 초 단위로 절삭 (HTTP-date 정밀도)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 비교 (RFC 9110: 약한 비교)"""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def is_not_modified(request: Request, etag: str, last_modified: datetime | None = None) -> bool:
+    """조건부 요청이 현재 버전과 일치하는지 확인 (If-None-Match 우선, 조건부 요청만 적중률에 기록)
+
+    If-Modified-Since는 last_modified를 넘긴 단일 리소스에만 적용합니다.
+    목록은 행 삭제가 max(updated_at)을 바꾸지 않으므로 last_modified 없이 호출해 ETag로만 판정합니다.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        matched = _etag_matches(if_none_match, etag)
+        record_cache("http_conditional", hit=matched)
+        return matched
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            since = None
+        if since is not None and since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        matched = since is not None and _to_utc(last_modified) <= since
+        record_cache("http_conditional", hit=matched)
+        return matched
+    return False
+
+
+def set_cache_headers(
+    response: Response,
+    etag: str,
+    last_modified: datetime | None = None,
+    cache_control: str = CATALOG_CACHE_CONTROL,
+) -> None:
+    """응답에 ETag/Last-Modified/Cache-Control 설정"""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+    if last_modified is not None:
+        response.headers["Last-Modified"] = format_datetime(_to_utc(last_modified), usegmt=True)
+
+
+def not_modified_response(
+    etag: str,
+    last_modified: datetime | None = None,
+    cache_control: str = CATALOG_CACHE_CONTROL,
+) -> Response:
+    """본문 없는 304 응답"""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_cache_headers(response, etag, last_modified, cache_control)
+    return response
@@ -0,0 +1,234 @@
+"""요청/DB/이벤트 루프 계측
+
+- RequestInstrumentationMiddleware: 라우트 템플릿(/quiz/{quiz_id}) 기준 요청 수/처리 시간/진행 중 요청 수 기록
+  (실제 경로를 레이블로 쓰면 시계열 수가 무한히 늘어나므로 매칭된 라우트만 사용),
+  응답에 Server-Timing 헤더(DB 쿼리 수/시간) 추가, 요청당 쿼리 예산 검사
+- instrument_engine: 커서 실행 이벤트로 쿼리 수/시간을 기록하고 현재 요청 통계에 누적
+- 쿼리 예산: 요청당 쿼리 수가 budget을 넘거나 같은 형태의 쿼리가 repeat_limit번을 넘게 반복되면
+  (N+1 패턴) log 모드는 요청 종료 시 경고 로그, raise 모드는 해당 쿼리 실행 전에 QueryBudgetExceededError
+- monitor_event_loop_lag: 주기적으로 잠들었다 깨어난 시각의 지연을 측정
+  (동기 호출이 루프를 막으면 지연이 커짐)
+"""
+import asyncio
+import logging
+import re
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core import metrics
+from app.exceptions import QueryBudgetExceededError
+
+logger = logging.getLogger(__name__)
+
+# 라우트에 매칭되지 않은 요청(404 등)의 route 레이블
+UNMATCHED_ROUTE = "<unmatched>"
+
+# 커서 실행 시작 시각을 쌓아두는 connection.info 키
+_QUERY_START_KEY = "query_start_times"
+
+
+# 쿼리 예산 검사 모드
+QUERY_BUDGET_OFF = "off"
+QUERY_BUDGET_LOG = "log"
+QUERY_BUDGET_RAISE = "raise"
+
+# IN (?, ?, ?) 처럼 개수만 다른 바인드 파라미터 목록
+_PLACEHOLDER_LIST = re.compile(r"\((?:\s*(?:\?|\$\d+|%\(\w+\)s|:\w+)\s*,)+\s*(?:\?|\$\d+|%\(\w+\)s|:\w+)\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass(frozen=True)
+class QueryBudget:
+    """요청당 쿼리 예산"""
+    max_queries: int
+    repeat_limit: int
+    mode: str = QUERY_BUDGET_LOG
+
+
+@dataclass
+class RequestStats:
+    """요청 하나에서 실행한 DB 쿼리 통계"""
+    db_queries: int = 0
+    db_time: float = 0.0
+    budget: QueryBudget | None = None
+    # 쿼리 형태별 실행 횟수 (예산 검사 시에만 수집)
+    statement_counts: dict[str, int] | None = None
+
+    def __post_init__(self) -> None:
+        if self.budget is not None and self.statement_counts is None:
+            self.statement_counts = {}
+
+    def most_repeated(self) -> tuple[str | None, int]:
+        """가장 많이 반복된 쿼리 형태와 횟수"""
+        if not self.statement_counts:
+            return None, 0
+        return max(self.statement_counts.items(), key=lambda item: item[1])
+
+    def budget_violation(self) -> str | None:
+        """예산 초과 내용 (초과하지 않았으면 None)"""
+        if self.budget is None:
+            return None
+        if self.db_queries > self.budget.max_queries:
+            return f"쿼리 {self.db_queries}개 실행 (예산 {self.budget.max_queries}개)"
+        statement, count = self.most_repeated()
+        if count > self.budget.repeat_limit:
+            return f"같은 형태의 쿼리 {count}회 반복 (허용 {self.budget.repeat_limit}회): {statement}"
+        return None
+
+
+_request_stats: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+def get_request_stats() -> RequestStats | None:
+    """현재 요청의 통계 (요청 밖이면 None)"""
+    return _request_stats.get()
+
+
+def statement_shape(statement: str) -> str:
+    """반복 감지용 쿼리 형태 (공백 정규화, IN 목록 길이 무시)"""
+    return _PLACEHOLDER_LIST.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+
+
+def format_server_timing(stats: RequestStats, elapsed: float) -> str:
+    """Server-Timing 헤더 값 (밀리초)"""
+    return (
+        f'db;dur={stats.db_time * 1000:.2f};desc="{stats.db_queries} queries", '
+        f"app;dur={elapsed * 1000:.2f}"
+    )
+
+
+def _route_label(scope: Scope) -> str:
+    """매칭된 라우트의 전체 경로 템플릿 (예: /api/v1/quiz/{quiz_id})"""
+    route = scope.get("route")
+    path_format = getattr(route, "path_format", None)
+    if path_format is None:
+        return UNMATCHED_ROUTE
+    # include_router(prefix=...)의 라우트는 prefix 없는 템플릿만 가질 수 있으므로,
+    # 실제 경로에서 템플릿을 채운 부분을 제외한 앞부분을 prefix로 복원
+    path = scope["path"]
+    try:
+        rendered = path_format.format(**scope.get("path_params", {}))
+    except (KeyError, IndexError, ValueError):
+        return path_format
+    if rendered != path and path.endswith(rendered):
+        return path[: -len(rendered)] + path_format
+    return path_format
+
+
+class RequestInstrumentationMiddleware:
+    """요청별 쿼리 통계 수집과 HTTP 메트릭/Server-Timing/쿼리 예산 검사 ASGI 미들웨어"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        record_metrics: bool = True,
+        server_timing: bool = True,
+        query_budget: QueryBudget | None = None,
+    ) -> None:
+        self.app = app
+        self.record_metrics = record_metrics
+        self.server_timing = server_timing
+        if query_budget is not None and query_budget.mode == QUERY_BUDGET_OFF:
+            query_budget = None
+        self.query_budget = query_budget
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats(budget=self.query_budget)
+        token = _request_stats.set(stats)
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", format_server_timing(stats, time.perf_counter() - start))
+            await send(message)
+
+        if self.record_metrics:
+            metrics.HTTP_REQUESTS_IN_PROGRESS.labels().inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            _request_stats.reset(token)
+            route = _route_label(scope)
+            if self.record_metrics:
+                method = scope["method"]
+                metrics.HTTP_REQUESTS_IN_PROGRESS.labels().dec()
+                metrics.HTTP_REQUESTS.labels(method, route, str(status_code)).inc()
+                metrics.HTTP_REQUEST_DURATION.labels(method, route).observe(elapsed)
+                metrics.DB_QUERIES_PER_REQUEST.labels(route).observe(stats.db_queries)
+                metrics.DB_TIME_PER_REQUEST.labels(route).observe(stats.db_time)
+            if self.query_budget is not None and self.query_budget.mode == QUERY_BUDGET_LOG:
+                violation = stats.budget_violation()
+                if violation:
+                    logger.warning(f"쿼리 예산 초과: {scope['method']} {route} - {violation}")
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.db_queries += 1
+        if stats.statement_counts is not None:
+            shape = statement_shape(statement)
+            stats.statement_counts[shape] = stats.statement_counts.get(shape, 0) + 1
+            if stats.budget.mode == QUERY_BUDGET_RAISE:
+                violation = stats.budget_violation()
+                if violation:
+                    raise QueryBudgetExceededError(violation)
+    conn.info.setdefault(_QUERY_START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    start_times = conn.info.get(_QUERY_START_KEY)
+    if not start_times:
+        return
+    elapsed = time.perf_counter() - start_times.pop()
+    metrics.DB_QUERIES.labels().inc()
+    metrics.DB_QUERY_DURATION.labels().observe(elapsed)
+
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.db_time += elapsed
+
+
+def _handle_error(exception_context) -> None:
+    # 실패한 쿼리는 after_cursor_execute가 호출되지 않으므로 시작 시각만 정리
+    connection = exception_context.connection
+    if connection is not None:
+        start_times = connection.info.get(_QUERY_START_KEY)
+        if start_times:
+            start_times.pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """동기 엔진(AsyncEngine.sync_engine)에 쿼리 계측 이벤트 등록 (중복 등록 무시)"""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+async def monitor_event_loop_lag(interval: float) -> None:
+    """interval마다 깨어나 예정 시각 대비 지연을 기록 (취소될 때까지 실행)"""
+    loop = asyncio.get_running_loop()
+    while True:
+        scheduled = loop.time() + interval
+        await asyncio.sleep(interval)
+        lag = max(0.0, loop.time() - scheduled)
+        metrics.EVENT_LOOP_LAG.labels().observe(lag)
+        metrics.EVENT_LOOP_LAG_LAST.labels().set(lag)
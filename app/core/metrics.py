@@ -0,0 +1,254 @@
+"""프로세스 내 메트릭 기본 타입
+
+외부 의존성 없이 카운터/게이지/누적 버킷 히스토그램을 제공하고,
+레이블별 메트릭 묶음을 Prometheus 텍스트 노출 형식(/metrics)으로 렌더링합니다.
+"""
+import bisect
+import math
+import threading
+from typing import Callable, Iterable, Sequence
+
+# 대기/지연 시간(초) 측정용 기본 버킷
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+
+class Counter:
+    """단조 증가 카운터"""
+
+    def __init__(self) -> None:
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+
+class Histogram:
+    """누적 버킷 히스토그램 (Prometheus 방식: 각 버킷은 상한 이하 관측치 수)"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    def snapshot(self) -> dict:
+        """누적 버킷/합계/개수 스냅샷"""
+        with self._lock:
+            counts = list(self._counts)
+            total_sum = self._sum
+            total_count = self._count
+
+        cumulative: dict[str, int] = {}
+        running = 0
+        for bound, count in zip(self.buckets, counts):
+            running += count
+            cumulative[str(bound)] = running
+        cumulative["+Inf"] = total_count
+        return {"buckets": cumulative, "sum": total_sum, "count": total_count}
+
+
+class Gauge:
+    """현재 값 게이지"""
+
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        self._value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value -= amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+
+def _format_value(value: float) -> str:
+    """텍스트 노출 형식의 숫자 표기"""
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape_label_value(value)}"' for key, value in labels.items())
+    return f"{{{pairs}}}"
+
+
+class MetricFamily:
+    """같은 이름의 레이블별 메트릭 묶음 (counter | gauge | histogram)"""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        metric_type: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.metric_type = metric_type
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._children: dict[tuple[str, ...], Counter | Gauge | Histogram] = {}
+        self._lock = threading.Lock()
+
+    def _create_child(self) -> Counter | Gauge | Histogram:
+        if self.metric_type == "counter":
+            return Counter()
+        if self.metric_type == "gauge":
+            return Gauge()
+        return Histogram(self.buckets)
+
+    def labels(self, *values: str) -> Counter | Gauge | Histogram:
+        """레이블 값에 해당하는 자식 메트릭 (처음 요청 시 생성)"""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name}: 레이블 {self.labelnames}에 맞지 않는 값 {values}")
+            with self._lock:
+                child = self._children.setdefault(values, self._create_child())
+        return child
+
+    def attach(self, metric: Counter | Gauge | Histogram, *values: str) -> "MetricFamily":
+        """이미 있는 메트릭 객체를 자식으로 연결 (수집 함수에서 기존 계측값 노출용)"""
+        self._children[values] = metric
+        return self
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+        for values, child in sorted(self._children.items()):
+            labels = dict(zip(self.labelnames, values))
+            if isinstance(child, Histogram):
+                snapshot = child.snapshot()
+                for bound, count in snapshot["buckets"].items():
+                    lines.append(
+                        f"{self.name}_bucket{_format_labels({**labels, 'le': bound})} {count}"
+                    )
+                lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(snapshot['sum'])}")
+                lines.append(f"{self.name}_count{_format_labels(labels)} {snapshot['count']}")
+            else:
+                lines.append(f"{self.name}{_format_labels(labels)} {_format_value(child.value)}")
+        return lines
+
+
+class MetricsRegistry:
+    """메트릭 묶음과 수집 함수 등록소"""
+
+    def __init__(self) -> None:
+        self._families: dict[str, MetricFamily] = {}
+        self._collectors: list[Callable[[], Iterable[MetricFamily]]] = []
+
+    def _register(self, family: MetricFamily) -> MetricFamily:
+        if family.name in self._families:
+            raise ValueError(f"이미 등록된 메트릭입니다: {family.name}")
+        self._families[family.name] = family
+        return family
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> MetricFamily:
+        return self._register(MetricFamily(name, documentation, "counter", labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> MetricFamily:
+        return self._register(MetricFamily(name, documentation, "gauge", labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> MetricFamily:
+        return self._register(MetricFamily(name, documentation, "histogram", labelnames, buckets))
+
+    def register_collector(self, collector: Callable[[], Iterable[MetricFamily]]) -> None:
+        """스크레이프 시점에 값을 읽어 만드는 메트릭 (예: 커넥션 풀 상태)"""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 형식 (version 0.0.4)"""
+        lines: list[str] = []
+        for family in self._families.values():
+            lines.extend(family.render())
+        for collector in self._collectors:
+            for family in collector():
+                lines.extend(family.render())
+        return "\n".join(lines) + "\n"
+
+
+# 요청당 DB 쿼리 수 버킷
+QUERY_COUNT_BUCKETS: tuple[float, ...] = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+
+registry = MetricsRegistry()
+
+HTTP_REQUESTS = registry.counter(
+    "http_requests_total", "라우트별 HTTP 요청 수", ("method", "route", "status")
+)
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds", "라우트별 HTTP 요청 처리 시간", ("method", "route")
+)
+HTTP_REQUESTS_IN_PROGRESS = registry.gauge(
+    "http_requests_in_progress", "처리 중인 HTTP 요청 수"
+)
+DB_QUERIES = registry.counter("db_queries_total", "실행한 DB 쿼리 수")
+DB_QUERY_DURATION = registry.histogram("db_query_duration_seconds", "DB 쿼리 실행 시간")
+DB_QUERIES_PER_REQUEST = registry.histogram(
+    "db_queries_per_request", "라우트별 요청당 DB 쿼리 수", ("route",), buckets=QUERY_COUNT_BUCKETS
+)
+DB_TIME_PER_REQUEST = registry.histogram(
+    "db_time_per_request_seconds", "라우트별 요청당 DB 쿼리 시간 합계", ("route",)
+)
+GEMINI_REQUESTS = registry.counter(
+    "gemini_requests_total", "Gemini API 호출 수", ("operation", "outcome")
+)
+GEMINI_REQUEST_DURATION = registry.histogram(
+    "gemini_request_duration_seconds", "Gemini API 호출 시간", ("operation",)
+)
+CACHE_REQUESTS = registry.counter(
+    "cache_requests_total", "캐시 조회 수 (result: hit | miss)", ("cache", "result")
+)
+EVENT_LOOP_LAG = registry.histogram(
+    "event_loop_lag_seconds", "이벤트 루프 지연 (예정보다 늦게 깨어난 시간)"
+)
+EVENT_LOOP_LAG_LAST = registry.gauge(
+    "event_loop_lag_last_seconds", "마지막으로 측정한 이벤트 루프 지연"
+)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """캐시 적중/미적중 기록"""
+    CACHE_REQUESTS.labels(cache, "hit" if hit else "miss").inc()
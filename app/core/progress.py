@@ -0,0 +1,30 @@
+"""작업 진행률 보고
+
+비동기 작업 워커가 실행 중인 작업의 진행률 기록 함수를 contextvar에 설정하고,
+서비스 레이어는 요청/작업 구분 없이 report_progress를 호출합니다 (작업 밖에서는 아무 일도 하지 않음).
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Iterator
+
+ProgressCallback = Callable[[int], Awaitable[None]]
+
+_reporter: ContextVar[ProgressCallback | None] = ContextVar("job_progress_reporter", default=None)
+
+
+@contextmanager
+def progress_reporter(callback: ProgressCallback) -> Iterator[None]:
+    """블록 안에서 report_progress가 callback(진행률 %)을 호출하도록 설정"""
+    token = _reporter.set(callback)
+    try:
+        yield
+    finally:
+        _reporter.reset(token)
+
+
+async def report_progress(done: int, total: int) -> None:
+    """total 중 done개 완료 (진행률은 0-99%로 기록, 100%는 작업 완료 시 설정)"""
+    callback = _reporter.get()
+    if callback is None or total <= 0:
+        return
+    await callback(min(99, done * 100 // total))
@@ -0,0 +1,64 @@
+"""빠른 JSON 응답 렌더링
+
+한글은 \\u 이스케이프 없이 UTF-8로 내보내 페이로드 크기를 줄입니다.
+- model_json_response: 응답 스키마 객체를 pydantic(Rust) 직렬화로 한 번에 bytes로 변환해
+  FastAPI의 응답 재검증 및 dict 변환(jsonable_encoder) 단계를 건너뜀
+- FastJSONResponse: dict 응답(예외 핸들러 등)용, orjson이 설치되어 있으면 사용
+  (선택 의존성: pip install ".[speedups]"), 없으면 표준 json으로 대체
+  JSON 기본 타입이 아닌 값은 두 경로 모두 _default로 같은 문자열을 만듦
+  (예: 검증 오류 ctx의 예외 객체)
+"""
+import json
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any
+
+from fastapi import Response, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """JSON 기본 타입이 아닌 값 변환 (orjson이 직접 처리하는 타입은 같은 결과가 나오도록 맞춤)"""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+def json_dumps(content: Any) -> bytes:
+    """dict/list를 UTF-8 JSON bytes로 직렬화 (orjson 우선, 설치 여부와 관계없이 같은 결과)"""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=_default,
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson 기반 JSONResponse (미설치 시 표준 json, 공백 없는 UTF-8)"""
+
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
+
+
+def model_json_response(
+    model: BaseModel,
+    status_code: int = status.HTTP_200_OK,
+) -> Response:
+    """응답 스키마 객체를 바로 JSON 응답으로 변환 (라우터의 response_model은 문서화용으로 유지)"""
+    # model_dump_json()은 str을 만든 뒤 다시 인코딩하므로 serializer로 bytes를 바로 생성
+    return Response(
+        content=model.__pydantic_serializer__.to_json(model),
+        status_code=status_code,
+        media_type="application/json",
+    )
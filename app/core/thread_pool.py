@@ -0,0 +1,65 @@
+"""동기(블로킹) 호출 전용 스레드 풀
+
+동기 라이브러리 호출을 이벤트 루프 밖에서 실행하되, 기본 executor를 다른 작업과 공유하지
+않도록 용도별로 크기를 제한합니다.
+- 동시 실행 수는 max_workers로 제한하고, 빈 스레드가 없으면 이벤트 루프에서 대기
+  (executor 내부 큐에 작업이 쌓이지 않음)
+- timeout이 지나거나 호출한 태스크가 취소되면 기다리지 않고 반환
+  (아직 시작하지 않은 호출은 취소, 이미 실행 중인 스레드는 끝날 때까지 슬롯을 점유)
+"""
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class BoundedThreadPool:
+    """동시 실행 수가 제한된 스레드 풀"""
+
+    def __init__(self, max_workers: int, thread_name_prefix: str) -> None:
+        self.max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._executor: ThreadPoolExecutor | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _executor_for_loop(self, loop: asyncio.AbstractEventLoop) -> tuple[ThreadPoolExecutor, asyncio.Semaphore]:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix=self._thread_name_prefix)
+        if self._slots is None or self._loop is not loop:
+            # 세마포어는 이벤트 루프에 묶이므로 루프가 바뀌면 새로 만듦
+            self._slots = asyncio.Semaphore(self.max_workers)
+            self._loop = loop
+        return self._executor, self._slots
+
+    async def run(self, fn: Callable[..., T], *args: Any, timeout: float | None = None) -> T:
+        """fn(*args)를 스레드에서 실행 (슬롯 대기 포함 timeout 초 초과 시 asyncio.TimeoutError)"""
+        loop = asyncio.get_running_loop()
+        executor, slots = self._executor_for_loop(loop)
+
+        def release_slot(_: Future) -> None:
+            try:
+                loop.call_soon_threadsafe(slots.release)
+            except RuntimeError:
+                # 이벤트 루프가 이미 종료됨 (서버 종료 중)
+                pass
+
+        async with asyncio.timeout(timeout):
+            await slots.acquire()
+            try:
+                future = executor.submit(fn, *args)
+            except BaseException:
+                slots.release()
+                raise
+            # 스레드가 실제로 끝나야 슬롯 반납 (대기를 포기해도 실행 중인 스레드 수는 max_workers 이내)
+            future.add_done_callback(release_slot)
+            return await asyncio.wrap_future(future)
+
+    def shutdown(self) -> None:
+        """시작하지 않은 호출은 취소하고 스레드 종료를 기다리지 않음"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._slots = None
+        self._loop = None
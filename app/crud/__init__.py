@@ -1,7 +1,10 @@
 from app.crud.exam import (
     create_exam_record,
+    create_exam_records_bulk,
     get_exam_records_by_session,
     get_exam_record_by_session_and_quiz,
+    submit_exam_answer,
+    submit_exam_answers_bulk,
     update_exam_record_answer,
 )
 from app.crud.main_topic import (
@@ -13,6 +16,7 @@ from app.crud.quiz import (
     create_quiz,
     get_quiz_by_hash,
     get_quiz_by_id,
+    get_quizzes_by_ids,
     get_quiz_count_by_sub_topic_id,
     get_latest_quiz_by_sub_topic_id,
     get_quizzes_by_sub_topic_id,
@@ -23,6 +27,7 @@ from app.crud.quiz_validation import (
     get_latest_validation,
     get_latest_validation_statuses,
     get_quizzes_needing_validation,
+    get_quizzes_needing_validation_page,
     get_validation_status_counts,
 )
 from app.crud.subject import (
@@ -31,14 +36,17 @@ from app.crud.subject import (
     get_subject_by_id,
 )
 from app.crud.sub_topic import (
+    get_core_content_items,
     get_sub_topic_by_id,
     get_sub_topic_with_core_content,
     get_sub_topics_by_main_topic_id,
+    stream_core_content_items,
     update_sub_topic_core_content,
 )
 
 __all__ = [
     "get_quiz_by_id",
+    "get_quizzes_by_ids",
     "get_quiz_by_hash",
     "create_quiz",
     "get_random_quizzes",
@@ -54,14 +62,20 @@ __all__ = [
     "get_sub_topic_by_id",
     "get_sub_topic_with_core_content",
     "get_sub_topics_by_main_topic_id",
+    "get_core_content_items",
+    "stream_core_content_items",
     "update_sub_topic_core_content",
     "create_exam_record",
+    "create_exam_records_bulk",
     "get_exam_records_by_session",
     "get_exam_record_by_session_and_quiz",
+    "submit_exam_answer",
+    "submit_exam_answers_bulk",
     "update_exam_record_answer",
     "create_quiz_validation",
     "get_latest_validation",
     "get_latest_validation_statuses",
     "get_quizzes_needing_validation",
+    "get_quizzes_needing_validation_page",
     "get_validation_status_counts",
 ]
@@ -0,0 +1,108 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.concurrency_lease import ConcurrencyLease
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+async def ensure_slots(
+    session: AsyncSession,
+    name: str,
+    count: int,
+) -> None:
+    """name의 슬롯 행 0..count-1 생성 (이미 있으면 유지, 동시에 만든 경우 무시)"""
+    result = await session.execute(select(ConcurrencyLease.slot).where(ConcurrencyLease.name == name))
+    existing = set(result.scalars().all())
+    missing = [slot for slot in range(count) if slot not in existing]
+    if not missing:
+        return
+    session.add_all([ConcurrencyLease(name=name, slot=slot) for slot in missing])
+    try:
+        await session.commit()
+    except IntegrityError:
+        # 다른 프로세스가 먼저 생성
+        await session.rollback()
+
+
+async def try_acquire_slot(
+    session: AsyncSession,
+    name: str,
+    max_slots: int,
+    holder: str,
+    ttl_seconds: float,
+) -> int | None:
+    """비어 있거나 만료된 슬롯 하나를 임대 (없으면 None)
+
+    PostgreSQL에서는 FOR UPDATE SKIP LOCKED로 다른 프로세스가 고르는 중인 행을 건너뛰고,
+    UPDATE 조건을 다시 검사해 같은 슬롯을 두 번 임대하지 않습니다.
+    """
+    now = _now()
+    available = or_(ConcurrencyLease.holder.is_(None), ConcurrencyLease.expires_at < now)
+    stmt = (
+        select(ConcurrencyLease.slot)
+        .where(ConcurrencyLease.name == name, ConcurrencyLease.slot < max_slots, available)
+        .order_by(ConcurrencyLease.slot)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+    slot = (await session.execute(stmt)).scalar_one_or_none()
+    if slot is None:
+        await session.rollback()
+        return None
+
+    result = await session.execute(
+        update(ConcurrencyLease)
+        .where(ConcurrencyLease.name == name, ConcurrencyLease.slot == slot, available)
+        .values(holder=holder, expires_at=now + timedelta(seconds=ttl_seconds))
+    )
+    if result.rowcount != 1:
+        await session.rollback()
+        return None
+    await session.commit()
+    return slot
+
+
+async def renew_lease(
+    session: AsyncSession,
+    name: str,
+    slot: int,
+    holder: str,
+    ttl_seconds: float,
+) -> bool:
+    """보유 중인 임대 연장 (만료되어 다른 프로세스가 회수했으면 False)"""
+    result = await session.execute(
+        update(ConcurrencyLease)
+        .where(
+            ConcurrencyLease.name == name,
+            ConcurrencyLease.slot == slot,
+            ConcurrencyLease.holder == holder,
+        )
+        .values(expires_at=_now() + timedelta(seconds=ttl_seconds))
+    )
+    await session.commit()
+    return result.rowcount == 1
+
+
+async def release_lease(
+    session: AsyncSession,
+    name: str,
+    slot: int,
+    holder: str,
+) -> None:
+    """임대 반납 (이미 다른 프로세스가 회수한 슬롯은 건드리지 않음)"""
+    await session.execute(
+        update(ConcurrencyLease)
+        .where(
+            ConcurrencyLease.name == name,
+            ConcurrencyLease.slot == slot,
+            ConcurrencyLease.holder == holder,
+        )
+        .values(holder=None, expires_at=None)
+    )
+    await session.commit()
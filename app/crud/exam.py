@@ -1,9 +1,12 @@
 from typing import Sequence
 
-from sqlalchemy import select
+from sqlalchemy import case, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models.exam_record import ExamRecord
+from app.models.quiz import Quiz
 
 
 async def create_exam_record(
@@ -36,12 +39,39 @@ async def create_exam_record(
     return record
 
 
+async def create_exam_records_bulk(
+    session: AsyncSession,
+    quiz_ids: Sequence[int],
+    exam_session_id: str,
+) -> Sequence[ExamRecord]:
+    """시험 기록 일괄 생성 (INSERT ... RETURNING 한 번으로 처리)
+
+    호출하는 쪽에서 이미 조회한 문제 ID를 받으므로 문제 재조회와 refresh를 하지 않습니다.
+    commit은 호출하는 쪽에서 처리합니다.
+    """
+    if not quiz_ids:
+        return []
+
+    stmt = insert(ExamRecord).returning(ExamRecord, sort_by_parameter_order=True)
+    result = await session.scalars(
+        stmt,
+        [{"quiz_id": quiz_id, "exam_session_id": exam_session_id} for quiz_id in quiz_ids],
+    )
+    return result.all()
+
+
 async def get_exam_records_by_session(
     session: AsyncSession,
     exam_session_id: str,
 ) -> Sequence[ExamRecord]:
-    """시험 세션 ID로 기록 조회"""
-    stmt = select(ExamRecord).where(ExamRecord.exam_session_id == exam_session_id)
+    """시험 세션 ID로 기록 조회 (문제 포함, 출제 순서)"""
+    stmt = (
+        select(ExamRecord)
+        .where(ExamRecord.exam_session_id == exam_session_id)
+        .options(joinedload(ExamRecord.quiz))
+        .order_by(ExamRecord.id)
+        .execution_options(populate_existing=True)
+    )
     result = await session.execute(stmt)
     return result.scalars().all()
 
@@ -72,3 +102,72 @@ async def update_exam_record_answer(
     await session.commit()
     await session.refresh(record)
     return record
+
+
+async def submit_exam_answer(
+    session: AsyncSession,
+    exam_session_id: str,
+    quiz_id: int,
+    user_answer: int,
+) -> ExamRecord | None:
+    """답안 제출 (UPDATE ... FROM quizzes ... WHERE user_answer IS NULL RETURNING 한 번으로 처리)
+
+    정답 여부를 DB에서 함께 계산하고, 아직 답하지 않은 기록만 갱신하므로
+    동시에 제출해도 한 요청만 성공합니다.
+    기록이 없거나 이미 답안이 있으면 None을 반환합니다. commit은 호출하는 쪽에서 처리합니다.
+    PostgreSQL은 응답에 필요한 문제 컬럼도 같은 RETURNING으로 받아 record.quiz에 채우고,
+    RETURNING에서 FROM 테이블 컬럼을 허용하지 않는 SQLite에서만 문제를 PK로 따로 읽습니다.
+    """
+    returns_quiz = session.bind.dialect.name == "postgresql"
+    stmt = (
+        update(ExamRecord)
+        .where(
+            ExamRecord.exam_session_id == exam_session_id,
+            ExamRecord.quiz_id == quiz_id,
+            ExamRecord.user_answer.is_(None),
+            Quiz.id == ExamRecord.quiz_id,
+        )
+        .values(user_answer=user_answer, is_correct=Quiz.correct_answer == user_answer)
+        .returning(*((ExamRecord, Quiz) if returns_quiz else (ExamRecord,)))
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    result = await session.execute(stmt)
+    row = result.one_or_none()
+    if row is None:
+        return None
+    record = row[0]
+    quiz = row[1] if returns_quiz else await session.get(Quiz, quiz_id)
+    set_committed_value(record, "quiz", quiz)
+    return record
+
+
+async def submit_exam_answers_bulk(
+    session: AsyncSession,
+    exam_session_id: str,
+    answers: dict[int, int],
+) -> int:
+    """시험 답안 일괄 제출 (CASE 기반 UPDATE ... FROM quizzes 한 번으로 채점)
+
+    Args:
+        answers: 문제 ID → 사용자 답안
+
+    아직 답하지 않은 기록만 갱신하며, 갱신된 행 수를 반환합니다.
+    commit은 호출하는 쪽에서 처리합니다.
+    """
+    if not answers:
+        return 0
+
+    user_answer = case(answers, value=ExamRecord.quiz_id)
+    stmt = (
+        update(ExamRecord)
+        .where(
+            ExamRecord.exam_session_id == exam_session_id,
+            ExamRecord.quiz_id.in_(answers.keys()),
+            ExamRecord.user_answer.is_(None),
+            Quiz.id == ExamRecord.quiz_id,
+        )
+        .values(user_answer=user_answer, is_correct=Quiz.correct_answer == user_answer)
+        .execution_options(synchronize_session=False)
+    )
+    result = await session.execute(stmt)
+    return result.rowcount
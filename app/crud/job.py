@@ -0,0 +1,183 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Sequence
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.job import Job
+
+# 작업 상태
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _lease_expired(now: datetime):
+    """임대가 없거나(이전 버전에서 시작된 작업) 만료된 실행 중 작업 조건
+
+    세션에 로드된 객체와 Python에서 비교하지 않도록 이 조건의 UPDATE는 synchronize_session=False로 실행
+    (조회는 get_job의 populate_existing으로 DB 값을 다시 읽음)
+    """
+    return or_(Job.lease_expires_at.is_(None), Job.lease_expires_at < now)
+
+
+async def create_job(
+    session: AsyncSession,
+    job_type: str,
+    payload: dict,
+) -> Job:
+    """대기 상태 작업 생성"""
+    job = Job(
+        id=str(uuid.uuid4()),
+        job_type=job_type,
+        status=JOB_QUEUED,
+        payload=payload,
+        progress=0,
+        attempts=0,
+    )
+    session.add(job)
+    await session.commit()
+    await session.refresh(job)
+    return job
+
+
+async def get_job(
+    session: AsyncSession,
+    job_id: str,
+) -> Job | None:
+    """작업 조회"""
+    return await session.get(Job, job_id, populate_existing=True)
+
+
+async def claim_job(
+    session: AsyncSession,
+    job_id: str,
+    owner: str,
+    lease_seconds: float,
+) -> Job | None:
+    """대기 중인 작업을 owner의 실행 상태로 전환 (다른 워커가 먼저 가져갔으면 None)"""
+    now = _now()
+    stmt = (
+        update(Job)
+        .where(Job.id == job_id, Job.status == JOB_QUEUED)
+        .values(
+            status=JOB_RUNNING,
+            attempts=Job.attempts + 1,
+            started_at=now,
+            owner=owner,
+            lease_expires_at=now + timedelta(seconds=lease_seconds),
+        )
+    )
+    result = await session.execute(stmt)
+    await session.commit()
+    if result.rowcount == 0:
+        return None
+    return await get_job(session, job_id)
+
+
+async def renew_job_lease(
+    session: AsyncSession,
+    job_id: str,
+    owner: str,
+    lease_seconds: float,
+) -> bool:
+    """실행 중인 작업의 임대 연장 (다른 프로세스가 복구해 가져갔으면 False)"""
+    result = await session.execute(
+        update(Job)
+        .where(Job.id == job_id, Job.status == JOB_RUNNING, Job.owner == owner)
+        .values(lease_expires_at=_now() + timedelta(seconds=lease_seconds))
+    )
+    await session.commit()
+    return result.rowcount == 1
+
+
+async def update_job_progress(
+    session: AsyncSession,
+    job_id: str,
+    progress: int,
+) -> None:
+    """진행률(0-100) 갱신"""
+    stmt = (
+        update(Job)
+        .where(Job.id == job_id, Job.status == JOB_RUNNING)
+        .values(progress=max(0, min(100, progress)))
+    )
+    await session.execute(stmt)
+    await session.commit()
+
+
+async def finish_job(
+    session: AsyncSession,
+    job_id: str,
+    result: dict | None = None,
+    error: dict | None = None,
+    owner: str | None = None,
+) -> bool:
+    """작업 종료 기록 (error가 있으면 실패)
+
+    owner를 지정하면 그 프로세스가 실행 중인 경우에만 기록합니다
+    (임대가 만료되어 다른 프로세스가 다시 실행 중이면 결과를 덮어쓰지 않음).
+    """
+    values = {
+        "status": JOB_FAILED if error is not None else JOB_SUCCEEDED,
+        "finished_at": _now(),
+        "lease_expires_at": None,
+    }
+    if error is not None:
+        values["error"] = error
+    else:
+        values.update(result=result, progress=100)
+    stmt = update(Job).where(Job.id == job_id)
+    if owner is not None:
+        stmt = stmt.where(Job.status == JOB_RUNNING, Job.owner == owner)
+    result = await session.execute(stmt.values(**values))
+    await session.commit()
+    return result.rowcount == 1
+
+
+async def get_unfinished_jobs(session: AsyncSession) -> Sequence[Job]:
+    """대기/실행 중 상태로 남아 있는 작업 (생성 순)"""
+    stmt = (
+        select(Job)
+        .where(Job.status.in_([JOB_QUEUED, JOB_RUNNING]))
+        .order_by(Job.created_at, Job.id)
+    )
+    result = await session.execute(stmt)
+    return result.scalars().all()
+
+
+async def requeue_expired_job(
+    session: AsyncSession,
+    job_id: str,
+) -> bool:
+    """임대가 만료된 실행 중 작업을 다시 대기 상태로 (다른 프로세스가 먼저 복구했으면 False)"""
+    result = await session.execute(
+        update(Job)
+        .where(Job.id == job_id, Job.status == JOB_RUNNING, _lease_expired(_now()))
+        .execution_options(synchronize_session=False)
+        .values(status=JOB_QUEUED, started_at=None, progress=0, owner=None, lease_expires_at=None)
+    )
+    await session.commit()
+    return result.rowcount == 1
+
+
+async def fail_expired_job(
+    session: AsyncSession,
+    job_id: str,
+    error: dict,
+) -> bool:
+    """임대가 만료된 실행 중 작업을 실패로 기록 (다른 프로세스가 먼저 처리했으면 False)"""
+    result = await session.execute(
+        update(Job)
+        .where(Job.id == job_id, Job.status == JOB_RUNNING, _lease_expired(_now()))
+        .execution_options(synchronize_session=False)
+        .values(status=JOB_FAILED, error=error, finished_at=_now(), lease_expires_at=None)
+    )
+    await session.commit()
+    return result.rowcount == 1
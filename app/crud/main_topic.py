@@ -1,6 +1,7 @@
+from datetime import datetime
 from typing import Sequence
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.main_topic import MainTopic
@@ -30,3 +31,13 @@ async def get_main_topics_by_subject_id(session: AsyncSession, subject_id: int)
     if subject_id != ADSP_SUBJECT_ID:
         return []
     return await get_all_main_topics(session)
+
+
+async def get_main_topics_version(session: AsyncSession) -> tuple[int, datetime | None]:
+    """주요항목 목록 버전 (개수, 최종 수정 시각) 조회 (ADsP 전용, HTTP 캐시 검증용)"""
+    result = await session.execute(
+        select(func.count(MainTopic.id), func.max(MainTopic.updated_at))
+        .where(MainTopic.subject_id == ADSP_SUBJECT_ID)
+    )
+    count, last_modified = result.one()
+    return count, last_modified
@@ -5,6 +5,8 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
+from app.crud import quiz_sampling
+from app.crud.sub_topic_quiz_stats import get_sub_topic_quiz_stats
 from app.models.quiz import Quiz
 from app.models.sub_topic import SubTopic
 from app.models.main_topic import MainTopic
@@ -36,6 +38,17 @@ async def get_quiz_by_id(
     return result.scalar_one_or_none()
 
 
+async def get_quizzes_by_ids(
+    session: AsyncSession,
+    quiz_ids: list[int],
+) -> Sequence[Quiz]:
+    """여러 문제를 IN 쿼리 한 번으로 조회 (순서 보장 안 함, 없는 ID는 결과에서 빠짐)"""
+    if not quiz_ids:
+        return []
+    result = await session.execute(select(Quiz).where(Quiz.id.in_(quiz_ids)))
+    return result.scalars().all()
+
+
 async def get_quiz_by_hash(session: AsyncSession, source_hash: str) -> Quiz | None:
     """해시로 중복 문제 확인"""
     result = await session.execute(select(Quiz).where(Quiz.source_hash == source_hash))
@@ -56,7 +69,7 @@ async def create_quiz(
         subject_id=subject_id,
         sub_topic_id=sub_topic_id,
         question=ai_response.question,
-        options=ai_response.options_json,
+        options=ai_response.options_data,
         correct_answer=ai_response.correct_answer,
         explanation=ai_response.explanation,
         source_hash=source_hash,
@@ -74,25 +87,12 @@ async def get_random_quizzes(
     subject_id: int,
     count: int,
 ) -> Sequence[Quiz]:
-    """과목별 랜덤 문제 추출 (DB 레벨 최적화)"""
-    from sqlalchemy import func
-    
-    # 전체 개수 확인
-    count_stmt = select(func.count(Quiz.id)).where(Quiz.subject_id == subject_id)
-    total_count = await session.scalar(count_stmt)
-    
-    if total_count is None or total_count == 0:
-        return []
-    
-    # DB 레벨에서 랜덤 샘플링 (PostgreSQL의 ORDER BY RANDOM() 사용)
-    stmt = (
-        select(Quiz)
-        .where(Quiz.subject_id == subject_id)
-        .order_by(func.random())
-        .limit(count)
+    """과목별 랜덤 문제 추출 (후보 규모에 따라 샘플링 전략 자동 선택)"""
+    return await quiz_sampling.sample_quizzes(
+        session,
+        [Quiz.subject_id == subject_id],
+        count,
     )
-    result = await session.execute(stmt)
-    return result.scalars().all()
 
 
 async def get_quizzes_by_sub_topic_id(
@@ -100,31 +100,30 @@ async def get_quizzes_by_sub_topic_id(
     sub_topic_id: int,
     count: int,
     exclude_quiz_ids: list[int] | None = None,
+    total_count: int | None = None,
 ) -> Sequence[Quiz]:
-    """세부항목별 문제 조회 (캐시 조회용, 이미 본 문제 제외 가능)"""
-    from sqlalchemy import func
-    
-    stmt = select(Quiz).where(Quiz.sub_topic_id == sub_topic_id)
-    
-    # 이미 본 문제 제외
-    if exclude_quiz_ids:
-        stmt = stmt.where(~Quiz.id.in_(exclude_quiz_ids))
-    
-    stmt = stmt.order_by(func.random()).limit(count)
-    result = await session.execute(stmt)
-    return result.scalars().all()
+    """세부항목별 랜덤 문제 조회 (캐시 조회용, 이미 본 문제 제외 가능)
+
+    total_count를 이미 알고 있으면 전달하여 개수 조회를 생략합니다.
+    """
+    if total_count is None:
+        total_count = await get_quiz_count_by_sub_topic_id(session, sub_topic_id)
+    return await quiz_sampling.sample_quizzes(
+        session,
+        [Quiz.sub_topic_id == sub_topic_id],
+        count,
+        exclude_quiz_ids=exclude_quiz_ids,
+        total_hint=total_count,
+    )
 
 
 async def get_quiz_count_by_sub_topic_id(
     session: AsyncSession,
     sub_topic_id: int,
 ) -> int:
-    """세부항목별 문제 개수 조회"""
-    from sqlalchemy import func
-    
-    count_stmt = select(func.count(Quiz.id)).where(Quiz.sub_topic_id == sub_topic_id)
-    total_count = await session.scalar(count_stmt)
-    return total_count or 0
+    """세부항목별 문제 개수 조회 (sub_topic_quiz_stats 집계 사용)"""
+    stats = await get_sub_topic_quiz_stats(session, sub_topic_id)
+    return stats.quiz_count if stats else 0
 
 
 async def get_latest_quiz_by_sub_topic_id(
@@ -199,7 +198,7 @@ async def update_quiz(
     session: AsyncSession,
     quiz_id: int,
     question: str | None = None,
-    options: str | None = None,
+    options: list[dict] | None = None,
     correct_answer: int | None = None,
     explanation: str | None = None,
     sub_topic_id: int | None = None,
@@ -0,0 +1,243 @@
+"""문제 랜덤 샘플링
+
+ORDER BY random()은 필터된 전체 행을 정렬하므로 문제 은행이 커질수록 느려집니다.
+후보 규모에 따라 아래 전략 중 하나를 자동 선택합니다.
+
+- order_by_random: 후보가 작을 때 (정렬 비용이 후보 수로 제한됨)
+- id_range: id가 조밀할 때 무작위 id를 뽑아 PK로 조회 (표본 크기에 비례)
+- random_key: id가 희소할 때 인덱스된 random_key의 무작위 지점마다 짧은 범위를 읽어 하나씩 추출
+
+모든 전략은 읽기만 수행합니다 (샘플링이 행을 갱신하거나 잠그지 않음).
+"""
+import random
+from typing import Sequence
+
+from sqlalchemy import ColumnElement, func, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.quiz import Quiz
+
+STRATEGY_ORDER_BY_RANDOM = "order_by_random"
+STRATEGY_ID_RANGE = "id_range"
+STRATEGY_RANDOM_KEY = "random_key"
+
+# 후보 규모가 이 값 이하이면 ORDER BY random() 사용
+SMALL_TABLE_THRESHOLD = 2000
+# id_range 첫 라운드 적중률이 이 값 미만이면 random_key로 전환
+ID_RANGE_MIN_DENSITY = 0.3
+# id_range 라운드당 필요한 개수 대비 추출할 후보 id 배수
+ID_RANGE_OVERSAMPLE = 3
+ID_RANGE_MAX_ROUNDS = 4
+# random_key 지점마다 읽는 행 수 (클수록 행 사이 random_key 간격 차이가 평균화됨)
+RANDOM_KEY_WINDOW = 32
+# random_key 라운드당 최대 지점 수 (한 번의 UNION ALL 쿼리로 조회)
+RANDOM_KEY_MAX_PIVOTS = 200
+RANDOM_KEY_MAX_ROUNDS = 4
+
+
+def choose_strategy(span: int, total_hint: int | None = None) -> str:
+    """후보 규모로 샘플링 전략 선택
+
+    Args:
+        span: 후보 id 범위 크기 (max_id - min_id + 1)
+        total_hint: 알려진 후보 개수 (없으면 span으로 추정)
+    """
+    size = total_hint if total_hint is not None else span
+    if size <= SMALL_TABLE_THRESHOLD:
+        return STRATEGY_ORDER_BY_RANDOM
+    return STRATEGY_ID_RANGE
+
+
+async def sample_quizzes(
+    session: AsyncSession,
+    criteria: Sequence[ColumnElement[bool]],
+    count: int,
+    exclude_quiz_ids: Sequence[int] | None = None,
+    total_hint: int | None = None,
+    strategy: str | None = None,
+) -> list[Quiz]:
+    """조건에 맞는 문제를 균등 확률로 count개 추출
+
+    Args:
+        session: 데이터베이스 세션
+        criteria: 후보 필터 조건 (예: [Quiz.subject_id == 1])
+        count: 추출할 개수
+        exclude_quiz_ids: 제외할 문제 ID
+        total_hint: 알려진 후보 개수 (작으면 id 범위 조회를 생략)
+        strategy: 전략 강제 지정 (테스트/진단용)
+    """
+    if count <= 0:
+        return []
+
+    excluded = set(exclude_quiz_ids or [])
+
+    if strategy is None and total_hint is not None:
+        if total_hint == 0:
+            return []
+        if total_hint <= SMALL_TABLE_THRESHOLD:
+            strategy = STRATEGY_ORDER_BY_RANDOM
+
+    if strategy in (None, STRATEGY_ID_RANGE):
+        bounds = await session.execute(
+            select(func.min(Quiz.id), func.max(Quiz.id)).where(*criteria)
+        )
+        min_id, max_id = bounds.one()
+        if min_id is None:
+            return []
+        if strategy is None:
+            strategy = choose_strategy(max_id - min_id + 1, total_hint)
+
+    if strategy == STRATEGY_ORDER_BY_RANDOM:
+        return await _sample_order_by_random(session, criteria, count, excluded)
+
+    if strategy == STRATEGY_ID_RANGE:
+        picked = await _sample_id_range(session, criteria, count, excluded, min_id, max_id)
+        if len(picked) >= count:
+            return picked
+        # id가 희소하거나 라운드 내에 다 채우지 못하면 random_key 범위 스캔으로 나머지 추출
+        excluded.update(quiz.id for quiz in picked)
+        return picked + await _sample_random_key(session, criteria, count - len(picked), excluded)
+
+    return await _sample_random_key(session, criteria, count, excluded)
+
+
+async def _sample_order_by_random(
+    session: AsyncSession,
+    criteria: Sequence[ColumnElement[bool]],
+    count: int,
+    excluded: set[int],
+) -> list[Quiz]:
+    """ORDER BY random() 샘플링 (소규모 후보 전용)"""
+    stmt = select(Quiz).where(*criteria)
+    if excluded:
+        stmt = stmt.where(~Quiz.id.in_(excluded))
+    result = await session.execute(stmt.order_by(func.random()).limit(count))
+    return list(result.scalars().all())
+
+
+async def _sample_id_range(
+    session: AsyncSession,
+    criteria: Sequence[ColumnElement[bool]],
+    count: int,
+    excluded: set[int],
+    min_id: int,
+    max_id: int,
+) -> list[Quiz]:
+    """id 범위에서 무작위 id를 뽑아 PK로 조회
+
+    존재하는 각 행이 뽑힐 확률이 같으므로 균등 추출이 됩니다.
+    첫 라운드 적중률이 낮으면 (id가 희소하면) 추가 라운드 없이 중단합니다.
+    """
+    picked: list[Quiz] = []
+    probed = set(excluded)
+    span = max_id - min_id + 1
+
+    for round_index in range(ID_RANGE_MAX_ROUNDS):
+        need = count - len(picked)
+        if need <= 0 or len(probed) >= span:
+            break
+
+        probe_size = min(need * ID_RANGE_OVERSAMPLE, span - len(probed))
+        probes: set[int] = set()
+        # 조밀한 범위에서는 몇 번의 재추첨으로 충분
+        for _ in range(probe_size * 4):
+            if len(probes) >= probe_size:
+                break
+            candidate = random.randint(min_id, max_id)
+            if candidate not in probed:
+                probes.add(candidate)
+        if not probes:
+            break
+        probed.update(probes)
+
+        result = await session.execute(select(Quiz).where(*criteria, Quiz.id.in_(probes)))
+        hits = list(result.scalars().all())
+        random.shuffle(hits)
+        picked.extend(hits[:need])
+
+        if round_index == 0 and len(hits) < len(probes) * ID_RANGE_MIN_DENSITY:
+            break
+
+    return picked
+
+
+async def _sample_random_key(
+    session: AsyncSession,
+    criteria: Sequence[ColumnElement[bool]],
+    count: int,
+    excluded: set[int],
+) -> list[Quiz]:
+    """random_key 인덱스의 무작위 지점마다 뒤따르는 RANDOM_KEY_WINDOW개 중 하나를 추출
+
+    지점마다 창 안에서 다시 무작위로 고르므로 행 사이 random_key 간격 차이가 평균화되고,
+    지점이 서로 독립이라 연속 구간처럼 같은 문제 묶음이 반복되지 않습니다.
+    끝에 닿은 창은 처음부터 이어서 채웁니다 (wrap-around). random_key는 갱신하지 않습니다.
+    """
+    conditions = list(criteria)
+    if excluded:
+        conditions.append(~Quiz.id.in_(excluded))
+
+    def window(*extra: ColumnElement[bool]):
+        return (
+            select(Quiz.id, Quiz.random_key)
+            .where(*conditions, *extra)
+            .order_by(Quiz.random_key)
+            .limit(RANDOM_KEY_WINDOW)
+            .subquery()
+        )
+
+    head_window = window()
+    result = await session.execute(select(head_window.c.id, head_window.c.random_key))
+    head = [row.id for row in sorted(result.all(), key=lambda row: row.random_key)]
+    if len(head) < RANDOM_KEY_WINDOW:
+        # 후보 전체가 창 하나에 들어감
+        return await _load_shuffled(session, random.sample(head, min(count, len(head))))
+
+    picked: list[int] = []
+    seen: set[int] = set(head)
+    for _ in range(RANDOM_KEY_MAX_ROUNDS):
+        need = count - len(picked)
+        if need <= 0:
+            break
+
+        pivots = [random.random() for _ in range(min(need * 2, RANDOM_KEY_MAX_PIVOTS))]
+        windows = [window(Quiz.random_key >= pivot) for pivot in pivots]
+        selects = [
+            select(sub.c.id, sub.c.random_key, literal(index).label("pivot"))
+            for index, sub in enumerate(windows)
+        ]
+        result = await session.execute(union_all(*selects) if len(selects) > 1 else selects[0])
+
+        rows_by_pivot: dict[int, list] = {}
+        for row in result.all():
+            rows_by_pivot.setdefault(row.pivot, []).append(row)
+
+        chosen = set(picked)
+        for index in range(len(pivots)):
+            rows = sorted(rows_by_pivot.get(index, []), key=lambda row: row.random_key)
+            ids = [row.id for row in rows]
+            seen.update(ids)
+            ids.extend(head[:RANDOM_KEY_WINDOW - len(ids)])
+            candidate = random.choice(ids)
+            if candidate not in chosen:
+                chosen.add(candidate)
+                picked.append(candidate)
+                if len(picked) >= count:
+                    break
+
+    if len(picked) < count:
+        # 라운드 내에 다 채우지 못하면 지금까지 읽은 행에서 나머지 추출
+        remaining = list(seen.difference(picked))
+        picked.extend(random.sample(remaining, min(count - len(picked), len(remaining))))
+
+    return await _load_shuffled(session, picked)
+
+
+async def _load_shuffled(session: AsyncSession, quiz_ids: list[int]) -> list[Quiz]:
+    """id 목록의 문제를 조회해 무작위 순서로 반환"""
+    if not quiz_ids:
+        return []
+    result = await session.execute(select(Quiz).where(Quiz.id.in_(quiz_ids)))
+    quizzes = list(result.scalars().all())
+    random.shuffle(quizzes)
+    return quizzes
@@ -1,6 +1,9 @@
+from typing import Sequence
+
 from sqlalchemy import select, func, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.quiz import Quiz
 from app.models.quiz_validation import QuizValidation
 
 
@@ -12,7 +15,7 @@ async def create_quiz_validation(
     feedback: str | None = None,
     issues: list[str] | None = None,
 ) -> QuizValidation:
-    """검증 결과 저장"""
+    """검증 결과 저장 (quizzes의 최신 검증 상태도 같은 트랜잭션에서 갱신)"""
     validation = QuizValidation(
         quiz_id=quiz_id,
         validation_status=validation_status,
@@ -21,8 +24,16 @@ async def create_quiz_validation(
         issues=issues,
     )
     session.add(validation)
-    await session.commit()
+    await session.flush()
     await session.refresh(validation)
+
+    # 이미 로드된 문제는 identity map에서 가져오므로 추가 조회 없음
+    quiz = await session.get(Quiz, quiz_id)
+    if quiz is not None:
+        quiz.latest_validation_status = validation_status
+        quiz.latest_validated_at = validation.validated_at
+
+    await session.commit()
     return validation
 
 
@@ -34,90 +45,63 @@ async def get_latest_validation(
     stmt = (
         select(QuizValidation)
         .where(QuizValidation.quiz_id == quiz_id)
-        .order_by(desc(QuizValidation.validated_at))
+        .order_by(desc(QuizValidation.validated_at), desc(QuizValidation.id))
         .limit(1)
     )
     result = await session.execute(stmt)
     return result.scalar_one_or_none()
 
 
+def _needs_validation():
+    """검증이 필요한 문제 조건 (pending 또는 invalid 상태, 또는 검증 이력이 없는 문제)"""
+    return (
+        (Quiz.latest_validation_status.in_(['pending', 'invalid']))
+        | (Quiz.latest_validation_status.is_(None))
+    )
+
+
 async def get_quizzes_needing_validation(
     session: AsyncSession,
 ) -> list[int]:
     """검증이 필요한 문제 ID 목록 조회 (pending 또는 invalid 상태, 또는 검증 이력이 없는 문제)"""
-    from app.models.quiz import Quiz
-    
-    # 각 문제의 최신 검증 상태를 서브쿼리로 조회
-    latest_validation_subquery = (
-        select(
-            QuizValidation.quiz_id,
-            QuizValidation.validation_status,
-            func.row_number()
-            .over(
-                partition_by=QuizValidation.quiz_id,
-                order_by=desc(QuizValidation.validated_at)
-            )
-            .label('rn')
-        )
-        .subquery()
-    )
-    
-    # 최신 검증 상태만 필터링
-    latest_status = (
-        select(
-            latest_validation_subquery.c.quiz_id,
-            latest_validation_subquery.c.validation_status
-        )
-        .where(latest_validation_subquery.c.rn == 1)
-        .subquery()
-    )
-    
-    # 검증이 필요한 문제: 최신 상태가 'pending' 또는 'invalid'이거나 검증 이력이 없는 문제
+    stmt = select(Quiz.id).where(_needs_validation())
+    result = await session.execute(stmt)
+    return [row[0] for row in result.all()]
+
+
+async def get_quizzes_needing_validation_page(
+    session: AsyncSession,
+    page: int = 1,
+    limit: int = 20,
+) -> Sequence[Quiz]:
+    """검증이 필요한 문제 한 페이지 조회 (최신순)
+
+    전체 개수는 get_validation_status_counts의 pending + invalid와 같으므로 따로 세지 않습니다.
+    """
     stmt = (
-        select(Quiz.id)
-        .outerjoin(latest_status, Quiz.id == latest_status.c.quiz_id)
-        .where(
-            (latest_status.c.validation_status.in_(['pending', 'invalid']))
-            | (latest_status.c.validation_status.is_(None))
-        )
+        select(Quiz)
+        .where(_needs_validation())
+        .order_by(Quiz.created_at.desc(), Quiz.id.desc())
+        .offset((page - 1) * limit)
+        .limit(limit)
     )
-    
     result = await session.execute(stmt)
-    return [row[0] for row in result.all()]
+    return result.scalars().all()
 
 
 async def get_latest_validation_statuses(
     session: AsyncSession,
     quiz_ids: list[int],
 ) -> dict[int, str]:
-    """여러 문제의 최신 검증 상태를 한 번에 조회"""
+    """여러 문제의 최신 검증 상태를 한 번에 조회 (검증 이력이 있는 문제만 포함)"""
     if not quiz_ids:
         return {}
-    
-    latest_validation_subquery = (
-        select(
-            QuizValidation.quiz_id,
-            QuizValidation.validation_status,
-            func.row_number()
-            .over(
-                partition_by=QuizValidation.quiz_id,
-                order_by=desc(QuizValidation.validated_at)
-            )
-            .label('rn')
-        )
-        .where(QuizValidation.quiz_id.in_(quiz_ids))
-        .subquery()
-    )
-    
-    latest_status = (
-        select(
-            latest_validation_subquery.c.quiz_id,
-            latest_validation_subquery.c.validation_status
-        )
-        .where(latest_validation_subquery.c.rn == 1)
+
+    stmt = select(Quiz.id, Quiz.latest_validation_status).where(
+        Quiz.id.in_(quiz_ids),
+        Quiz.latest_validation_status.is_not(None),
     )
-    
-    result = await session.execute(latest_status)
+    result = await session.execute(stmt)
     return {row[0]: row[1] for row in result.all()}
 
 
@@ -125,50 +109,19 @@ async def get_validation_status_counts(
     session: AsyncSession,
 ) -> dict[str, int]:
     """검증 상태별 개수 조회"""
-    from app.models.quiz import Quiz
-    
-    # 전체 문제 개수
-    total_count = await session.scalar(select(func.count(Quiz.id))) or 0
-    
-    # 최신 검증 상태별 개수
-    latest_status_subquery = (
-        select(
-            QuizValidation.quiz_id,
-            QuizValidation.validation_status,
-            func.row_number()
-            .over(
-                partition_by=QuizValidation.quiz_id,
-                order_by=desc(QuizValidation.validated_at)
-            )
-            .label('rn')
-        )
-        .subquery()
+    stmt = select(Quiz.latest_validation_status, func.count(Quiz.id)).group_by(
+        Quiz.latest_validation_status
     )
-    
-    # valid, invalid 개수
-    valid_count_stmt = (
-        select(func.count())
-        .select_from(latest_status_subquery)
-        .where(
-            (latest_status_subquery.c.rn == 1)
-            & (latest_status_subquery.c.validation_status == 'valid')
-        )
-    )
-    valid_count = await session.scalar(valid_count_stmt) or 0
-    
-    invalid_count_stmt = (
-        select(func.count())
-        .select_from(latest_status_subquery)
-        .where(
-            (latest_status_subquery.c.rn == 1)
-            & (latest_status_subquery.c.validation_status == 'invalid')
-        )
-    )
-    invalid_count = await session.scalar(invalid_count_stmt) or 0
-    
-    # pending = 전체 - valid - invalid
+    result = await session.execute(stmt)
+    counts = {status: count for status, count in result.all()}
+
+    total_count = sum(counts.values())
+    valid_count = counts.get('valid', 0)
+    invalid_count = counts.get('invalid', 0)
+
+    # pending = 전체 - valid - invalid (검증 이력 없음 포함)
     pending_count = total_count - valid_count - invalid_count
-    
+
     return {
         "valid": valid_count,
         "invalid": invalid_count,
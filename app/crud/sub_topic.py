@@ -1,62 +1,36 @@
-import json
+import hashlib
 import logging
-import re
-from typing import Sequence
+from dataclasses import replace
+from datetime import datetime
+from typing import AsyncIterator, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
+from app.crud import taxonomy as taxonomy_crud
+from app.crud.taxonomy import CachedSubTopic
+from app.models.core_content_item import CoreContentItem
 from app.models.sub_topic import SubTopic
-from app.models.main_topic import MainTopic
 
 logger = logging.getLogger(__name__)
 
-# 핵심 정보 구분자
+# 핵심 정보 항목 스트리밍 시 한 번에 가져올 행 수
+CORE_CONTENT_STREAM_BATCH = 50
+
+# 레거시 핵심 정보 blob 구분자 (호환 뷰/해시 키 생성용)
 CORE_CONTENT_SEPARATOR = "\n\n--- 추가 데이터 ---\n\n"
-# 메타데이터 패턴: [source_type:text] 형식
-METADATA_PATTERN = re.compile(r'^\[source_type:([^\]]+)\]\s*(.*)$', re.DOTALL)
 
 
-def parse_core_contents(core_content: str | None, source_type: str | None) -> list[dict]:
-    """핵심 정보를 구분자로 분리하여 배열로 반환
-    
-    각 핵심 정보는 다음 형식 중 하나를 지원:
-    1. 새 형식: [source_type:text]content (권장)
-    2. 기존 형식: content (하위 호환성, 전체 source_type 사용)
-    """
-    if not core_content or not core_content.strip():
-        return []
-    
-    # 구분자로 분리
-    parts = core_content.split(CORE_CONTENT_SEPARATOR)
-    
-    result = []
-    for index, part in enumerate(parts):
-        cleaned = part.strip()
-        if not cleaned:
-            continue
-        
-        # 메타데이터 패턴 확인 (새 형식)
-        match = METADATA_PATTERN.match(cleaned)
-        if match:
-            # 새 형식: [source_type:text]content
-            item_source_type = match.group(1)
-            item_content = match.group(2).strip()
-            result.append({
-                "index": index,
-                "core_content": item_content,
-                "source_type": item_source_type
-            })
-        else:
-            # 기존 형식: content (하위 호환성)
-            result.append({
-                "index": index,
-                "core_content": cleaned,
-                "source_type": source_type or "text"
-            })
-    
-    return result
+def hash_core_content(content: str) -> str:
+    """핵심 정보 내용 해시 (SHA-256 hex)"""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def build_legacy_core_content(items: Sequence[CoreContentItem]) -> str:
+    """핵심 정보 항목을 기존 blob 형식([source_type:xxx]content, 최신순, 구분자 결합)으로 변환"""
+    return CORE_CONTENT_SEPARATOR.join(
+        f"[source_type:{item.source_type}]{item.content}" for item in items
+    )
 
 
 async def get_sub_topic_by_id(session: AsyncSession, sub_topic_id: int) -> SubTopic | None:
@@ -75,35 +49,51 @@ async def get_sub_topics_by_main_topic_id(session: AsyncSession, main_topic_id:
     return result.scalars().all()
 
 
-async def get_sub_topics_with_relations(session: AsyncSession) -> Sequence[SubTopic]:
-    """모든 세부항목 조회 (관계 포함, ADsP 전용)"""
+async def get_sub_topics_version(session: AsyncSession, main_topic_id: int) -> tuple[int, datetime | None]:
+    """주요항목의 세부항목 목록 버전 (개수, 최종 수정 시각) 조회 (HTTP 캐시 검증용)"""
     result = await session.execute(
-        select(SubTopic)
-        .join(SubTopic.main_topic)
-        .options(joinedload(SubTopic.main_topic).joinedload(MainTopic.subject))
-        .where(MainTopic.subject_id == 1)
-        .order_by(MainTopic.id, SubTopic.id)
+        select(func.count(SubTopic.id), func.max(SubTopic.updated_at))
+        .where(SubTopic.main_topic_id == main_topic_id)
     )
-    return result.unique().scalars().all()
+    count, last_modified = result.one()
+    return count, last_modified
+
+
+async def get_sub_topics_with_relations(session: AsyncSession) -> list[CachedSubTopic]:
+    """모든 세부항목 조회 (주요항목/과목 및 카테고리 경로 포함, 분류 체계 캐시 사용, ADsP 전용)"""
+    return await taxonomy_crud.get_sub_topics()
+
 
+async def get_sub_topic_with_core_content(session: AsyncSession, sub_topic_id: int) -> CachedSubTopic | None:
+    """세부항목 조회 (핵심 정보 상태 및 관계 포함)
 
-async def get_sub_topic_with_core_content(session: AsyncSession, sub_topic_id: int) -> SubTopic | None:
-    """세부항목 조회 (핵심 정보 및 관계 포함)"""
+    분류 체계(이름/주요항목/과목)는 캐시에서 가져오고, 핵심 정보 상태
+    (updated_at, core_content_count, source_type)는 매번 PK 조회로 읽어
+    캐시 때문에 오래된 핵심 정보 상태를 반환하지 않습니다.
+    """
     logger.debug(f"세부항목 조회: sub_topic_id={sub_topic_id}")
     try:
         result = await session.execute(
-            select(SubTopic)
+            select(SubTopic.updated_at, SubTopic.core_content_count, SubTopic.source_type)
             .where(SubTopic.id == sub_topic_id)
-            .options(
-                joinedload(SubTopic.main_topic).joinedload(MainTopic.subject)
-            )
         )
-        sub_topic = result.scalar_one_or_none()
-        if sub_topic:
-            logger.debug(f"세부항목 조회 성공: sub_topic_id={sub_topic_id}, name={sub_topic.name}")
-        else:
+        state = result.one_or_none()
+        if state is None:
             logger.debug(f"세부항목 조회 결과 없음: sub_topic_id={sub_topic_id}")
-        return sub_topic
+            return None
+        
+        cached = await taxonomy_crud.get_sub_topic(sub_topic_id)
+        if cached is None:
+            logger.debug(f"세부항목 분류 체계 없음: sub_topic_id={sub_topic_id}")
+            return None
+        
+        logger.debug(f"세부항목 조회 성공: sub_topic_id={sub_topic_id}, name={cached.name}")
+        return replace(
+            cached,
+            updated_at=state.updated_at,
+            core_content_count=state.core_content_count,
+            source_type=state.source_type,
+        )
     except Exception as e:
         logger.error(
             f"세부항목 조회 중 예외: sub_topic_id={sub_topic_id}, "
@@ -113,18 +103,50 @@ async def get_sub_topic_with_core_content(session: AsyncSession, sub_topic_id: i
         raise
 
 
+def _core_content_items_query(sub_topic_id: int):
+    """세부항목 핵심 정보 항목 조회 쿼리 (최신순)"""
+    return (
+        select(CoreContentItem)
+        .where(CoreContentItem.sub_topic_id == sub_topic_id)
+        .order_by(CoreContentItem.position.desc())
+    )
+
+
+async def get_core_content_items(session: AsyncSession, sub_topic_id: int) -> Sequence[CoreContentItem]:
+    """세부항목 핵심 정보 항목 목록 조회 (최신순)"""
+    result = await session.execute(_core_content_items_query(sub_topic_id))
+    return result.scalars().all()
+
+
+async def stream_core_content_items(session: AsyncSession, sub_topic_id: int) -> AsyncIterator[CoreContentItem]:
+    """세부항목 핵심 정보 항목을 최신순으로 스트리밍 (전체를 메모리에 올리지 않음)"""
+    result = await session.stream_scalars(
+        _core_content_items_query(sub_topic_id).execution_options(yield_per=CORE_CONTENT_STREAM_BATCH)
+    )
+    async for item in result:
+        yield item
+
+
 async def update_sub_topic_core_content(
     session: AsyncSession,
     sub_topic_id: int,
     core_content: str,
     source_type: str,
 ) -> SubTopic | None:
-    """세부항목 핵심 정보 업데이트 (기존 방식, 호환성 유지)"""
+    """세부항목 핵심 정보 교체 (기존 항목 삭제 후 단일 항목으로 저장, 호환성 유지)"""
     sub_topic = await get_sub_topic_by_id(session, sub_topic_id)
     if not sub_topic:
         return None
     
-    sub_topic.core_content = core_content
+    await session.execute(delete(CoreContentItem).where(CoreContentItem.sub_topic_id == sub_topic_id))
+    session.add(CoreContentItem(
+        sub_topic_id=sub_topic_id,
+        position=1,
+        source_type=source_type,
+        content=core_content,
+        content_hash=hash_core_content(core_content),
+    ))
+    sub_topic.core_content_count = 1
     sub_topic.source_type = source_type
     await session.commit()
     await session.refresh(sub_topic)
@@ -137,45 +159,33 @@ async def append_sub_topic_core_content(
     additional_content: str,
     source_type: str,
 ) -> SubTopic | None:
-    """세부항목 핵심 정보 추가 (기존 데이터에 append, 수정/삭제 불가)
+    """세부항목 핵심 정보 추가 (항목 1행 INSERT, 수정/삭제 불가)
     
-    각 핵심 정보의 source_type을 개별적으로 저장하기 위해 [source_type:xxx] 형식으로 저장합니다.
-    기존 데이터와의 호환성을 위해 기존 형식도 지원합니다.
+    세부항목 행의 core_content_count를 원자적으로 증가시켜 position을 발급하므로
+    기존 항목 수와 무관하게 비용이 일정하고, 동시 추가 시에도 순번이 겹치지 않습니다.
+    updated_at도 함께 갱신되어 학습 모드의 핵심 정보 변경 감지에 사용됩니다.
     """
-    sub_topic = await get_sub_topic_by_id(session, sub_topic_id)
-    if not sub_topic:
+    result = await session.execute(
+        update(SubTopic)
+        .where(SubTopic.id == sub_topic_id)
+        .values(
+            core_content_count=SubTopic.core_content_count + 1,
+            # source_type은 최신 것으로 업데이트 (하위 호환성 유지)
+            source_type=source_type,
+        )
+        .returning(SubTopic.core_content_count)
+        .execution_options(synchronize_session=False)
+    )
+    position = result.scalar_one_or_none()
+    if position is None:
         return None
     
-    # 새로운 핵심 정보를 메타데이터 포함 형식으로 구성
-    new_item = f"[source_type:{source_type}]{additional_content}"
-    
-    # 기존 데이터가 있으면 구분자와 함께 추가, 없으면 새로 생성
-    if sub_topic.core_content and sub_topic.core_content.strip():
-        # 기존 데이터가 새 형식인지 확인
-        existing_parts = sub_topic.core_content.split(CORE_CONTENT_SEPARATOR)
-        if existing_parts and METADATA_PATTERN.match(existing_parts[0].strip()):
-            # 새 형식: 그대로 추가
-            sub_topic.core_content = f"{new_item}{CORE_CONTENT_SEPARATOR}{sub_topic.core_content}"
-        else:
-            # 기존 형식: 첫 번째 항목을 새 형식으로 변환
-            converted_parts = []
-            for part in existing_parts:
-                cleaned = part.strip()
-                if cleaned:
-                    # 기존 형식이면 메타데이터 추가
-                    if not METADATA_PATTERN.match(cleaned):
-                        converted_parts.append(f"[source_type:{sub_topic.source_type or 'text'}]{cleaned}")
-                    else:
-                        converted_parts.append(cleaned)
-            
-            # 새로운 항목 추가
-            sub_topic.core_content = f"{new_item}{CORE_CONTENT_SEPARATOR}{CORE_CONTENT_SEPARATOR.join(converted_parts)}"
-    else:
-        # 첫 번째 핵심 정보는 메타데이터 포함 형식으로 저장
-        sub_topic.core_content = new_item
-    
-    # source_type은 최신 것으로 업데이트 (하위 호환성 유지)
-    sub_topic.source_type = source_type
+    session.add(CoreContentItem(
+        sub_topic_id=sub_topic_id,
+        position=position,
+        source_type=source_type,
+        content=additional_content,
+        content_hash=hash_core_content(additional_content),
+    ))
     await session.commit()
-    await session.refresh(sub_topic)
-    return sub_topic
+    return await session.get(SubTopic, sub_topic_id, populate_existing=True)
@@ -0,0 +1,58 @@
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.sub_topic_quiz_stats import SubTopicQuizStats, stats_upsert
+
+
+async def get_sub_topic_quiz_stats(
+    session: AsyncSession,
+    sub_topic_id: int,
+) -> SubTopicQuizStats | None:
+    """세부항목 문제 재고 집계 조회 (문제가 한 번도 없었으면 None)
+
+    집계는 Core upsert로 갱신되므로 identity map의 객체를 항상 새 값으로 덮어씁니다.
+    """
+    return await session.get(SubTopicQuizStats, sub_topic_id, populate_existing=True)
+
+
+async def get_sub_topic_quiz_stats_map(
+    session: AsyncSession,
+    sub_topic_ids: list[int],
+) -> dict[int, SubTopicQuizStats]:
+    """여러 세부항목의 문제 재고 집계를 한 번에 조회"""
+    if not sub_topic_ids:
+        return {}
+    result = await session.execute(
+        select(SubTopicQuizStats)
+        .where(SubTopicQuizStats.sub_topic_id.in_(sub_topic_ids))
+        .execution_options(populate_existing=True)
+    )
+    return {stats.sub_topic_id: stats for stats in result.scalars().all()}
+
+
+async def record_generation_attempt(
+    session: AsyncSession,
+    sub_topic_id: int,
+    similarity_failed: bool,
+) -> None:
+    """학습 모드 문제 생성 시도 기록 (commit은 호출하는 쪽에서 처리)
+
+    유사 문제 재시도 초과로 생산이 중단되면 연속 실패 횟수를 올리고,
+    새 문제가 생성되면 0으로 초기화합니다.
+    """
+    table = SubTopicQuizStats.__table__
+    stmt = stats_upsert(session.bind.dialect.name, {
+        "sub_topic_id": sub_topic_id,
+        "quiz_count": 0,
+        "last_generation_attempt_at": func.now(),
+        "consecutive_similarity_failures": 1 if similarity_failed else 0,
+    })
+    failures = table.c.consecutive_similarity_failures + 1 if similarity_failed else 0
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.sub_topic_id],
+        set_={
+            "last_generation_attempt_at": stmt.excluded.last_generation_attempt_at,
+            "consecutive_similarity_failures": failures,
+        },
+    )
+    await session.execute(stmt)
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Sequence
 
 from sqlalchemy import func, select
@@ -47,3 +48,19 @@ async def get_all_subjects_with_quiz_count(session: AsyncSession) -> list[dict]:
             "quiz_count": row.quiz_count or 0,
         })
     return subjects
+
+
+async def get_subjects_version(session: AsyncSession) -> tuple[int, datetime | None, int, int | None]:
+    """과목 목록(문제 개수 포함) 버전 조회 (HTTP 캐시 검증용)
+
+    과목 개수/최종 수정 시각과 문제 개수/최대 ID를 한 번에 반환합니다.
+    """
+    result = await session.execute(
+        select(
+            select(func.count(Subject.id)).scalar_subquery(),
+            select(func.max(Subject.updated_at)).scalar_subquery(),
+            select(func.count(Quiz.id)).scalar_subquery(),
+            select(func.max(Quiz.id)).scalar_subquery(),
+        )
+    )
+    return tuple(result.one())
@@ -0,0 +1,284 @@
+"""과목 > 주요항목 > 세부항목 분류 체계 캐시
+
+분류 체계는 거의 바뀌지 않지만 학습 모드/자동 분류/대시보드 요청마다 join으로 다시 읽습니다.
+프로세스 단위로 한 번 읽어 카테고리 경로 문자열까지 미리 만들어 두고,
+해당 테이블에 쓰기가 커밋되면 버전을 올려 다음 조회 때 다시 읽습니다.
+다른 프로세스의 변경은 taxonomy_cache_check_interval마다 세 테이블의 행 수/max(updated_at)을
+한 번의 쿼리로 확인해 달라졌으면 다시 읽고, 확인과 무관하게 TTL(taxonomy_cache_ttl)이 지나도 다시 읽습니다.
+읽기는 요청 세션(읽기 전용 복제본일 수 있음) 대신 캐시가 직접 여는 짧은 primary 세션으로 수행합니다.
+
+핵심 정보 상태(updated_at, core_content_count, source_type)는 캐시하지 않으며,
+get_sub_topic_with_core_content가 매번 PK 조회로 채웁니다.
+"""
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import record_cache
+from app.models.base import get_async_session_maker
+from app.models.main_topic import MainTopic
+from app.models.sub_topic import SubTopic
+from app.models.subject import Subject
+
+# ADsP 전용 구조: subject_id는 항상 1 (ADsP)
+ADSP_SUBJECT_ID = 1
+
+# 커밋 시 캐시를 무효화해야 하는 세션 표시 (session.info 키)
+_DIRTY_KEY = "taxonomy_cache_dirty"
+_TAXONOMY_MODELS = (Subject, MainTopic, SubTopic)
+
+
+@dataclass(frozen=True)
+class CachedSubject:
+    """캐시된 과목"""
+    id: int
+    name: str
+    description: str | None
+
+
+@dataclass(frozen=True)
+class CachedMainTopic:
+    """캐시된 주요항목 (ORM과 같은 속성 경로: main_topic.subject.name)"""
+    id: int
+    subject_id: int
+    name: str
+    description: str | None
+    subject: CachedSubject
+
+
+@dataclass(frozen=True)
+class CachedSubTopic:
+    """캐시된 세부항목 (카테고리 경로 포함)
+
+    updated_at/core_content_count/source_type은 캐시에 보관하지 않으며,
+    get_sub_topic_with_core_content에서 DB 값으로 채워 반환합니다.
+    """
+    id: int
+    main_topic_id: int
+    name: str
+    description: str | None
+    main_topic: CachedMainTopic
+    category_path: str
+    updated_at: datetime | None = None
+    core_content_count: int = 0
+    source_type: str | None = None
+
+
+@dataclass(frozen=True)
+class TaxonomySnapshot:
+    """특정 버전에서 읽은 분류 체계"""
+    version: int
+    loaded_at: float
+    # 적재 직전의 테이블별 (행 수, max(updated_at)) (다른 프로세스의 변경 감지용)
+    fingerprint: tuple = ()
+    subjects: dict[int, CachedSubject] = field(default_factory=dict)
+    main_topics: dict[int, CachedMainTopic] = field(default_factory=dict)
+    sub_topics: dict[int, CachedSubTopic] = field(default_factory=dict)
+
+
+class TaxonomyCache:
+    """버전 기반 프로세스 로컬 분류 체계 캐시"""
+
+    def __init__(self, session_factory: Callable[[], AsyncSession] | None = None) -> None:
+        self.session_factory = session_factory
+        self._version = 0
+        self._snapshot: TaxonomySnapshot | None = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def is_warm(self) -> bool:
+        """현재 버전의 스냅샷이 적재되어 있는지 (다음 조회가 DB를 거치지 않는지)"""
+        return self._is_fresh(self._snapshot)
+
+    def invalidate(self) -> None:
+        """버전을 올려 다음 조회 때 다시 읽도록 표시"""
+        self._version += 1
+
+    def clear(self) -> None:
+        """캐시 비우기 (테스트용)"""
+        self._version += 1
+        self._snapshot = None
+        self._lock = asyncio.Lock()
+
+    def _session(self) -> AsyncSession:
+        factory = self.session_factory or get_async_session_maker()
+        return factory()
+
+    def _is_fresh(self, snapshot: TaxonomySnapshot | None) -> bool:
+        return (
+            snapshot is not None
+            and snapshot.version == self._version
+            and time.monotonic() - snapshot.loaded_at < settings.taxonomy_cache_ttl
+        )
+
+    def _needs_check(self) -> bool:
+        return time.monotonic() - self._checked_at >= settings.taxonomy_cache_check_interval
+
+    async def get(self) -> TaxonomySnapshot:
+        """현재 버전의 분류 체계 반환 (오래되었거나 다른 프로세스가 바꿨으면 한 요청만 다시 읽음)"""
+        snapshot = self._snapshot
+        if self._is_fresh(snapshot) and not self._needs_check():
+            record_cache("taxonomy", hit=True)
+            return snapshot
+        async with self._lock:
+            snapshot = self._snapshot
+            if self._is_fresh(snapshot):
+                if not self._needs_check():
+                    record_cache("taxonomy", hit=True)
+                    return snapshot
+                async with self._session() as session:
+                    fingerprint = await _load_fingerprint(session)
+                self._checked_at = time.monotonic()
+                if fingerprint == snapshot.fingerprint:
+                    record_cache("taxonomy", hit=True)
+                    return snapshot
+            record_cache("taxonomy", hit=False)
+            # 읽는 도중 무효화되면 이전 버전으로 기록되어 다음 조회 때 다시 읽음
+            version = self._version
+            async with self._session() as session:
+                snapshot = await _load_snapshot(session, version)
+            self._snapshot = snapshot
+            self._checked_at = snapshot.loaded_at
+            return snapshot
+
+
+taxonomy_cache = TaxonomyCache()
+
+
+async def _load_fingerprint(session: AsyncSession) -> tuple:
+    """세 테이블의 행 수와 max(updated_at)을 한 번의 쿼리로 조회 (삭제는 행 수로 감지)"""
+    columns = []
+    for model in _TAXONOMY_MODELS:
+        columns.append(select(func.count()).select_from(model).scalar_subquery())
+        columns.append(select(func.max(model.updated_at)).scalar_subquery())
+    result = await session.execute(select(*columns))
+    return tuple(result.one())
+
+
+async def _load_snapshot(session: AsyncSession, version: int) -> TaxonomySnapshot:
+    """분류 체계 세 테이블을 join 없이 읽어 카테고리 경로까지 구성
+
+    변경 감지값은 먼저 읽으므로 읽는 도중의 변경은 다음 확인 때 다시 읽게 됩니다.
+    """
+    fingerprint = await _load_fingerprint(session)
+    subject_rows = await session.execute(
+        select(Subject.id, Subject.name, Subject.description)
+    )
+    subjects = {
+        row.id: CachedSubject(id=row.id, name=row.name, description=row.description)
+        for row in subject_rows
+    }
+
+    main_topic_rows = await session.execute(
+        select(MainTopic.id, MainTopic.subject_id, MainTopic.name, MainTopic.description)
+    )
+    main_topics = {
+        row.id: CachedMainTopic(
+            id=row.id,
+            subject_id=row.subject_id,
+            name=row.name,
+            description=row.description,
+            subject=subjects[row.subject_id],
+        )
+        for row in main_topic_rows
+        if row.subject_id in subjects
+    }
+
+    sub_topic_rows = await session.execute(
+        select(SubTopic.id, SubTopic.main_topic_id, SubTopic.name, SubTopic.description)
+    )
+    sub_topics = {}
+    for row in sub_topic_rows:
+        main_topic = main_topics.get(row.main_topic_id)
+        if main_topic is None:
+            continue
+        sub_topics[row.id] = CachedSubTopic(
+            id=row.id,
+            main_topic_id=row.main_topic_id,
+            name=row.name,
+            description=row.description,
+            main_topic=main_topic,
+            category_path=f"{main_topic.subject.name} > {main_topic.name} > {row.name}",
+        )
+
+    return TaxonomySnapshot(
+        version=version,
+        loaded_at=time.monotonic(),
+        fingerprint=fingerprint,
+        subjects=subjects,
+        main_topics=main_topics,
+        sub_topics=sub_topics,
+    )
+
+
+async def get_subject(subject_id: int) -> CachedSubject | None:
+    """ID로 과목 조회 (캐시)"""
+    snapshot = await taxonomy_cache.get()
+    return snapshot.subjects.get(subject_id)
+
+
+async def get_sub_topic(sub_topic_id: int) -> CachedSubTopic | None:
+    """ID로 세부항목 조회 (캐시, 주요항목/과목 및 카테고리 경로 포함)
+
+    다른 프로세스에서 추가되어 캐시에 없으면 한 번 다시 읽습니다.
+    """
+    snapshot = await taxonomy_cache.get()
+    sub_topic = snapshot.sub_topics.get(sub_topic_id)
+    if sub_topic is None and snapshot.version == taxonomy_cache.version:
+        taxonomy_cache.invalidate()
+        snapshot = await taxonomy_cache.get()
+        sub_topic = snapshot.sub_topics.get(sub_topic_id)
+    return sub_topic
+
+
+async def get_sub_topics(subject_id: int = ADSP_SUBJECT_ID) -> list[CachedSubTopic]:
+    """과목의 모든 세부항목 조회 (캐시, 주요항목 ID → 세부항목 ID 순)"""
+    snapshot = await taxonomy_cache.get()
+    return sorted(
+        (st for st in snapshot.sub_topics.values() if st.main_topic.subject_id == subject_id),
+        key=lambda st: (st.main_topic_id, st.id),
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_taxonomy_dirty(session: Session, flush_context) -> None:
+    """분류 체계 테이블에 쓰기가 있었던 세션 표시"""
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, _TAXONOMY_MODELS):
+            session.info[_DIRTY_KEY] = True
+            return
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_taxonomy_bulk_write(orm_execute_state) -> None:
+    """분류 체계 테이블 대상 ORM UPDATE/DELETE 표시"""
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ in _TAXONOMY_MODELS:
+        orm_execute_state.session.info[_DIRTY_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session: Session) -> None:
+    """분류 체계 쓰기가 커밋되면 캐시 무효화"""
+    if session.info.pop(_DIRTY_KEY, False):
+        taxonomy_cache.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session: Session) -> None:
+    """롤백된 쓰기는 무효화하지 않음"""
+    session.info.pop(_DIRTY_KEY, None)
@@ -0,0 +1,174 @@
+"""YouTube 자막 캐시
+
+같은 영상으로 문제 생성/핵심 정보 자동 분류를 다시 요청해도 자막 API를 호출하지 않도록
+(video_id, 요청 언어) 단위로 자막을 저장합니다.
+- 프로세스 로컬 LRU(transcript_cache_memory_size개) → youtube_transcripts 테이블 순으로 조회
+- 자막 없음(자막 비활성화/해당 언어 없음) 결과도 더 짧은 TTL로 저장 (negative cache)
+- 네트워크 오류 등 일시적 실패는 저장하지 않음
+- DB 조회/저장은 캐시가 직접 여는 짧은 세션으로 수행 (요청 세션의 트랜잭션을 자막 추출 동안
+  열어 두거나 요청 세션을 커밋/롤백하지 않음), DB 계층 실패는 경고만 남기고 캐시 미스로 처리
+- 만료된 행은 작업 워커의 주기적 정리(purge_expired_transcripts)로 삭제 (expires_at 인덱스 사용)
+"""
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from sqlalchemy import delete
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import record_cache
+from app.models.base import get_async_session_maker
+from app.models.youtube_transcript import YoutubeTranscript
+
+logger = logging.getLogger(__name__)
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite는 timezone 정보 없이 돌려주므로 UTC로 간주
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True)
+class CachedTranscript:
+    """캐시된 자막 조회 결과 (transcript가 None이면 자막 없음)"""
+    transcript: str | None
+    error: str | None
+    expires_at: datetime
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at <= _now()
+
+
+def _new_entry(transcript: str | None, error: str | None) -> CachedTranscript:
+    """새 조회 결과 (자막 없음이면 transcript_negative_cache_ttl 적용)"""
+    ttl = settings.transcript_cache_ttl if transcript is not None else settings.transcript_negative_cache_ttl
+    return CachedTranscript(transcript, error, _now() + timedelta(seconds=ttl))
+
+
+async def get_transcript(
+    session: AsyncSession,
+    video_id: str,
+    languages: str,
+) -> CachedTranscript | None:
+    """만료되지 않은 저장 결과 조회"""
+    row = await session.get(YoutubeTranscript, (video_id, languages))
+    if row is None:
+        return None
+    cached = CachedTranscript(row.transcript, row.error, _as_utc(row.expires_at))
+    return None if cached.expired else cached
+
+
+async def save_transcript(
+    session: AsyncSession,
+    video_id: str,
+    languages: str,
+    transcript: str | None,
+    error: str | None = None,
+) -> CachedTranscript:
+    """조회 결과 저장 (커밋은 호출자가 수행)"""
+    cached = _new_entry(transcript, error)
+    await session.merge(YoutubeTranscript(
+        video_id=video_id,
+        languages=languages,
+        transcript=transcript,
+        error=error,
+        expires_at=cached.expires_at,
+    ))
+    return cached
+
+
+async def purge_expired_transcripts(session: AsyncSession) -> int:
+    """만료된 저장 결과 삭제 후 삭제한 행 수 반환 (커밋은 호출자가 수행)"""
+    result = await session.execute(
+        delete(YoutubeTranscript)
+        .where(YoutubeTranscript.expires_at < _now())
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+class TranscriptCache:
+    """LRU(프로세스 로컬) + DB 2단계 자막 캐시"""
+
+    def __init__(
+        self,
+        max_size: int | None = None,
+        session_factory: Callable[[], AsyncSession] | None = None,
+    ) -> None:
+        self._max_size = max_size
+        self.session_factory = session_factory
+        self._entries: OrderedDict[tuple[str, str], CachedTranscript] = OrderedDict()
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size if self._max_size is not None else settings.transcript_cache_memory_size
+
+    def clear(self) -> None:
+        """캐시 비우기 (테스트용)"""
+        self._entries.clear()
+
+    def _session(self) -> AsyncSession:
+        factory = self.session_factory or get_async_session_maker()
+        return factory()
+
+    def _remember(self, key: tuple[str, str], cached: CachedTranscript) -> None:
+        self._entries[key] = cached
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def get(self, video_id: str, languages: str) -> CachedTranscript | None:
+        """메모리 → DB 순으로 조회 (DB에서 찾으면 메모리에 적재)"""
+        key = (video_id, languages)
+        cached = self._entries.get(key)
+        if cached is not None and not cached.expired:
+            self._entries.move_to_end(key)
+            record_cache("transcript_memory", hit=True)
+            return cached
+        self._entries.pop(key, None)
+        record_cache("transcript_memory", hit=False)
+
+        try:
+            async with self._session() as session:
+                cached = await get_transcript(session, video_id, languages)
+        except Exception as e:
+            logger.warning(f"자막 캐시 조회 실패: video_id={video_id}, 에러={e.__class__.__name__}")
+            return None
+        record_cache("transcript_db", hit=cached is not None)
+        if cached is not None:
+            self._remember(key, cached)
+        return cached
+
+    async def put(
+        self,
+        video_id: str,
+        languages: str,
+        transcript: str | None,
+        error: str | None = None,
+    ) -> CachedTranscript:
+        """DB와 메모리에 저장 (DB 저장에 실패해도 메모리에는 저장)"""
+        try:
+            async with self._session() as session:
+                cached = await save_transcript(session, video_id, languages, transcript, error)
+                try:
+                    await session.commit()
+                except IntegrityError:
+                    # 다른 요청이 같은 영상을 먼저 저장
+                    await session.rollback()
+        except Exception as e:
+            logger.warning(f"자막 캐시 저장 실패: video_id={video_id}, 에러={e.__class__.__name__}")
+            cached = _new_entry(transcript, error)
+        self._remember((video_id, languages), cached)
+        return cached
+
+
+transcript_cache = TranscriptCache()
@@ -24,6 +24,27 @@ class GeminiAPIKeyError(BaseAppError):
         super().__init__(message, status_code=403)
 
 
+class TranscriptUnavailableError(BaseAppError):
+    """YouTube 자막 서버 일시적 장애/응답 지연 에러 (503)"""
+
+    def __init__(self, message: str = "YouTube 자막을 일시적으로 가져올 수 없습니다. 잠시 후 다시 시도해주세요."):
+        super().__init__(message, status_code=503)
+
+
+class DeadlineExceededError(BaseAppError):
+    """요청 처리 예산(데드라인) 초과 에러 (504)"""
+
+    def __init__(self, message: str = "요청 처리 시간이 초과되었습니다. 잠시 후 다시 시도해주세요."):
+        super().__init__(message, status_code=504)
+
+
+class QueryBudgetExceededError(BaseAppError):
+    """요청당 SQL 쿼리 예산 초과 에러 (500, development 환경의 N+1 감지용)"""
+
+    def __init__(self, message: str):
+        super().__init__(f"쿼리 예산 초과: {message}", status_code=500)
+
+
 class QuizNotFoundError(BaseAppError):
     """문제를 찾을 수 없을 때 발생하는 예외 (404)"""
     
@@ -45,6 +66,13 @@ class ExamSessionNotFoundError(BaseAppError):
         super().__init__(f"시험 기록을 찾을 수 없습니다: {exam_session_id}", status_code=404)
 
 
+class JobNotFoundError(BaseAppError):
+    """비동기 작업을 찾을 수 없을 때 발생하는 예외 (404)"""
+    
+    def __init__(self, job_id: str):
+        super().__init__(f"작업을 찾을 수 없습니다: {job_id}", status_code=404)
+
+
 class InvalidQuizRequestError(BaseAppError):
     """잘못된 문제 요청일 때 발생하는 예외 (400)"""
     
@@ -1,25 +1,78 @@
+import asyncio
+import contextlib
 import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import PlainTextResponse
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy import text
 
-from app.api.v1 import core_content, exam, main_topics, quiz, subjects, sub_topics, wrong_answers
+from app.api.v1 import admin, core_content, exam, jobs, main_topics, quiz, subjects, sub_topics, wrong_answers
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
+from app.core.db_pool import pool_metric_families
+from app.core.instrumentation import QueryBudget, RequestInstrumentationMiddleware, monitor_event_loop_lag
 from app.core.logging import setup_logging
+from app.core.metrics import registry
+from app.core.responses import FastJSONResponse
 from app.exceptions import BaseAppError
-from app.models.base import get_engine
+from app.models.base import get_created_engine, get_engine
+from app.services.job_service import job_worker_pool
+from app.services.readiness_service import check_readiness
+from app.services.warmup_service import run_startup_prewarm
+from app.services.youtube_service import shutdown_transcript_pool
 
 # 로깅 설정
 setup_logging()
 logger = logging.getLogger(__name__)
 
+# Prometheus 텍스트 노출 형식
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def collect_pool_metrics() -> list:
+    """primary 엔진의 커넥션 풀 메트릭 (아직 엔진이 없으면 생략)"""
+    engine = get_created_engine()
+    if engine is None:
+        return []
+    return pool_metric_families(engine.pool)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """시작 준비 작업 후 비동기 작업 워커와 이벤트 루프 지연 측정 태스크 시작/종료 (종료 시 자막 스레드 풀 정리)"""
+    await run_startup_prewarm()
+    await job_worker_pool.start()
+    lag_task = None
+    if settings.metrics_enabled:
+        lag_task = asyncio.create_task(monitor_event_loop_lag(settings.event_loop_lag_interval))
+    try:
+        yield
+    finally:
+        if lag_task is not None:
+            lag_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await lag_task
+        await job_worker_pool.stop()
+        shutdown_transcript_pool()
+
+
 app = FastAPI(
     title="ADsP Quiz Backend API",
     description="ADsP 퀴즈 생성 및 시험 관리 백엔드 API",
     version="0.1.0",
+    lifespan=lifespan,
+)
+
+# 응답 압축 (CORS보다 먼저 등록해 안쪽에서 동작, 예외 핸들러 응답도 압축 대상)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_minimum_size,
+    gzip_level=settings.compression_gzip_level,
+    brotli_quality=settings.compression_brotli_quality,
 )
 
 app.add_middleware(
@@ -30,6 +83,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 가장 바깥에서 동작하도록 마지막에 등록 (CORS preflight/압축 시간까지 포함)
+app.add_middleware(
+    RequestInstrumentationMiddleware,
+    record_metrics=settings.metrics_enabled,
+    server_timing=settings.server_timing_enabled,
+    query_budget=QueryBudget(
+        max_queries=settings.query_budget_max_queries,
+        repeat_limit=settings.query_budget_repeat_limit,
+        mode=settings.query_budget_mode,
+    ),
+)
+if settings.metrics_enabled:
+    registry.register_collector(collect_pool_metrics)
+
 app.include_router(quiz.router, prefix="/api/v1")
 app.include_router(exam.router, prefix="/api/v1")
 app.include_router(subjects.router, prefix="/api/v1")
@@ -38,15 +105,17 @@ app.include_router(sub_topics.router, prefix="/api/v1")
 app.include_router(core_content.router, prefix="/api/v1")
 app.include_router(core_content.admin_router, prefix="/api/v1")
 app.include_router(wrong_answers.router, prefix="/api/v1")
+app.include_router(admin.router, prefix="/api/v1")
+app.include_router(jobs.router, prefix="/api/v1")
 
 
 def create_cors_response(
     status_code: int,
     content: dict,
     request: Request,
-) -> JSONResponse:
-    """CORS 헤더를 포함한 JSONResponse 생성"""
-    response = JSONResponse(
+) -> FastJSONResponse:
+    """CORS 헤더를 포함한 JSON 응답 생성"""
+    response = FastJSONResponse(
         status_code=status_code,
         content=content,
     )
@@ -188,10 +257,20 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """헬스 체크 엔드포인트"""
+    """헬스 체크 엔드포인트 (프로세스 생존 확인, 의존성은 확인하지 않음)"""
     return {"status": "healthy"}
 
 
+@app.get("/ready")
+async def readiness_check():
+    """준비 상태 확인 (DB 지연/풀 사용률 초과 시 503, 로드밸런서 트래픽 분산용)"""
+    ready, report = await check_readiness()
+    return FastJSONResponse(
+        status_code=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=report,
+    )
+
+
 @app.get("/health/db")
 async def health_check_db():
     """데이터베이스 연결 상태 확인"""
@@ -202,7 +281,15 @@ async def health_check_db():
         return {"status": "healthy", "database": "connected"}
     except Exception as e:
         logger.error(f"Database connection failed: {e}")
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             content={"status": "unhealthy", "database": "disconnected"},
         )
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 스크레이프 엔드포인트"""
+    if not settings.metrics_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    return PlainTextResponse(registry.render(), media_type=METRICS_CONTENT_TYPE)
@@ -1,4 +1,5 @@
 from app.models.base import Base, get_db
+from app.models.concurrency_lease import ConcurrencyLease
 from app.models.core_content_auto import (
     CoreContentAutoCandidate,
     CoreContentAutoOverride,
@@ -6,19 +7,25 @@ from app.models.core_content_auto import (
     CoreContentAutoSetting,
     CoreContentCategoryRule,
 )
+from app.models.core_content_item import CoreContentItem
 from app.models.exam_record import ExamRecord
+from app.models.job import Job
 from app.models.main_topic import MainTopic
 from app.models.quiz import Quiz
 from app.models.quiz_validation import QuizValidation
 from app.models.sub_topic import SubTopic
+from app.models.sub_topic_quiz_stats import SubTopicQuizStats
 from app.models.subject import Subject
 from app.models.wrong_answer import WrongAnswer
+from app.models.youtube_transcript import YoutubeTranscript
 
 __all__ = [
     "Base",
     "Subject",
     "MainTopic",
     "SubTopic",
+    "CoreContentItem",
+    "SubTopicQuizStats",
     "Quiz",
     "QuizValidation",
     "ExamRecord",
@@ -28,5 +35,8 @@ __all__ = [
     "CoreContentAutoRun",
     "CoreContentAutoCandidate",
     "CoreContentAutoOverride",
+    "Job",
+    "ConcurrencyLease",
+    "YoutubeTranscript",
     "get_db",
 ]
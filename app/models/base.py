@@ -1,23 +1,68 @@
+import itertools
+import logging
+import time
 from datetime import datetime
 from typing import AsyncGenerator
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime, func, make_url
+from sqlalchemy.exc import DBAPIError, TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 from app.core.config import settings
+from app.core.db_pool import InstrumentedAsyncPool
+from app.core.instrumentation import instrument_engine
+
+logger = logging.getLogger(__name__)
 
 _engine = None
 _async_session_maker = None
 
+# 읽기 복제본: [(url, session_maker)], 라운드 로빈 커서, 복제본별 제외 만료 시각
+_read_session_makers: list | None = None
+_read_cursor = itertools.count()
+_replica_down_until: dict[int, float] = {}
+
+# 세션이 복제본에 연결되었는지 표시하는 session.info 키
+READ_REPLICA_INFO_KEY = "read_replica"
+
+
+def create_engine_from_settings(database_url: str):
+    """Settings의 풀/캐시 설정으로 비동기 엔진 생성"""
+    url = make_url(database_url)
+    connect_args: dict = {}
+    if url.drivername == "postgresql+asyncpg":
+        # asyncpg 자체 캐시와 SQLAlchemy 어댑터 캐시를 같은 크기로 맞춤
+        connect_args["statement_cache_size"] = settings.db_statement_cache_size
+        url = url.update_query_dict(
+            {"prepared_statement_cache_size": str(settings.db_statement_cache_size)}
+        )
+
+    echo = settings.db_echo if settings.db_echo is not None else settings.environment == "development"
+    engine = create_async_engine(
+        url,
+        echo=echo,
+        poolclass=InstrumentedAsyncPool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        connect_args=connect_args,
+    )
+    instrument_engine(engine.sync_engine)
+    return engine
+
 
 def get_engine():
     global _engine
     if _engine is None:
-        _engine = create_async_engine(
-            settings.database_url,
-            echo=settings.environment == "development",
-        )
+        _engine = create_engine_from_settings(settings.database_url)
+    return _engine
+
+
+def get_created_engine():
+    """이미 생성된 primary 엔진 (메트릭 수집이 엔진을 새로 만들지 않도록 사용)"""
     return _engine
 
 
@@ -38,6 +83,69 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+def get_read_session_makers() -> list:
+    """복제본별 세션 메이커 목록 (설정이 없으면 빈 목록)"""
+    global _read_session_makers
+    if _read_session_makers is None:
+        _read_session_makers = [
+            async_sessionmaker(
+                create_engine_from_settings(url),
+                class_=AsyncSession,
+                expire_on_commit=False,
+            )
+            for url in settings.database_read_urls_list
+        ]
+    return _read_session_makers
+
+
+def mark_replica_down(index: int) -> None:
+    """복제본을 cooldown 동안 선택 대상에서 제외"""
+    _replica_down_until[index] = time.monotonic() + settings.read_replica_cooldown
+
+
+def choose_replica_order(replica_count: int) -> list[int]:
+    """라운드 로빈 시작점부터 사용 가능한 복제본 인덱스 순서 반환"""
+    if replica_count == 0:
+        return []
+    start = next(_read_cursor) % replica_count
+    now = time.monotonic()
+    order = [(start + offset) % replica_count for offset in range(replica_count)]
+    return [index for index in order if _replica_down_until.get(index, 0.0) <= now]
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """읽기 전용 세션 (복제본 라운드 로빈, 실패 시 다음 복제본 → primary 순으로 대체)
+
+    복제 지연이 있으므로 방금 쓴 데이터를 읽어야 하는 경로는 get_db를 사용합니다.
+    """
+    session_makers = get_read_session_makers()
+    for index in choose_replica_order(len(session_makers)):
+        session = session_makers[index]()
+        try:
+            # 연결 실패를 여기서 감지하기 위해 커넥션을 미리 획득
+            await session.connection()
+        except (DBAPIError, OSError, PoolTimeoutError) as e:
+            logger.warning(f"읽기 복제본 연결 실패, 다음 대상으로 전환: index={index}, error={e.__class__.__name__}")
+            mark_replica_down(index)
+            await session.close()
+            continue
+
+        session.info[READ_REPLICA_INFO_KEY] = True
+        try:
+            yield session
+        finally:
+            await session.close()
+        return
+
+    async with get_async_session_maker()() as session:
+        yield session
+
+
+def is_read_replica(session: AsyncSession) -> bool:
+    """세션이 복제본에 연결되어 있는지 여부 (복제 지연으로 인한 미조회 시 primary 재조회 판단용)"""
+    return bool(session.info.get(READ_REPLICA_INFO_KEY))
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -0,0 +1,16 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class ConcurrencyLease(Base):
+    """프로세스 간 동시 실행 슬롯 (name별 max_concurrent개 행, 만료된 임대는 다른 프로세스가 회수)"""
+    __tablename__ = "concurrency_leases"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    slot: Mapped[int] = mapped_column(Integer, primary_key=True)
+    holder: Mapped[str | None] = mapped_column(String(100), default=None)
+    expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None)
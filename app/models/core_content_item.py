@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, String, Text, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class CoreContentItem(Base):
+    """세부항목 핵심 정보 항목 (추가 시 한 행씩 INSERT, 수정/삭제 불가)"""
+    __tablename__ = "core_content_items"
+    __table_args__ = (
+        UniqueConstraint("sub_topic_id", "position", name="uq_core_content_items_sub_topic_id_position"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    sub_topic_id: Mapped[int] = mapped_column(
+        ForeignKey("sub_topics.id", ondelete="CASCADE"), nullable=False
+    )
+    position: Mapped[int] = mapped_column(nullable=False, comment="세부항목 내 추가 순번 (1부터, 클수록 최신)")
+    source_type: Mapped[str] = mapped_column(nullable=False, comment="소스 타입 (text | youtube_url)")
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False, comment="content의 SHA-256 (hex)")
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
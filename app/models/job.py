@@ -0,0 +1,24 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base, TimestampMixin
+
+
+class Job(Base, TimestampMixin):
+    __tablename__ = "jobs"
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)  # uuid4
+    job_type: Mapped[str] = mapped_column(String(50), nullable=False)  # 'generate_study', 'validate', 'correction'
+    status: Mapped[str] = mapped_column(String(20), nullable=False, index=True)  # 'queued', 'running', 'succeeded', 'failed'
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    result: Mapped[dict | None] = mapped_column(JSONB, default=None)
+    error: Mapped[dict | None] = mapped_column(JSONB, default=None)  # {"code", "detail"}
+    progress: Mapped[int] = mapped_column(Integer, nullable=False, default=0)  # 0-100
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    owner: Mapped[str | None] = mapped_column(String(100), default=None)  # 실행 중인 프로세스 ('host:pid:id')
+    lease_expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None)  # 실행 중 주기적으로 연장
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None)
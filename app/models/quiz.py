@@ -1,4 +1,8 @@
-from sqlalchemy import ForeignKey, Text
+import random
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin
@@ -6,17 +10,27 @@ from app.models.base import Base, TimestampMixin
 
 class Quiz(Base, TimestampMixin):
     __tablename__ = "quizzes"
+    __table_args__ = (
+        # 랜덤 샘플링용 (random_key 무작위 지점 범위 스캔)
+        Index("ix_quizzes_subject_id_random_key", "subject_id", "random_key"),
+        Index("ix_quizzes_sub_topic_id_random_key", "sub_topic_id", "random_key"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     subject_id: Mapped[int] = mapped_column(ForeignKey("subjects.id"), nullable=False)
     sub_topic_id: Mapped[int | None] = mapped_column(ForeignKey("sub_topics.id"), nullable=True, index=True)
     question: Mapped[str] = mapped_column(Text, nullable=False)
-    options: Mapped[str] = mapped_column(Text, nullable=False)
+    # [{"index": 0, "text": "..."}, ...] (4지선다, 드라이버가 역직렬화하므로 응답 변환 시 재파싱 없음)
+    options: Mapped[list[dict]] = mapped_column(JSONB, nullable=False)
     correct_answer: Mapped[int] = mapped_column(nullable=False)
     explanation: Mapped[str | None] = mapped_column(Text, default=None)
     source_hash: Mapped[str] = mapped_column(nullable=False, unique=True, index=True)
     source_url: Mapped[str | None] = mapped_column(default=None)
     source_text: Mapped[str | None] = mapped_column(Text, default=None)
+    random_key: Mapped[float] = mapped_column(Float, nullable=False, default=random.random)
+    # 최신 검증 결과 비정규화 (quiz_validations 최신 행과 동기화, None이면 검증 이력 없음)
+    latest_validation_status: Mapped[str | None] = mapped_column(default=None, index=True)
+    latest_validated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None)
 
     subject: Mapped["Subject"] = relationship("Subject", back_populates="quizzes")
     sub_topic: Mapped["SubTopic"] = relationship("SubTopic", back_populates="quizzes")
@@ -11,7 +11,10 @@ class SubTopic(Base, TimestampMixin):
     main_topic_id: Mapped[int] = mapped_column(ForeignKey("main_topics.id"), nullable=False)
     name: Mapped[str] = mapped_column(nullable=False)
     description: Mapped[str | None] = mapped_column(Text, default=None)
-    core_content: Mapped[str | None] = mapped_column(Text, default=None, comment="핵심 정보 텍스트")
+    core_content_count: Mapped[int] = mapped_column(
+        nullable=False, default=0, server_default="0",
+        comment="핵심 정보 항목 수 (core_content_items 다음 position 발급용)",
+    )
     source_type: Mapped[str | None] = mapped_column(default=None, comment="핵심 정보 소스 타입 (text | youtube_url)")
 
     main_topic: Mapped["MainTopic"] = relationship("MainTopic", back_populates="sub_topics")
@@ -0,0 +1,92 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, event, func, inspect, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+from app.models.quiz import Quiz
+
+
+class SubTopicQuizStats(Base):
+    """세부항목별 문제 재고 집계 (quizzes 변경 시 같은 트랜잭션에서 갱신)"""
+    __tablename__ = "sub_topic_quiz_stats"
+
+    sub_topic_id: Mapped[int] = mapped_column(
+        ForeignKey("sub_topics.id", ondelete="CASCADE"), primary_key=True
+    )
+    quiz_count: Mapped[int] = mapped_column(nullable=False, default=0, server_default="0")
+    latest_quiz_created_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None)
+    last_generation_attempt_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None)
+    consecutive_similarity_failures: Mapped[int] = mapped_column(
+        nullable=False, default=0, server_default="0",
+        comment="유사 문제 재시도 초과로 생성이 중단된 연속 횟수",
+    )
+
+
+def stats_upsert(dialect_name: str, values: dict):
+    """sub_topic_quiz_stats INSERT ... ON CONFLICT (dialect별 insert 선택)"""
+    insert = postgresql.insert if dialect_name == "postgresql" else sqlite.insert
+    return insert(SubTopicQuizStats.__table__).values(**values)
+
+
+def _recalculate(connection, sub_topic_id: int) -> None:
+    """세부항목의 문제 수/최신 생성 시각을 quizzes에서 다시 계산 (재배치/삭제 시)"""
+    table = SubTopicQuizStats.__table__
+    quizzes = Quiz.__table__
+    stmt = stats_upsert(connection.dialect.name, {
+        "sub_topic_id": sub_topic_id,
+        "quiz_count": select(func.count()).where(quizzes.c.sub_topic_id == sub_topic_id).scalar_subquery(),
+        "latest_quiz_created_at": (
+            select(func.max(quizzes.c.created_at)).where(quizzes.c.sub_topic_id == sub_topic_id).scalar_subquery()
+        ),
+    })
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.sub_topic_id],
+        set_={
+            "quiz_count": stmt.excluded.quiz_count,
+            "latest_quiz_created_at": stmt.excluded.latest_quiz_created_at,
+        },
+    )
+    connection.execute(stmt)
+
+
+@event.listens_for(Quiz, "after_insert")
+def _quiz_inserted(mapper, connection, target: Quiz) -> None:
+    """문제 생성 시 문제 수 +1, 최신 생성 시각 갱신"""
+    if target.sub_topic_id is None:
+        return
+    table = SubTopicQuizStats.__table__
+    # created_at은 server_default이므로 명시되지 않았으면 같은 트랜잭션의 now() 사용
+    created_at = target.__dict__.get("created_at") or func.now()
+    stmt = stats_upsert(connection.dialect.name, {
+        "sub_topic_id": target.sub_topic_id,
+        "quiz_count": 1,
+        "latest_quiz_created_at": created_at,
+    })
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.sub_topic_id],
+        set_={
+            "quiz_count": table.c.quiz_count + 1,
+            "latest_quiz_created_at": stmt.excluded.latest_quiz_created_at,
+        },
+    )
+    connection.execute(stmt)
+
+
+@event.listens_for(Quiz, "after_update")
+def _quiz_updated(mapper, connection, target: Quiz) -> None:
+    """세부항목 재배치 시 이전/새 세부항목 모두 재계산"""
+    history = inspect(target).attrs.sub_topic_id.history
+    if not history.has_changes():
+        return
+    for sub_topic_id in {*history.deleted, *history.added}:
+        if sub_topic_id is not None:
+            _recalculate(connection, sub_topic_id)
+
+
+@event.listens_for(Quiz, "after_delete")
+def _quiz_deleted(mapper, connection, target: Quiz) -> None:
+    """문제 삭제 시 세부항목 재계산"""
+    if target.sub_topic_id is not None:
+        _recalculate(connection, target.sub_topic_id)
@@ -0,0 +1,16 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base, TimestampMixin
+
+
+class YoutubeTranscript(Base, TimestampMixin):
+    __tablename__ = "youtube_transcripts"
+
+    video_id: Mapped[str] = mapped_column(String(20), primary_key=True)
+    languages: Mapped[str] = mapped_column(String(50), primary_key=True)  # 요청한 자막 언어 우선순위 (예: 'ko,en')
+    transcript: Mapped[str | None] = mapped_column(Text, default=None)  # None이면 자막 없음 (negative cache)
+    error: Mapped[str | None] = mapped_column(Text, default=None)  # 자막이 없을 때의 안내 메시지
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)  # 만료 행 정리용
@@ -0,0 +1,22 @@
+from pydantic import BaseModel, Field
+
+
+class HistogramSnapshot(BaseModel):
+    """누적 버킷 히스토그램 스냅샷"""
+    buckets: dict[str, int] = Field(..., description="버킷 상한(초)별 누적 관측 수")
+    sum: float
+    count: int
+
+
+class PoolMetricsResponse(BaseModel):
+    """커넥션 풀 메트릭 응답 스키마"""
+    pool_class: str
+    pool_size: int | None = None
+    checked_out: int | None = Field(None, description="현재 사용 중인 커넥션 수")
+    checked_in: int | None = Field(None, description="풀에서 대기 중인 커넥션 수")
+    overflow: int | None = Field(None, description="pool_size를 초과해 생성된 커넥션 수")
+    max_overflow: int | None = None
+    checkouts: int = 0
+    timeouts: int = Field(0, description="커넥션 대기 타임아웃 횟수")
+    connect_errors: int = Field(0, description="커넥션 생성/획득 실패 횟수")
+    wait_time: HistogramSnapshot | None = Field(None, description="커넥션 획득 대기 시간(초)")
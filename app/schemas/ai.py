@@ -23,10 +23,9 @@ class AIQuizGenerationResponse(BaseModel):
     explanation: str = Field(..., description="해설")
 
     @property
-    def options_json(self) -> str:
-        """선택지를 JSON 문자열로 변환 (DB 저장용, 오답 풀 포함)"""
-        import json
-        return json.dumps([{"index": opt.index, "text": opt.text} for opt in self.options], ensure_ascii=False)
+    def options_data(self) -> list[dict]:
+        """선택지를 dict 리스트로 변환 (DB JSONB 저장용, 오답 풀 포함)"""
+        return [{"index": opt.index, "text": opt.text} for opt in self.options]
     
     def get_correct_option(self) -> AIQuizOption:
         """정답 선택지 반환"""
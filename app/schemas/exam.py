@@ -18,6 +18,18 @@ class ExamSubmitRequest(BaseModel):
     user_answer: int = Field(..., ge=0, le=3, description="사용자 답안 (0-3)")
 
 
+class ExamAnswer(BaseModel):
+    """일괄 제출 답안 항목 스키마"""
+    quiz_id: int = Field(..., description="문제 ID")
+    user_answer: int = Field(..., ge=0, le=3, description="사용자 답안 (0-3)")
+
+
+class ExamSubmitBatchRequest(BaseModel):
+    """답안 일괄 제출 요청 스키마"""
+    exam_session_id: str = Field(..., description="시험 세션 ID")
+    answers: list[ExamAnswer] = Field(..., min_length=1, max_length=50, description="답안 목록 (최대 50개)")
+
+
 class ExamRecordResponse(BaseModel):
     """시험 기록 응답 스키마"""
     id: int
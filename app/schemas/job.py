@@ -0,0 +1,27 @@
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class JobError(BaseModel):
+    """작업 실패 정보 (예외 핸들러 응답과 같은 code/detail 형식)"""
+    code: str
+    detail: str
+    status_code: int = Field(500, description="동기 요청이었다면 반환되었을 HTTP 상태 코드")
+
+
+class JobResponse(BaseModel):
+    """비동기 작업 상태 응답 스키마"""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    job_type: str = Field(..., description="작업 종류 (generate_study, validate, correction)")
+    status: str = Field(..., description="작업 상태 (queued, running, succeeded, failed)")
+    progress: int = Field(..., ge=0, le=100, description="진행률 (%)")
+    result: dict[str, Any] | None = Field(None, description="완료된 작업의 결과 (동기 API 응답과 같은 형식)")
+    error: JobError | None = Field(None, description="실패한 작업의 오류")
+    attempts: int = Field(0, description="실행 시도 횟수 (재시작 후 재개 시 증가)")
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
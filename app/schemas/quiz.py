@@ -1,5 +1,3 @@
-import json
-import random
 from datetime import datetime
 from typing import Literal
 
@@ -122,80 +120,40 @@ class QuizResponse(BaseModel):
 
     model_config = {"from_attributes": True}
 
+    @classmethod
+    def from_quiz(
+        cls,
+        quiz,
+        validation_status: str | None = "pending",
+        *,
+        hide_answer: bool = False,
+    ) -> "QuizResponse":
+        """DB에서 읽은 Quiz 행으로 바로 생성
+
+        선택지는 JSONB로 이미 역직렬화되어 있어 재파싱하지 않습니다.
+        pydantic v2에서는 model_construct(파이썬 구현, 선택지마다 호출)보다 dict 한 번 검증
+        (Rust 구현)이 빠르므로 model_validate를 사용합니다
+        (scripts/test/benchmark-json-response.py의 "응답 생성" 항목 참고).
+        """
+        return cls.model_validate({
+            "id": quiz.id,
+            "subject_id": quiz.subject_id,
+            "question": quiz.question,
+            "options": quiz.options,
+            "correct_answer": None if hide_answer else quiz.correct_answer,
+            "explanation": quiz.explanation,
+            "source_url": quiz.source_url,
+            "created_at": quiz.created_at,
+            "validation_status": validation_status,
+        })
+
     @model_validator(mode="before")
     @classmethod
-    def parse_options(cls, data):
-        """DB의 JSON 문자열 options를 리스트로 변환 및 4지선다 제한 (기존 데이터 호환성)"""
-        # SQLAlchemy 모델 객체인 경우 딕셔너리로 변환
-        if not isinstance(data, dict):
-            # SQLAlchemy 모델 객체의 속성을 딕셔너리로 변환
-            data = {
-                "id": getattr(data, "id", None),
-                "subject_id": getattr(data, "subject_id", None),
-                "question": getattr(data, "question", None),
-                "options": getattr(data, "options", None),
-                "correct_answer": getattr(data, "correct_answer", None),
-                "explanation": getattr(data, "explanation", None),
-                "source_url": getattr(data, "source_url", None),
-                "created_at": getattr(data, "created_at", None),
-                "validation_status": getattr(data, "validation_status", None),
-            }
-            
-            # validation_status가 없으면 기본값 "pending" 설정
-            if "validation_status" not in data or data.get("validation_status") is None:
-                data["validation_status"] = "pending"
-        
-        # options 필드가 문자열(JSON)인 경우 리스트로 변환
-        if isinstance(data, dict) and "options" in data:
-            options_str = data.get("options")
-            if isinstance(options_str, str):
-                try:
-                    options_list = json.loads(options_str)
-                    data["options"] = [
-                        QuizOptionResponse.model_validate(opt) if isinstance(opt, dict) else opt
-                        for opt in options_list
-                    ]
-                except (json.JSONDecodeError, TypeError):
-                    data["options"] = []
-        
-        # 4지선다 제한 로직 (기존 데이터 호환성: 7개 선택지 → 4개로 제한)
-        if isinstance(data, dict) and "options" in data and isinstance(data["options"], list):
-            options = data["options"]
-            correct_answer = data.get("correct_answer")
-            
-            # 선택지가 4개보다 많으면 4개로 제한
-            if len(options) > 4:
-                # 정답 선택지 찾기
-                if correct_answer is not None and 0 <= correct_answer < len(options):
-                    correct_option = options[correct_answer]
-                    # 오답 선택지 추출
-                    wrong_options = [opt for i, opt in enumerate(options) if i != correct_answer]
-                    # 오답 중에서 랜덤으로 3개 선택
-                    if len(wrong_options) >= 3:
-                        selected_wrong_options = random.sample(wrong_options, 3)
-                    else:
-                        selected_wrong_options = wrong_options
-                    
-                    # 정답 1개 + 오답 3개 = 4개 구성
-                    new_options = [correct_option] + selected_wrong_options
-                    # 인덱스를 0-3으로 재매핑 (새 객체 생성)
-                    data["options"] = [
-                        QuizOptionResponse(index=i, text=opt.text)
-                        for i, opt in enumerate(new_options)
-                    ]
-                    # correct_answer는 항상 0 (정답이 첫 번째에 위치)
-                    data["correct_answer"] = 0
-                else:
-                    # 정답 인덱스가 유효하지 않으면 처음 4개만 사용
-                    data["options"] = options[:4]
-                    for i, opt in enumerate(data["options"]):
-                        opt.index = i
-                    if correct_answer is not None and correct_answer < 4:
-                        data["correct_answer"] = correct_answer
-                    else:
-                        data["correct_answer"] = 0
-        
-        return data
+    def from_orm_quiz(cls, data):
+        """SQLAlchemy Quiz 객체(예: ExamRecord.quiz)는 from_quiz로 변환 (validation_status 기본값 pending)"""
+        if isinstance(data, (dict, cls)):
+            return data
+        return cls.from_quiz(data)
 
 
 class QuizListResponse(BaseModel):
@@ -204,6 +162,28 @@ class QuizListResponse(BaseModel):
     total: int
 
 
+# 한 번에 조회할 수 있는 문제 수 (GET은 URL 길이 제한으로 더 작게)
+MAX_BATCH_QUIZ_IDS_QUERY = 100
+MAX_BATCH_QUIZ_IDS_BODY = 500
+
+
+class QuizBatchRequest(BaseModel):
+    """문제 일괄 조회 요청 스키마 (긴 ID 목록용 POST 본문)"""
+    ids: list[int] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_QUIZ_IDS_BODY,
+        description=f"조회할 문제 ID 목록 (최대 {MAX_BATCH_QUIZ_IDS_BODY}개, 응답은 이 순서를 따름)",
+    )
+
+
+class QuizBatchResponse(BaseModel):
+    """문제 일괄 조회 응답 스키마"""
+    quizzes: list[QuizResponse] = Field(..., description="요청한 순서의 문제 목록 (중복 ID는 한 번만)")
+    total: int
+    missing_ids: list[int] = Field(default_factory=list, description="존재하지 않는 문제 ID")
+
+
 class StudyModeQuizListResponse(BaseModel):
     """학습 모드 문제 목록 응답 스키마"""
     quizzes: list[QuizResponse]
@@ -262,4 +242,8 @@ class QuizDashboardResponse(BaseModel):
     category_status: dict[str, str] = Field(..., description="카테고리별 상태 (normal: 정상, insufficient: 부족, production_difficult: 생산 어려움)")
     validation_status: dict[str, int] = Field(..., description="검증 상태별 개수 (valid, pending, invalid)")
     recent_quizzes: list[QuizResponse] = Field(..., description="최근 생성된 문제 목록")
-    quizzes_needing_validation: list[QuizResponse] = Field(..., description="검증이 필요한 문제 목록")
+    quizzes_needing_validation: list[QuizResponse] = Field(..., description="검증이 필요한 문제 목록 (현재 페이지)")
+    quizzes_needing_validation_total: int = Field(..., description="검증이 필요한 문제 전체 개수")
+    validation_page: int = Field(..., description="검증 필요 문제 페이지 번호")
+    validation_limit: int = Field(..., description="검증 필요 문제 페이지당 항목 수")
+    validation_total_pages: int = Field(..., description="검증 필요 문제 전체 페이지 수")
@@ -14,12 +14,14 @@ from app.services.youtube_service import (
     extract_transcript,
     extract_video_id,
     generate_hash,
+    get_transcript,
 )
 
 __all__ = [
     "extract_transcript",
     "extract_video_id",
     "generate_hash",
+    "get_transcript",
     "generate_quiz",
     "vary_quiz",
     "generate_quiz_service",
@@ -3,26 +3,33 @@ import json
 import logging
 import os
 import random
+import time
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
 
-from google import genai
-from google.genai import types
-from google.genai.errors import ServerError, ClientError
-
+from app.core import deadline, metrics
 from app.core.config import settings
-from app.exceptions import GeminiServiceUnavailableError, GeminiAPIKeyError
+from app.exceptions import DeadlineExceededError, GeminiServiceUnavailableError, GeminiAPIKeyError
 from app.schemas.ai import AIQuizGenerationRequest, AIQuizGenerationResponse
+from app.services.concurrency_limiter import ConcurrencyLimiter, LeaseLimiter, LocalLimiter
+
+if TYPE_CHECKING:
+    from google import genai
 
 logger = logging.getLogger(__name__)
 
-_gemini_client: genai.Client | None = None
+# google.genai는 import에 수백 ms가 걸리므로 실제 호출 시점에 import (서버 시작 시간 단축)
+_gemini_client: "genai.Client | None" = None
 # 동시 Gemini API 요청 수 제한 (과부하 방지)
-_gemini_semaphore: asyncio.Semaphore | None = None
+_gemini_limiter: ConcurrencyLimiter | None = None
 
 
-def get_gemini_client() -> genai.Client:
+def get_gemini_client() -> "genai.Client":
     """Gemini 클라이언트 싱글톤"""
     global _gemini_client
     if _gemini_client is None:
+        from google import genai
+
         api_key = settings.gemini_api_key or os.getenv("GEMINI_API_KEY")
         if not api_key:
             raise ValueError("GEMINI_API_KEY가 설정되지 않았습니다")
@@ -30,21 +37,95 @@ def get_gemini_client() -> genai.Client:
     return _gemini_client
 
 
-def get_gemini_semaphore() -> asyncio.Semaphore:
-    """Gemini API 동시 요청 제한 Semaphore 싱글톤"""
-    global _gemini_semaphore
-    if _gemini_semaphore is None:
-        # 환경변수에서 동시 요청 수 가져오기 (기본값: 2)
-        max_concurrent = int(os.getenv("GEMINI_MAX_CONCURRENT", "2"))
-        _gemini_semaphore = asyncio.Semaphore(max_concurrent)
-        logger.info(f"Gemini API 동시 요청 제한 설정: 최대 {max_concurrent}개")
-    return _gemini_semaphore
+def get_gemini_limiter() -> ConcurrencyLimiter:
+    """Gemini API 동시 요청 제한 싱글톤 (gemini_limiter_backend에 따라 프로세스별/전체 프로세스 합계)"""
+    global _gemini_limiter
+    if _gemini_limiter is None:
+        max_concurrent = settings.gemini_max_concurrent
+        if settings.gemini_limiter_backend == "lease":
+            _gemini_limiter = LeaseLimiter(
+                "gemini",
+                max_concurrent,
+                lease_ttl=settings.gemini_lease_ttl,
+                poll_interval=settings.gemini_lease_poll_interval,
+            )
+        else:
+            _gemini_limiter = LocalLimiter(max_concurrent)
+        logger.info(
+            f"Gemini API 동시 요청 제한 설정: 최대 {max_concurrent}개 ({settings.gemini_limiter_backend})"
+        )
+    return _gemini_limiter
+
+
+@asynccontextmanager
+async def _gemini_slot(limiter: ConcurrencyLimiter):
+    """요청 데드라인 내에서 Gemini 동시 요청 슬롯 획득"""
+    try:
+        async with limiter.slot(timeout=deadline.get_remaining()):
+            yield
+    except asyncio.TimeoutError:
+        raise DeadlineExceededError("Gemini API 대기 중 요청 처리 시간이 초과되었습니다")
+
+
+def _gemini_outcome(error: BaseException | None) -> str:
+    """gemini_requests_total의 outcome 레이블"""
+    if error is None:
+        return "success"
+    if isinstance(error, DeadlineExceededError):
+        return "timeout"
+    from google.genai.errors import ClientError, ServerError
+    if isinstance(error, ServerError):
+        return "server_error"
+    if isinstance(error, ClientError):
+        return "client_error"
+    return "error"
+
+
+async def _call_gemini(client: "genai.Client", prompt: str, temperature: float, operation: str):
+    """Gemini API 호출 (operation별 호출 수/결과/소요 시간 기록)"""
+    deadline.ensure_time_left("Gemini API 호출")
+    start = time.perf_counter()
+    error: BaseException | None = None
+    try:
+        return await _run_gemini(client, prompt, temperature)
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        metrics.GEMINI_REQUESTS.labels(operation, _gemini_outcome(error)).inc()
+        metrics.GEMINI_REQUEST_DURATION.labels(operation).observe(time.perf_counter() - start)
+
+
+async def _run_gemini(client: "genai.Client", prompt: str, temperature: float):
+    """Gemini 동기 API를 executor에서 실행 (남은 데드라인으로 대기 시간 제한)"""
+    from google.genai import types
+
+    loop = asyncio.get_event_loop()
+    try:
+        return await asyncio.wait_for(
+            loop.run_in_executor(
+                None,
+                lambda: client.models.generate_content(
+                    model="gemini-2.5-flash",
+                    contents=prompt,
+                    config=types.GenerateContentConfig(
+                        temperature=temperature,
+                        response_mime_type="application/json",
+                    ),
+                )
+            ),
+            timeout=deadline.get_remaining(),
+        )
+    except asyncio.TimeoutError:
+        raise DeadlineExceededError("Gemini API 응답 대기 중 요청 처리 시간이 초과되었습니다")
 
 
 async def generate_quiz_with_gemini(request: AIQuizGenerationRequest) -> AIQuizGenerationResponse:
     """Gemini를 사용하여 문제 생성 (무료, 재시도 로직 포함, 동시 요청 제한)"""
+    from google.genai.errors import ClientError, ServerError
+
     client = get_gemini_client()
-    semaphore = get_gemini_semaphore()
+    limiter = get_gemini_limiter()
     
     # 카테고리 정보 구성
     category_info = request.subject_name
@@ -93,25 +174,14 @@ async def generate_quiz_with_gemini(request: AIQuizGenerationRequest) -> AIQuizG
     base_delay = 2.0  # 초기 대기 시간 증가 (1초 → 2초)
     max_delay = 16.0  # 최대 대기 시간 제한 (16초)
     
-    # Semaphore로 동시 요청 수 제한 (과부하 방지)
-    async with semaphore:
-        logger.debug(f"Gemini API 요청 시작 (동시 요청 제한: 최대 {semaphore._value + 1}개)")
+    # 동시 요청 수 제한 (과부하 방지)
+    async with _gemini_slot(limiter):
+        logger.debug(f"Gemini API 요청 시작 (동시 요청 제한: 최대 {limiter.max_concurrent}개)")
         
         for attempt in range(max_retries):
             try:
-                # Gemini는 동기 API이므로 asyncio로 래핑
-                loop = asyncio.get_event_loop()
-                response = await loop.run_in_executor(
-                    None,
-                    lambda: client.models.generate_content(
-                        model="gemini-2.5-flash",
-                        contents=prompt,
-                        config=types.GenerateContentConfig(
-                            temperature=0.7,
-                            response_mime_type="application/json",
-                        ),
-                    )
-                )
+                # Gemini는 동기 API이므로 asyncio로 래핑 (남은 데드라인 내에서만 대기)
+                response = await _call_gemini(client, prompt, temperature=0.7, operation="generate")
                 
                 result = response.text
                 if not result:
@@ -173,6 +243,17 @@ async def generate_quiz_with_gemini(request: AIQuizGenerationRequest) -> AIQuizG
                         jitter = delay * 0.2 * (random.random() * 2 - 1)  # -20% ~ +20%
                         delay_with_jitter = max(0.5, delay + jitter)  # 최소 0.5초 보장
                         
+                        # 남은 예산으로 대기 후 재시도할 수 없으면 즉시 중단
+                        remaining = deadline.get_remaining()
+                        if remaining is not None and remaining <= delay_with_jitter:
+                            logger.warning(
+                                f"Gemini API 503 에러 (시도 {attempt + 1}/{max_retries}), "
+                                f"남은 시간 {remaining:.1f}초로 재시도 중단"
+                            )
+                            raise DeadlineExceededError(
+                                "Gemini API 과부하로 요청 처리 시간 내에 문제를 생성하지 못했습니다"
+                            )
+                        
                         logger.warning(
                             f"Gemini API 503 에러 발생 (시도 {attempt + 1}/{max_retries}). "
                             f"{delay_with_jitter:.1f}초 후 재시도합니다. (에러: {error_message[:100]})"
@@ -192,6 +273,8 @@ async def generate_quiz_with_gemini(request: AIQuizGenerationRequest) -> AIQuizG
                     # 503이 아닌 다른 ServerError는 그대로 전파
                     logger.error(f"Gemini API ServerError (503 아님): {error_message}")
                     raise
+            except DeadlineExceededError:
+                raise
             except Exception as e:
                 # 다른 예외는 재시도하지 않고 즉시 전파
                 logger.error(
@@ -216,7 +299,7 @@ async def validate_quiz_with_gemini(
 ) -> dict:
     """Gemini를 사용하여 문제가 카테고리에 맞는지 검증"""
     client = get_gemini_client()
-    semaphore = get_gemini_semaphore()
+    limiter = get_gemini_limiter()
     
     options_text = "\n".join([f"{opt['index']}. {opt['text']}" for opt in options])
     
@@ -266,20 +349,9 @@ async def validate_quiz_with_gemini(
 - 문제가 카테고리와 일치하지만 일부 개선이 필요한 경우: {{"is_valid": true, "validation_score": 0.75}}
 - 문제가 카테고리와 불일치하거나 심각한 문제가 있는 경우: {{"is_valid": false, "validation_score": 0.3}}"""
 
-    async with semaphore:
+    async with _gemini_slot(limiter):
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: client.models.generate_content(
-                    model="gemini-2.5-flash",
-                    contents=prompt,
-                    config=types.GenerateContentConfig(
-                        temperature=0.3,
-                        response_mime_type="application/json",
-                    ),
-                )
-            )
+            response = await _call_gemini(client, prompt, temperature=0.3, operation="validate")
             
             result = response.text.strip()
             if result.startswith("```json"):
@@ -309,7 +381,7 @@ async def evaluate_correction_request_with_gemini(
 ) -> dict:
     """Gemini를 사용하여 수정 요청이 타당한지 평가하고 수정된 문제 생성"""
     client = get_gemini_client()
-    semaphore = get_gemini_semaphore()
+    limiter = get_gemini_limiter()
     
     options_text = "\n".join([f"{opt['index']}. {opt['text']}" for opt in quiz_options])
     suggested_text = f"\n제안된 수정 내용: {suggested_correction}" if suggested_correction else ""
@@ -350,20 +422,9 @@ async def evaluate_correction_request_with_gemini(
 - 수정된 문제는 반드시 카테고리({category})와 일치해야 합니다
 - 4지선다 형식을 유지하세요"""
 
-    async with semaphore:
+    async with _gemini_slot(limiter):
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: client.models.generate_content(
-                    model="gemini-2.5-flash",
-                    contents=prompt,
-                    config=types.GenerateContentConfig(
-                        temperature=0.7,
-                        response_mime_type="application/json",
-                    ),
-                )
-            )
+            response = await _call_gemini(client, prompt, temperature=0.7, operation="correct")
             
             result = response.text.strip()
             if result.startswith("```json"):
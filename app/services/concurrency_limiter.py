@@ -0,0 +1,189 @@
+"""동시 실행 수 제한
+
+같은 인터페이스(slot)로 두 가지 백엔드를 제공합니다.
+- LocalLimiter: 프로세스 내 asyncio.Semaphore (워커/컨테이너가 N개면 전체 동시 실행 수도 N배)
+- LeaseLimiter: concurrency_leases 테이블의 슬롯 임대로 모든 프로세스의 합계를 제한
+  - 보유 중에는 lease_ttl의 1/3 주기로 임대를 연장하고, 비정상 종료한 프로세스의 슬롯은
+    lease_ttl이 지나면 다른 프로세스가 회수
+  - 대기 중에는 DB 커넥션을 잡고 있지 않음 (advisory lock은 보유 기간 내내 커넥션이 필요해 사용하지 않음)
+  - 만료 판정은 각 서버 시각 기준이므로 서버 간 시각 차이는 lease_ttl보다 충분히 작아야 함
+"""
+import asyncio
+import logging
+import os
+import random
+import socket
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import concurrency_lease as lease_crud
+from app.models.base import get_async_session_maker
+
+logger = logging.getLogger(__name__)
+
+
+class ConcurrencyLimiter(ABC):
+    """동시 실행 슬롯 인터페이스"""
+
+    def __init__(self, max_concurrent: int) -> None:
+        self.max_concurrent = max_concurrent
+        # 이 프로세스에서 slot()으로 보유 중인 슬롯 수
+        self.in_use = 0
+
+    @abstractmethod
+    async def acquire(self) -> object:
+        """슬롯 획득까지 대기 후 반납에 필요한 토큰 반환"""
+
+    @abstractmethod
+    async def release(self, token: object) -> None:
+        """acquire가 반환한 토큰의 슬롯 반납"""
+
+    @asynccontextmanager
+    async def slot(self, timeout: float | None = None) -> AsyncIterator[None]:
+        """슬롯을 잡고 블록 실행 (timeout 초 안에 못 잡으면 asyncio.TimeoutError)"""
+        token = await asyncio.wait_for(self.acquire(), timeout=timeout)
+        self.in_use += 1
+        try:
+            yield
+        finally:
+            self.in_use -= 1
+            await self.release(token)
+
+
+class LocalLimiter(ConcurrencyLimiter):
+    """프로세스 내 제한"""
+
+    def __init__(self, max_concurrent: int) -> None:
+        super().__init__(max_concurrent)
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def acquire(self) -> object:
+        await self._semaphore.acquire()
+        return None
+
+    async def release(self, token: object) -> None:
+        self._semaphore.release()
+
+
+class _Lease:
+    """보유 중인 슬롯과 연장 태스크"""
+
+    def __init__(self, slot: int, holder: str) -> None:
+        self.slot = slot
+        self.holder = holder
+        self.renew_task: asyncio.Task | None = None
+
+
+class LeaseLimiter(ConcurrencyLimiter):
+    """DB 임대 테이블 기반 프로세스 간 제한"""
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrent: int,
+        lease_ttl: float = 60.0,
+        poll_interval: float = 0.2,
+        session_factory: Callable[[], AsyncSession] | None = None,
+    ) -> None:
+        super().__init__(max_concurrent)
+        self.name = name
+        self.lease_ttl = lease_ttl
+        self.poll_interval = poll_interval
+        self._session_factory = session_factory
+        # 이 프로세스가 max_concurrent개를 넘게 DB에 경쟁하지 않도록 로컬에서 먼저 제한
+        self._local = asyncio.Semaphore(max_concurrent)
+        self._slots_ready = False
+        # 취소된 acquire가 남긴 임대를 반납하는 태스크 (GC로 사라지지 않도록 보관)
+        self._cleanup_tasks: set[asyncio.Task] = set()
+        self._process_id = f"{socket.gethostname()}:{os.getpid()}"
+
+    def _session(self) -> AsyncSession:
+        factory = self._session_factory or get_async_session_maker()
+        return factory()
+
+    async def _try_acquire(self, holder: str) -> int | None:
+        async with self._session() as session:
+            if not self._slots_ready:
+                await lease_crud.ensure_slots(session, self.name, self.max_concurrent)
+                self._slots_ready = True
+            return await lease_crud.try_acquire_slot(
+                session, self.name, self.max_concurrent, holder, self.lease_ttl
+            )
+
+    async def acquire(self) -> _Lease:
+        await self._local.acquire()
+        holder = f"{self._process_id}:{uuid.uuid4().hex[:8]}"
+        try:
+            while True:
+                # 임대 UPDATE가 커밋된 뒤 취소/timeout이 오면 슬롯이 lease_ttl 동안 묶이므로
+                # DB 작업은 취소하지 않고 끝까지 실행한 뒤 반납
+                attempt = asyncio.ensure_future(self._try_acquire(holder))
+                try:
+                    slot = await asyncio.shield(attempt)
+                except asyncio.CancelledError:
+                    self._release_abandoned(attempt, holder)
+                    raise
+                if slot is not None:
+                    break
+                # 여러 프로세스가 같은 주기로 몰리지 않도록 지터 적용
+                await asyncio.sleep(self.poll_interval * random.uniform(0.5, 1.5))
+        except BaseException:
+            self._local.release()
+            raise
+
+        lease = _Lease(slot, holder)
+        lease.renew_task = asyncio.create_task(self._renew(lease))
+        return lease
+
+    def _release_abandoned(self, attempt: asyncio.Future, holder: str) -> None:
+        """취소된 acquire의 DB 작업이 끝나면, 임대에 성공했던 경우 바로 반납"""
+        async def cleanup() -> None:
+            try:
+                slot = await attempt
+            except Exception:
+                return
+            if slot is None:
+                return
+            try:
+                async with self._session() as session:
+                    await lease_crud.release_lease(session, self.name, slot, holder)
+            except Exception as e:
+                # 반납하지 못한 슬롯은 lease_ttl 후 회수됨
+                logger.warning(f"임대 반납 실패: name={self.name}, slot={slot}, 에러={e.__class__.__name__}")
+
+        task = asyncio.create_task(cleanup())
+        self._cleanup_tasks.add(task)
+        task.add_done_callback(self._cleanup_tasks.discard)
+
+    async def _renew(self, lease: _Lease) -> None:
+        """보유 중 임대 연장 (실패해도 호출은 계속, 만료 후 초과 실행 가능성만 기록)"""
+        while True:
+            await asyncio.sleep(self.lease_ttl / 3)
+            try:
+                async with self._session() as session:
+                    renewed = await lease_crud.renew_lease(
+                        session, self.name, lease.slot, lease.holder, self.lease_ttl
+                    )
+                if not renewed:
+                    logger.warning(f"임대가 만료되어 회수됨: name={self.name}, slot={lease.slot}")
+                    return
+            except Exception as e:
+                logger.warning(f"임대 연장 실패: name={self.name}, slot={lease.slot}, 에러={e.__class__.__name__}")
+
+    async def release(self, token: object) -> None:
+        lease = token
+        assert isinstance(lease, _Lease)
+        if lease.renew_task is not None:
+            lease.renew_task.cancel()
+        try:
+            async with self._session() as session:
+                await lease_crud.release_lease(session, self.name, lease.slot, lease.holder)
+        except Exception as e:
+            # 반납하지 못한 슬롯은 lease_ttl 후 회수됨
+            logger.warning(f"임대 반납 실패: name={self.name}, slot={lease.slot}, 에러={e.__class__.__name__}")
+        finally:
+            self._local.release()
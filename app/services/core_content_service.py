@@ -115,7 +115,7 @@ async def auto_assign_core_content(
             ) from e
         
         try:
-            classification_text = await youtube_service.extract_transcript(video_id)
+            classification_text = await youtube_service.get_transcript(video_id)
         except ValueError as e:
             raise CoreContentAutoError(
                 code="TRANSCRIPT_NOT_FOUND",
@@ -1,9 +1,10 @@
 import logging
 import uuid
+from typing import Sequence
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.crud import exam as exam_crud, quiz as quiz_crud, subject as subject_crud
+from app.crud import exam as exam_crud, quiz as quiz_crud, taxonomy as taxonomy_crud
 from app.exceptions import (
     BaseAppError,
     ExamSessionNotFoundError,
@@ -11,6 +12,7 @@ from app.exceptions import (
     QuizNotFoundError,
     SubjectNotFoundError,
 )
+from app.models.exam_record import ExamRecord
 from app.schemas import exam as exam_schema, quiz as quiz_schema
 
 logger = logging.getLogger(__name__)
@@ -27,7 +29,7 @@ async def start_exam(
         raise SubjectNotFoundError(subject_id)
     
     try:
-        subject = await subject_crud.get_subject_by_id(session, subject_id)
+        subject = await taxonomy_crud.get_subject(subject_id)
         if not subject:
             raise SubjectNotFoundError(subject_id)
 
@@ -44,25 +46,14 @@ async def start_exam(
 
         exam_session_id = str(uuid.uuid4())
 
-        # 배치로 시험 기록 생성 (트랜잭션 일관성 보장)
+        # 시험 기록 일괄 생성 (INSERT ... RETURNING 한 번, 문제 재조회/refresh 없음)
         try:
-            records = []
-            for quiz in quizzes:
-                record = await exam_crud.create_exam_record(
-                    session,
-                    quiz_id=quiz.id,
-                    exam_session_id=exam_session_id,
-                )
-                records.append(record)
-            # 모든 기록 생성 후 일괄 커밋
+            await exam_crud.create_exam_records_bulk(
+                session,
+                [quiz.id for quiz in quizzes],
+                exam_session_id,
+            )
             await session.commit()
-            # commit 후 각 record를 refresh하여 id 등 생성된 값 반영
-            for record in records:
-                await session.refresh(record)
-        except ValueError as e:
-            logger.error(f"시험 기록 생성 실패: {e}, exam_session_id={exam_session_id}")
-            await session.rollback()
-            raise InvalidQuizRequestError(f"시험 기록 생성 중 오류가 발생했습니다: {str(e)}")
         except Exception as e:
             logger.error(f"시험 기록 생성 중 예상치 못한 오류: {e}, exam_session_id={exam_session_id}", exc_info=True)
             await session.rollback()
@@ -73,21 +64,13 @@ async def start_exam(
         quiz_ids = [q.id for q in quizzes]
         validation_statuses = await validation_crud.get_latest_validation_statuses(session, quiz_ids)
         
-        quiz_responses = []
-        for q in quizzes:
-            validation_status = validation_statuses.get(q.id, "pending")
-            quiz_dict = {
-                "id": q.id,
-                "subject_id": q.subject_id,
-                "question": q.question,
-                "options": q.options,
-                "correct_answer": None,  # 시험 중에는 정답 숨김
-                "explanation": q.explanation,
-                "source_url": q.source_url,
-                "created_at": q.created_at,
-                "validation_status": validation_status,
-            }
-            quiz_responses.append(quiz_schema.QuizResponse.model_validate(quiz_dict))
+        # 시험 중에는 정답 숨김
+        quiz_responses = [
+            quiz_schema.QuizResponse.from_quiz(
+                q, validation_statuses.get(q.id, "pending"), hide_answer=True
+            )
+            for q in quizzes
+        ]
 
         logger.info(f"시험 시작 성공: exam_session_id={exam_session_id}, quiz_count={len(quizzes)}")
         return quiz_schema.QuizListResponse(quizzes=quiz_responses, total=len(quiz_responses))
@@ -104,31 +87,61 @@ async def submit_answer(
     session: AsyncSession,
     request: exam_schema.ExamSubmitRequest,
 ) -> exam_schema.ExamRecordResponse:
-    """답안 제출"""
-    quiz = await quiz_crud.get_quiz_by_id(session, request.quiz_id)
-    if not quiz:
-        raise QuizNotFoundError(request.quiz_id)
-
-    record = await exam_crud.get_exam_record_by_session_and_quiz(
+    """답안 제출 (갱신 한 번, 실패 시에만 원인 조회)"""
+    record = await exam_crud.submit_exam_answer(
         session,
         request.exam_session_id,
         request.quiz_id,
+        request.user_answer,
     )
 
-    if not record:
+    if record is None:
+        await session.rollback()
+        existing = await exam_crud.get_exam_record_by_session_and_quiz(
+            session,
+            request.exam_session_id,
+            request.quiz_id,
+        )
+        if existing is not None:
+            raise InvalidQuizRequestError("이미 답안이 제출되었습니다")
+        if not await quiz_crud.get_quiz_by_id(session, request.quiz_id):
+            raise QuizNotFoundError(request.quiz_id)
         raise ExamSessionNotFoundError(request.exam_session_id)
 
-    if record.user_answer is not None:
-        raise InvalidQuizRequestError("이미 답안이 제출되었습니다")
+    await session.commit()
+    return exam_schema.ExamRecordResponse.model_validate(record)
 
-    record = await exam_crud.update_exam_record_answer(
-        session,
-        record,
-        request.user_answer,
-        request.user_answer == quiz.correct_answer,
-    )
 
-    return exam_schema.ExamRecordResponse.model_validate(record)
+async def submit_answers_batch(
+    session: AsyncSession,
+    request: exam_schema.ExamSubmitBatchRequest,
+) -> exam_schema.ExamResponse:
+    """답안 일괄 제출 후 시험 결과 반환 (채점 UPDATE 한 번 + 결과 조회 한 번)
+
+    이미 답안이 제출된 문제는 덮어쓰지 않고 기존 답안을 유지합니다.
+    """
+    answers = {answer.quiz_id: answer.user_answer for answer in request.answers}
+    if len(answers) != len(request.answers):
+        raise InvalidQuizRequestError("같은 문제에 대한 답안이 중복되었습니다")
+
+    updated_count = await exam_crud.submit_exam_answers_bulk(session, request.exam_session_id, answers)
+    records = await exam_crud.get_exam_records_by_session(session, request.exam_session_id)
+
+    if not records:
+        await session.rollback()
+        raise ExamSessionNotFoundError(request.exam_session_id)
+
+    unknown_quiz_ids = sorted(set(answers) - {record.quiz_id for record in records})
+    if unknown_quiz_ids:
+        await session.rollback()
+        raise InvalidQuizRequestError(f"시험에 포함되지 않은 문제입니다: {unknown_quiz_ids}")
+
+    await session.commit()
+    logger.info(
+        f"답안 일괄 제출: exam_session_id={request.exam_session_id}, "
+        f"요청={len(answers)}, 반영={updated_count}"
+    )
+    return _build_exam_response(request.exam_session_id, records)
 
 
 async def get_exam_result(
@@ -141,16 +154,23 @@ async def get_exam_result(
     if not records:
         raise ExamSessionNotFoundError(exam_session_id)
 
+    return _build_exam_response(exam_session_id, records)
+
+
+def _build_exam_response(
+    exam_session_id: str,
+    records: Sequence[ExamRecord],
+) -> exam_schema.ExamResponse:
+    """문제가 함께 로드된 시험 기록으로 결과 응답 생성"""
+    for record in records:
+        if record.quiz is None:
+            raise QuizNotFoundError(record.quiz_id)
+
     correct_count = sum(1 for r in records if r.is_correct is True)
     incorrect_count = sum(1 for r in records if r.is_correct is False)
     
     record_responses = [exam_schema.ExamRecordResponse.model_validate(r) for r in records]
     
-    first_record = records[0]
-    quiz = await quiz_crud.get_quiz_by_id(session, first_record.quiz_id)
-    if not quiz:
-        raise QuizNotFoundError(first_record.quiz_id)
-
     # ADsP 전용 구조: subject_id는 항상 1
     return exam_schema.ExamResponse(
         exam_session_id=exam_session_id,
@@ -159,5 +179,5 @@ async def get_exam_result(
         correct_count=correct_count,
         incorrect_count=incorrect_count,
         records=record_responses,
-        created_at=first_record.created_at,
+        created_at=records[0].created_at,
     )
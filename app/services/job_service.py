@@ -0,0 +1,268 @@
+"""비동기 작업 처리
+
+Gemini 호출이 재시도를 포함해 수 분 걸리는 작업(학습 모드 일괄 생성, 검증, 수정 요청)을
+요청 처리와 분리합니다. 요청은 jobs 테이블에 작업을 기록하고 202를 반환하며,
+프로세스 내 워커 태스크(job_worker_concurrency개)가 작업마다 별도 세션으로 실행합니다.
+작업 핸들러(quiz_service)는 Gemini 호출 전에 읽기 트랜잭션을 끝내므로, 워커 수만큼 DB 커넥션이
+Gemini 응답을 기다리며 묶이지 않습니다.
+
+실행 중인 작업에는 실행 프로세스(owner)와 임대 만료 시각을 기록하고 job_lease_ttl의 1/3 주기로
+연장합니다. 시작 시와 job_lease_ttl 주기로 대기 작업은 다시 큐에 넣고, 임대가 만료된(실행하던
+프로세스가 종료된) 작업만 job_max_attempts 이내면 재개, 초과하면 실패로 기록합니다.
+여러 워커 프로세스/컨테이너가 같은 DB를 써도 다른 프로세스가 실행 중인 작업은 건드리지 않습니다.
+같은 주기 태스크가 transcript_purge_interval마다 만료된 자막 캐시 행도 삭제합니다.
+"""
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from typing import Any, Awaitable, Callable
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import deadline
+from app.core.config import settings
+from app.core.progress import progress_reporter
+from app.crud import job as job_crud, youtube_transcript as transcript_crud
+from app.exceptions import BaseAppError
+from app.models.base import get_async_session_maker
+from app.models.job import Job
+from app.schemas import quiz as quiz_schema
+from app.services import quiz_service
+
+logger = logging.getLogger(__name__)
+
+# 작업 종류
+JOB_GENERATE_STUDY = "generate_study"
+JOB_VALIDATE = "validate"
+JOB_CORRECTION = "correction"
+
+JobHandler = Callable[[AsyncSession, dict], Awaitable[BaseModel]]
+
+
+async def _run_generate_study(session: AsyncSession, payload: dict) -> BaseModel:
+    request = quiz_schema.StudyModeQuizCreateRequest.model_validate(payload)
+    return await quiz_service.generate_study_quizzes(session, request)
+
+
+async def _run_validate(session: AsyncSession, payload: dict) -> BaseModel:
+    return await quiz_service.validate_quiz(session, payload["quiz_id"])
+
+
+async def _run_correction(session: AsyncSession, payload: dict) -> BaseModel:
+    request = quiz_schema.QuizCorrectionRequest.model_validate(payload)
+    return await quiz_service.request_quiz_correction(session, request)
+
+
+JOB_HANDLERS: dict[str, JobHandler] = {
+    JOB_GENERATE_STUDY: _run_generate_study,
+    JOB_VALIDATE: _run_validate,
+    JOB_CORRECTION: _run_correction,
+}
+
+
+def _job_error(error: Exception) -> dict:
+    """예외를 예외 핸들러 응답과 같은 code/detail 형식으로 변환"""
+    if isinstance(error, BaseAppError):
+        return {"code": error.__class__.__name__, "detail": error.message, "status_code": error.status_code}
+    # 프로덕션 환경에서는 상세 에러 메시지 숨김
+    if settings.environment == "production":
+        return {"code": "INTERNAL_SERVER_ERROR", "detail": "Internal Server Error", "status_code": 500}
+    return {"code": error.__class__.__name__, "detail": str(error), "status_code": 500}
+
+
+class JobWorkerPool:
+    """작업 큐와 워커 태스크"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] | None = None,
+        concurrency: int | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self.concurrency = concurrency or settings.job_worker_concurrency
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._workers: list[asyncio.Task] = []
+        # 큐에 들어 있는 작업 (주기적 복구가 같은 작업을 중복으로 넣지 않도록)
+        self._pending: set[str] = set()
+        self._reaper: asyncio.Task | None = None
+        self._last_purge_at: float | None = None
+        # 이 풀이 실행하는 작업에 기록하는 실행 프로세스 식별자
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+    def _session(self) -> AsyncSession:
+        factory = self._session_factory or get_async_session_maker()
+        return factory()
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    @property
+    def alive_workers(self) -> int:
+        """예기치 않게 종료되지 않고 동작 중인 워커 태스크 수"""
+        return sum(1 for worker in self._workers if not worker.done())
+
+    async def start(self) -> None:
+        """중단된 작업을 복구한 뒤 워커와 주기적 복구 태스크 시작"""
+        if self.running:
+            return
+        # 큐는 실행 중인 이벤트 루프에서 새로 만들고, 대기 작업은 recover에서 DB 기준으로 다시 넣음
+        self._queue = asyncio.Queue()
+        self._pending = set()
+        try:
+            await self.recover()
+        except Exception:
+            # DB에 일시적으로 연결할 수 없어도 서버는 시작 (복구되지 않은 작업은 다음 시작 시 처리)
+            logger.exception("작업 복구 실패")
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"job-worker-{i}")
+            for i in range(self.concurrency)
+        ]
+        self._reaper = asyncio.create_task(self._recover_periodically(), name="job-reaper")
+        logger.info(f"작업 워커 시작: {self.concurrency}개")
+
+    async def stop(self) -> None:
+        """워커 종료 (실행 중이던 작업은 임대 만료 후 복구)"""
+        tasks = [*self._workers, *([self._reaper] if self._reaper else [])]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers = []
+        self._reaper = None
+
+    def submit(self, job_id: str) -> None:
+        """작업 실행 예약 (이미 큐에 있으면 무시)"""
+        if job_id in self._pending:
+            return
+        self._pending.add(job_id)
+        self._queue.put_nowait(job_id)
+
+    async def enqueue(self, session: AsyncSession, job_type: str, payload: dict) -> Job:
+        """작업 기록 후 실행 예약"""
+        if job_type not in JOB_HANDLERS:
+            raise ValueError(f"알 수 없는 작업 종류입니다: {job_type}")
+        job = await job_crud.create_job(session, job_type, payload)
+        self.submit(job.id)
+        return job
+
+    async def recover(self) -> None:
+        """대기 작업은 다시 큐에 넣고, 임대가 만료된 실행 중 작업은 재개하거나 실패로 기록
+
+        다른 프로세스가 실행 중인(임대가 유효한) 작업은 건드리지 않으며, 같은 작업을 여러 프로세스가
+        동시에 복구해도 조건부 UPDATE로 한 곳에서만 처리됩니다.
+        """
+        async with self._session() as session:
+            jobs = await job_crud.get_unfinished_jobs(session)
+            resumed, failed = [], []
+            for job in jobs:
+                if job.status == job_crud.JOB_RUNNING:
+                    if job.attempts >= settings.job_max_attempts:
+                        if await job_crud.fail_expired_job(session, job.id, error={
+                            "code": "JOB_INTERRUPTED",
+                            "detail": "서버 재시작으로 작업이 중단되었습니다. 다시 요청해주세요.",
+                            "status_code": 503,
+                        }):
+                            failed.append(job.id)
+                        continue
+                    if not await job_crud.requeue_expired_job(session, job.id):
+                        continue
+                resumed.append(job.id)
+
+        for job_id in resumed:
+            self.submit(job_id)
+        if resumed or failed:
+            logger.info(f"작업 복구: 재개 {len(resumed)}개, 실패 처리 {len(failed)}개")
+
+    async def _recover_periodically(self) -> None:
+        """다른 프로세스가 종료되며 남긴 작업을 임대 만료 후 복구 (만료된 자막 캐시 정리 포함)"""
+        while True:
+            await asyncio.sleep(settings.job_lease_ttl)
+            try:
+                await self.recover()
+            except Exception:
+                logger.exception("작업 복구 실패")
+            try:
+                await self.purge_expired_transcripts()
+            except Exception as e:
+                logger.warning(f"만료된 자막 캐시 정리 실패: 에러={e.__class__.__name__}")
+
+    async def purge_expired_transcripts(self) -> None:
+        """transcript_purge_interval이 지났으면 만료된 자막 캐시 행 삭제"""
+        now = time.monotonic()
+        if self._last_purge_at is not None and now - self._last_purge_at < settings.transcript_purge_interval:
+            return
+        self._last_purge_at = now
+        async with self._session() as session:
+            deleted = await transcript_crud.purge_expired_transcripts(session)
+            await session.commit()
+        if deleted:
+            logger.info(f"만료된 자막 캐시 삭제: {deleted}개")
+
+    async def _renew_lease(self, job_id: str) -> None:
+        """실행 중 작업의 임대 연장 (다른 프로세스가 가져갔으면 중단)"""
+        while True:
+            await asyncio.sleep(settings.job_lease_ttl / 3)
+            try:
+                async with self._session() as session:
+                    renewed = await job_crud.renew_job_lease(session, job_id, self.owner, settings.job_lease_ttl)
+                if not renewed:
+                    logger.warning(f"작업 임대가 만료되어 다른 프로세스로 넘어감: job_id={job_id}")
+                    return
+            except Exception as e:
+                logger.warning(f"작업 임대 연장 실패: job_id={job_id}, 에러={e.__class__.__name__}")
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            self._pending.discard(job_id)
+            try:
+                await self.run_job(job_id)
+            except Exception:
+                # 상태 기록 자체가 실패한 경우에도 워커는 계속 동작
+                logger.exception(f"작업 처리 중 오류: job_id={job_id}")
+            finally:
+                self._queue.task_done()
+
+    async def run_job(self, job_id: str) -> None:
+        """작업 하나 실행 (이미 다른 워커가 가져간 작업이면 무시)"""
+        async with self._session() as session:
+            job = await job_crud.claim_job(session, job_id, self.owner, settings.job_lease_ttl)
+        if job is None:
+            return
+
+        handler = JOB_HANDLERS.get(job.job_type)
+        result: dict[str, Any] | None = None
+        error: dict | None = None
+
+        async def save_progress(progress: int) -> None:
+            async with self._session() as progress_session:
+                await job_crud.update_job_progress(progress_session, job_id, progress)
+
+        # 작업마다 요청 데드라인 대신 job_timeout 적용 (워커 태스크의 contextvar)
+        deadline.set_deadline(settings.job_timeout)
+        renew_task = asyncio.create_task(self._renew_lease(job_id))
+        try:
+            if handler is None:
+                raise ValueError(f"알 수 없는 작업 종류입니다: {job.job_type}")
+            with progress_reporter(save_progress):
+                async with self._session() as session:
+                    response = await handler(session, job.payload)
+            result = response.model_dump(mode="json")
+        except Exception as e:
+            logger.warning(f"작업 실패: job_id={job_id}, type={job.job_type}, 에러={e.__class__.__name__}: {e}")
+            error = _job_error(e)
+        finally:
+            renew_task.cancel()
+            deadline.set_deadline(None)
+
+        async with self._session() as session:
+            finished = await job_crud.finish_job(session, job_id, result=result, error=error, owner=self.owner)
+        if not finished:
+            logger.warning(f"작업 결과 미기록: 임대가 만료되어 다른 프로세스가 실행 중입니다 (job_id={job_id})")
+
+
+job_worker_pool = JobWorkerPool()
@@ -1,10 +1,16 @@
 import logging
 import random
+from typing import Sequence
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.crud import quiz as quiz_crud, subject as subject_crud, sub_topic as sub_topic_crud, quiz_validation as validation_crud
+from app.crud import quiz as quiz_crud, sub_topic as sub_topic_crud, quiz_validation as validation_crud
+from app.crud import sub_topic_quiz_stats as stats_crud, taxonomy as taxonomy_crud
+from app.core import deadline
+from app.core.progress import report_progress
+from app.models.core_content_item import CoreContentItem
 from app.exceptions import (
+    DeadlineExceededError,
     GeminiServiceUnavailableError,
     InvalidQuizRequestError,
     QuizNotFoundError,
@@ -22,6 +28,19 @@ logger = logging.getLogger(__name__)
 # 이 값 이상이면 is_valid=true, 미만이면 false
 VALIDATION_SCORE_THRESHOLD = 0.7
 
+# 유사도 재시도 초과로 생산이 연속 중단된 횟수가 이 값 이상이면 production_difficult
+PRODUCTION_DIFFICULT_FAILURE_THRESHOLD = 2
+
+
+async def _end_read_transaction(session: AsyncSession) -> None:
+    """Gemini 호출 동안 DB 커넥션/트랜잭션을 잡고 있지 않도록 현재 트랜잭션 종료
+
+    읽기만 한(쓰기는 이미 커밋한) 상태에서 호출하며, 이후 쿼리는 풀에서 커넥션을 다시 받아
+    새 트랜잭션으로 실행됩니다 (expire_on_commit=False라 읽은 객체는 그대로 사용).
+    """
+    if session.in_transaction():
+        await session.commit()
+
 
 async def _create_quiz_response_with_status(
     session: AsyncSession,
@@ -29,20 +48,7 @@ async def _create_quiz_response_with_status(
 ) -> quiz_schema.QuizResponse:
     """Quiz 모델을 QuizResponse로 변환하며 validation_status 포함"""
     validation_statuses = await validation_crud.get_latest_validation_statuses(session, [quiz.id])
-    validation_status = validation_statuses.get(quiz.id, "pending")
-    
-    quiz_dict = {
-        "id": quiz.id,
-        "subject_id": quiz.subject_id,
-        "question": quiz.question,
-        "options": quiz.options,
-        "correct_answer": quiz.correct_answer,
-        "explanation": quiz.explanation,
-        "source_url": quiz.source_url,
-        "created_at": quiz.created_at,
-        "validation_status": validation_status,
-    }
-    return quiz_schema.QuizResponse.model_validate(quiz_dict)
+    return quiz_schema.QuizResponse.from_quiz(quiz, validation_statuses.get(quiz.id, "pending"))
 
 
 async def _create_quiz_responses_with_status(
@@ -56,23 +62,10 @@ async def _create_quiz_responses_with_status(
     quiz_ids = [q.id for q in quizzes]
     validation_statuses = await validation_crud.get_latest_validation_statuses(session, quiz_ids)
     
-    quiz_responses = []
-    for quiz in quizzes:
-        validation_status = validation_statuses.get(quiz.id, "pending")
-        quiz_dict = {
-            "id": quiz.id,
-            "subject_id": quiz.subject_id,
-            "question": quiz.question,
-            "options": quiz.options,
-            "correct_answer": quiz.correct_answer,
-            "explanation": quiz.explanation,
-            "source_url": quiz.source_url,
-            "created_at": quiz.created_at,
-            "validation_status": validation_status,
-        }
-        quiz_responses.append(quiz_schema.QuizResponse.model_validate(quiz_dict))
-    
-    return quiz_responses
+    return [
+        quiz_schema.QuizResponse.from_quiz(quiz, validation_statuses.get(quiz.id, "pending"))
+        for quiz in quizzes
+    ]
 
 
 async def generate_quiz(
@@ -84,7 +77,7 @@ async def generate_quiz(
     subject_id = request.subject_id or 1
     if subject_id != 1:
         raise SubjectNotFoundError(subject_id)
-    subject = await subject_crud.get_subject_by_id(session, subject_id)
+    subject = await taxonomy_crud.get_subject(subject_id)
     if not subject:
         raise SubjectNotFoundError(subject_id)
 
@@ -95,7 +88,7 @@ async def generate_quiz(
         if not request.source_url:
             raise InvalidQuizRequestError("source_type이 'url'일 때 source_url은 필수입니다")
         video_id = youtube_service.extract_video_id(request.source_url)
-        source_text = await youtube_service.extract_transcript(video_id)
+        source_text = await youtube_service.get_transcript(video_id)
         source_url = request.source_url
     else:
         if not request.source_text:
@@ -145,25 +138,25 @@ async def generate_study_quizzes(
         raise SubTopicNotFoundError(request.sub_topic_id)
     
     # 핵심 정보 확인
-    if not sub_topic.core_content:
+    if not sub_topic.core_content_count:
         raise InvalidQuizRequestError(f"세부항목에 핵심 정보가 없습니다: {request.sub_topic_id}")
     
+    # 세부항목 문제 재고 집계 (문제 개수, 가장 최근 문제 생성 시점)
+    quiz_stats = await stats_crud.get_sub_topic_quiz_stats(session, request.sub_topic_id)
+    latest_quiz_created_at = quiz_stats.latest_quiz_created_at if quiz_stats else None
+    
     # 핵심 정보 변경 감지: 가장 최근 문제 생성 시점과 비교
-    latest_quiz = await quiz_crud.get_latest_quiz_by_sub_topic_id(session, request.sub_topic_id)
     core_content_updated = False
-    if latest_quiz:
+    if quiz_stats and quiz_stats.quiz_count > 0:
         # 세부항목의 updated_at이 가장 최근 문제의 created_at보다 늦으면 핵심 정보 변경
-        if sub_topic.updated_at and latest_quiz.created_at:
-            core_content_updated = sub_topic.updated_at > latest_quiz.created_at
+        if sub_topic.updated_at and latest_quiz_created_at:
+            core_content_updated = sub_topic.updated_at > latest_quiz_created_at
     else:
         # 문제가 없으면 핵심 정보가 새로 추가된 것으로 간주
         core_content_updated = True
     
-    # 세부항목별 전체 문제 개수 확인 (적정선 기준 판단용)
-    total_cached_count = await quiz_crud.get_quiz_count_by_sub_topic_id(
-        session,
-        request.sub_topic_id
-    )
+    # 세부항목별 전체 문제 개수 (적정선 기준 판단용)
+    total_cached_count = quiz_stats.quiz_count if quiz_stats else 0
     
     # 적정선 기준에 따른 캐시/신규 비율 결정
     if total_cached_count >= 30:
@@ -203,7 +196,8 @@ async def generate_study_quizzes(
     cached_quizzes_raw = await quiz_crud.get_quizzes_by_sub_topic_id(
         session,
         request.sub_topic_id,
-        cached_count * 2  # 유사도 필터링을 위해 여유있게 조회
+        cached_count * 2,  # 유사도 필터링을 위해 여유있게 조회
+        total_count=total_cached_count,
     )
     
     # 유사 문제 제외 (캐시 조회 시)
@@ -263,28 +257,28 @@ async def generate_study_quizzes(
     # 문제 생산 중단 여부 (재시도 초과 시)
     production_stopped = False
     
+    # 모든 핵심 정보를 종합한 생성 입력 (생성이 필요할 때만 한 번 조회)
+    if needed_count > 0:
+        core_items = await sub_topic_crud.get_core_content_items(session, request.sub_topic_id)
+        combined_content = _combine_core_contents(core_items)
+        core_content_blob = sub_topic_crud.build_legacy_core_content(core_items)
+    
     for i in range(needed_count):
         retry_count = 0
         quiz_created = False
+        # 비동기 작업으로 실행 중이면 진행률 기록 (요청 처리 중에는 아무 일도 하지 않음)
+        await report_progress(i, needed_count)
+        
+        # 요청 데드라인 초과 시 지금까지 확보한 문제만 반환
+        if deadline.is_expired() and (new_quizzes or cached_quizzes):
+            logger.warning(
+                f"요청 처리 시간 초과로 생성 중단: sub_topic_id={request.sub_topic_id}, "
+                f"생성된 문제: {len(new_quizzes)}/{needed_count}"
+            )
+            break
         
         try:
             while not quiz_created and retry_count <= MAX_SIMILARITY_RETRIES:
-                # 핵심 정보를 기반으로 문제 생성 (모든 핵심 정보 종합 활용)
-                # 구분자로 분리된 모든 핵심 정보를 조회
-                core_contents = sub_topic_crud.parse_core_contents(sub_topic.core_content, sub_topic.source_type)
-                
-                # 모든 핵심 정보를 종합하여 문제 생성에 활용
-                if core_contents:
-                    # 각 핵심 정보를 명확히 구분하여 결합
-                    combined_parts = []
-                    for idx, item in enumerate(core_contents, 1):
-                        source_type_label = "텍스트" if item["source_type"] == "text" else "YouTube URL"
-                        combined_parts.append(f"[핵심 정보 {idx} - {source_type_label}]\n{item['core_content']}")
-                    combined_content = "\n\n".join(combined_parts)
-                else:
-                    # 핵심 정보가 없는 경우 (이미 위에서 체크했지만 안전장치)
-                    combined_content = sub_topic.core_content or ""
-                
                 # 모든 핵심 정보를 종합하여 문제 생성
                 ai_request = ai.AIQuizGenerationRequest(
                     source_text=combined_content,
@@ -293,6 +287,7 @@ async def generate_study_quizzes(
                     sub_topic_name=sub_topic.name,
                 )
                 
+                await _end_read_transaction(session)
                 ai_response = await ai_service.generate_quiz(ai_request)
                 
                 # 유사 문제 체크 (토큰 없이)
@@ -325,6 +320,11 @@ async def generate_study_quizzes(
                             )
                             production_stopped = True
                             quiz_created = True  # 새 문제 생성 중단
+                            # 연속 생산 실패 기록 (대시보드 production_difficult 판단용)
+                            await stats_crud.record_generation_attempt(
+                                session, request.sub_topic_id, similarity_failed=True
+                            )
+                            await session.commit()
                             break  # while 루프 종료
                         else:
                             # 핵심 정보가 변경되었으면 유사 문제 변형하여 사용
@@ -349,11 +349,11 @@ async def generate_study_quizzes(
                 if settings.auto_validate_quiz and random.random() < settings.auto_validate_sample_rate:
                     try:
                         category = f"{sub_topic.main_topic.subject.name} > {sub_topic.main_topic.name} > {sub_topic.name}"
-                        import json
-                        options = json.loads(ai_response.options_json) if isinstance(ai_response.options_json, str) else [{"index": opt.index, "text": opt.text} for opt in ai_response.options]
+                        options = ai_response.options_data
                         
                         # 간단한 키워드 기반 사전 필터링 (토큰 없이)
                         if _simple_keyword_check(ai_response.question, category):
+                            await _end_read_transaction(session)
                             validation_result = await ai_service.validate_quiz_with_gemini(
                                 question=ai_response.question,
                                 options=options,
@@ -373,7 +373,7 @@ async def generate_study_quizzes(
                 
                 # 해시 생성 (핵심 정보 + 인덱스 + 재시도 횟수로 고유성 보장)
                 source_hash = youtube_service.generate_hash(
-                    f"{sub_topic.core_content}_{request.sub_topic_id}_{i}_{retry_count}"
+                    f"{core_content_blob}_{request.sub_topic_id}_{i}_{retry_count}"
                 )
                 
                 # 중복 확인
@@ -389,14 +389,17 @@ async def generate_study_quizzes(
                     quiz_created = True
                     continue
                 
-                # 새 문제 생성
+                # 새 문제 생성 (생산 성공 기록은 문제 생성과 함께 커밋)
+                await stats_crud.record_generation_attempt(
+                    session, request.sub_topic_id, similarity_failed=False
+                )
                 new_quiz = await quiz_crud.create_quiz(
                     session,
                     subject_id=subject_id,
                     ai_response=ai_response,
                     source_hash=source_hash,
                     source_url=None,
-                    source_text=sub_topic.core_content,
+                    source_text=core_content_blob,
                     sub_topic_id=request.sub_topic_id,
                 )
                 new_quizzes.append(new_quiz)
@@ -425,6 +428,15 @@ async def generate_study_quizzes(
                 break
             # 문제가 하나도 없으면 에러 반환
             raise
+        except DeadlineExceededError:
+            logger.warning(
+                f"요청 처리 시간 초과: sub_topic_id={request.sub_topic_id}, "
+                f"생성 중단 (생성된 문제: {len(new_quizzes)}/{needed_count})"
+            )
+            # 일부 문제라도 확보했으면 부분 결과 반환
+            if new_quizzes or cached_quizzes:
+                break
+            raise
         except Exception as e:
             logger.error(
                 f"문제 생성 중 오류: sub_topic_id={request.sub_topic_id}, "
@@ -437,13 +449,14 @@ async def generate_study_quizzes(
             raise
     
     # 캐시된 문제 + 새로 생성한 문제 합치기
-    all_quizzes = list(cached_quizzes) + new_quizzes
+    all_quizzes = (list(cached_quizzes) + new_quizzes)[:request.quiz_count]
     
-    # 캐시된 문제에 변형 적용 (토큰 없이)
+    # validation_status는 일괄 조회하여 응답 생성 (문제별 조회 없음)
+    base_responses = await _create_quiz_responses_with_status(session, all_quizzes)
+    
+    # 캐시된 문제에 변형 적용 (토큰 없이, 변형은 재검증 없이 복사)
     quiz_responses = []
-    for quiz in all_quizzes[:request.quiz_count]:
-        quiz_response = quiz_schema.QuizResponse.model_validate(quiz)
-        
+    for quiz, quiz_response in zip(all_quizzes, base_responses):
         # 유사 문제로 판단된 경우 100% 확률로 변형, 그 외는 70% 확률로 변형
         should_vary = quiz.id in similar_quiz_ids_to_vary or random.random() < 0.7
         if should_vary:
@@ -459,13 +472,7 @@ async def generate_study_quizzes(
                     f"sub_topic_id={request.sub_topic_id}"
                 )
         
-        # validation_status 포함
-        validation_statuses = await validation_crud.get_latest_validation_statuses(session, [quiz.id])
-        validation_status = validation_statuses.get(quiz.id, "pending")
-        
-        quiz_dict = quiz_response.model_dump()
-        quiz_dict["validation_status"] = validation_status
-        quiz_responses.append(quiz_schema.QuizResponse.model_validate(quiz_dict))
+        quiz_responses.append(quiz_response)
     
     logger.info(
         f"학습 모드 문제 생성 완료: sub_topic_id={request.sub_topic_id}, "
@@ -479,6 +486,32 @@ async def generate_study_quizzes(
     )
 
 
+async def get_quizzes_by_ids(
+    session: AsyncSession,
+    quiz_ids: list[int],
+    primary_session: AsyncSession | None = None,
+) -> quiz_schema.QuizBatchResponse:
+    """여러 문제를 요청 순서대로 조회 (IN 쿼리 한 번, 검증 상태는 quizzes의 최신 상태 컬럼 사용)
+
+    session이 읽기 복제본이면 복제 지연으로 빠진 문제만 primary_session에서 다시 조회합니다.
+    """
+    ordered_ids = list(dict.fromkeys(quiz_ids))
+    quizzes = {quiz.id: quiz for quiz in await quiz_crud.get_quizzes_by_ids(session, ordered_ids)}
+
+    missing_ids = [quiz_id for quiz_id in ordered_ids if quiz_id not in quizzes]
+    if missing_ids and primary_session is not None:
+        for quiz in await quiz_crud.get_quizzes_by_ids(primary_session, missing_ids):
+            quizzes[quiz.id] = quiz
+        missing_ids = [quiz_id for quiz_id in missing_ids if quiz_id not in quizzes]
+
+    responses = [
+        quiz_schema.QuizResponse.from_quiz(quizzes[quiz_id], quizzes[quiz_id].latest_validation_status or "pending")
+        for quiz_id in ordered_ids
+        if quiz_id in quizzes
+    ]
+    return quiz_schema.QuizBatchResponse(quizzes=responses, total=len(responses), missing_ids=missing_ids)
+
+
 async def get_next_study_quiz(
     session: AsyncSession,
     sub_topic_id: int,
@@ -491,7 +524,7 @@ async def get_next_study_quiz(
         raise SubTopicNotFoundError(sub_topic_id)
     
     # 핵심 정보 확인
-    if not sub_topic.core_content:
+    if not sub_topic.core_content_count:
         raise InvalidQuizRequestError(f"세부항목에 핵심 정보가 없습니다: {sub_topic_id}")
     
     # 1. DB에서 해당 세부항목의 기존 문제 조회 (랜덤 1개, 이미 본 문제 제외)
@@ -505,7 +538,7 @@ async def get_next_study_quiz(
     # 2. 기존 문제가 있으면 변형하여 반환 (토큰 절약)
     if existing_quizzes:
         existing_quiz = existing_quizzes[0]
-        quiz_response = quiz_schema.QuizResponse.model_validate(existing_quiz)
+        quiz_response = await _create_quiz_response_with_status(session, existing_quiz)
         
         # 문제 변형 (선택지 순서 섞기 또는 문제 문장 변형)
         # 70% 확률로 변형, 30% 확률로 원본 그대로
@@ -569,20 +602,9 @@ async def get_next_study_quiz(
     
     try:
         # 핵심 정보를 기반으로 문제 생성 (모든 핵심 정보 종합 활용)
-        # 구분자로 분리된 모든 핵심 정보를 조회
-        core_contents = sub_topic_crud.parse_core_contents(sub_topic.core_content, sub_topic.source_type)
-        
-        # 모든 핵심 정보를 종합하여 문제 생성에 활용
-        if core_contents:
-            # 각 핵심 정보를 명확히 구분하여 결합
-            combined_parts = []
-            for idx, item in enumerate(core_contents, 1):
-                source_type_label = "텍스트" if item["source_type"] == "text" else "YouTube URL"
-                combined_parts.append(f"[핵심 정보 {idx} - {source_type_label}]\n{item['core_content']}")
-            combined_content = "\n\n".join(combined_parts)
-        else:
-            # 핵심 정보가 없는 경우 (이미 위에서 체크했지만 안전장치)
-            combined_content = sub_topic.core_content or ""
+        core_items = await sub_topic_crud.get_core_content_items(session, sub_topic_id)
+        combined_content = _combine_core_contents(core_items)
+        core_content_blob = sub_topic_crud.build_legacy_core_content(core_items)
         
         # 모든 핵심 정보를 종합하여 문제 생성
         ai_request = ai.AIQuizGenerationRequest(
@@ -599,8 +621,7 @@ async def get_next_study_quiz(
         if settings.auto_validate_quiz and random.random() < settings.auto_validate_sample_rate:
             try:
                 category = f"{sub_topic.main_topic.subject.name} > {sub_topic.main_topic.name} > {sub_topic.name}"
-                import json
-                options = json.loads(ai_response.options_json) if isinstance(ai_response.options_json, str) else [{"index": opt.index, "text": opt.text} for opt in ai_response.options]
+                options = ai_response.options_data
                 
                 # 간단한 키워드 기반 사전 필터링 (토큰 없이)
                 if _simple_keyword_check(ai_response.question, category):
@@ -623,7 +644,7 @@ async def get_next_study_quiz(
         
         # 해시 생성 (핵심 정보 기반)
         source_hash = youtube_service.generate_hash(
-            f"{sub_topic.core_content}_{sub_topic_id}_{random.randint(1000, 9999)}"
+            f"{core_content_blob}_{sub_topic_id}_{random.randint(1000, 9999)}"
         )
         
         # 중복 확인
@@ -666,8 +687,8 @@ async def get_next_study_quiz(
         
         return quiz_response
         
-    except GeminiServiceUnavailableError:
-        logger.error(f"Gemini API 과부하: sub_topic_id={sub_topic_id}")
+    except (GeminiServiceUnavailableError, DeadlineExceededError) as e:
+        logger.error(f"문제 생성 중단: sub_topic_id={sub_topic_id}, 사유={e.__class__.__name__}")
         raise
     except Exception as e:
         logger.error(
@@ -683,7 +704,6 @@ async def validate_quiz(
     quiz_id: int,
 ) -> quiz_schema.QuizValidationResponse:
     """문제 검증: Gemini로 생성된 문제가 카테고리에 맞는지 재검증"""
-    import json
     from app.crud import quiz_validation as validation_crud
     
     quiz = await quiz_crud.get_quiz_by_id(session, quiz_id, load_relationships=True)
@@ -697,9 +717,11 @@ async def validate_quiz(
     elif quiz.subject:
         category = quiz.subject.name
     
-    # 선택지 파싱
-    options = json.loads(quiz.options) if isinstance(quiz.options, str) else quiz.options
+    # 선택지 (JSONB, 이미 역직렬화됨)
+    options = quiz.options
     
+    # 조회 → Gemini 호출 → 저장: 호출 중에는 커넥션을 반납하고 저장은 새 트랜잭션으로 수행
+    await _end_read_transaction(session)
     try:
         validation_result = await ai_service.validate_quiz_with_gemini(
             question=quiz.question,
@@ -765,8 +787,6 @@ async def request_quiz_correction(
     request: quiz_schema.QuizCorrectionRequest,
 ) -> quiz_schema.QuizCorrectionResponse:
     """문제 수정 요청: 사용자 피드백을 Gemini로 검증 후 수정"""
-    import json
-    
     quiz = await quiz_crud.get_quiz_by_id(session, request.quiz_id)
     if not quiz:
         raise QuizNotFoundError(request.quiz_id)
@@ -778,9 +798,11 @@ async def request_quiz_correction(
     elif quiz.subject:
         category = quiz.subject.name
     
-    # 선택지 파싱
-    options = json.loads(quiz.options) if isinstance(quiz.options, str) else quiz.options
+    # 선택지 (JSONB, 이미 역직렬화됨)
+    options = quiz.options
     
+    # 조회 → Gemini 호출 → 저장: 호출 중에는 커넥션을 반납하고 저장은 새 트랜잭션으로 수행
+    await _end_read_transaction(session)
     try:
         # Gemini로 수정 요청 평가 및 수정된 문제 생성
         correction_result = await ai_service.evaluate_correction_request_with_gemini(
@@ -798,16 +820,11 @@ async def request_quiz_correction(
         # 수정 요청이 타당한 경우 문제 수정
         if is_valid and correction_result.get("corrected_question"):
             # 수정된 문제로 업데이트
-            corrected_options_json = json.dumps(
-                correction_result.get("corrected_options", []),
-                ensure_ascii=False
-            )
-            
             updated_quiz = await quiz_crud.update_quiz(
                 session,
                 request.quiz_id,
                 question=correction_result.get("corrected_question"),
-                options=corrected_options_json,
+                options=correction_result.get("corrected_options", []),
                 correct_answer=correction_result.get("correct_answer", 0),
                 explanation=correction_result.get("corrected_explanation"),
             )
@@ -832,80 +849,52 @@ async def request_quiz_correction(
 
 async def get_quiz_dashboard(
     session: AsyncSession,
+    validation_page: int = 1,
+    validation_limit: int = 20,
 ) -> quiz_schema.QuizDashboardResponse:
     """관리자 대시보드: 문제 목록과 카테고리 매칭 상태 시각화
     
     카테고리별 상태:
     - normal: 정상 (문제 개수 충분, 문제 생산 가능)
     - insufficient: 부족 (문제 개수 10개 미만)
-    - production_difficult: 생산 어려움 (재시도 초과로 문제 생산 중단 가능성)
+    - production_difficult: 생산 어려움 (유사도 재시도 초과로 문제 생산이 연속 중단됨)
     """
-    from sqlalchemy import func, select
-    from sqlalchemy.orm import joinedload
+    from sqlalchemy import select
     from app.models.quiz import Quiz
-    from app.models.sub_topic import SubTopic
-    from app.models.main_topic import MainTopic
     from app.crud import quiz_validation as validation_crud
     
-    # 전체 문제 개수
-    total_count = await session.scalar(select(func.count(Quiz.id)))
+    # 검증 상태별 개수 조회 (합계가 전체 문제 개수)
+    validation_status_counts = await validation_crud.get_validation_status_counts(session)
+    total_count = sum(validation_status_counts.values())
     
     # 카테고리별 문제 개수 및 상태 조회
     quizzes_by_category = {}
     category_status = {}
     
-    sub_topics_result = await session.execute(
-        select(SubTopic)
-        .join(SubTopic.main_topic)
-        .options(joinedload(SubTopic.main_topic).joinedload(MainTopic.subject))
-        .where(MainTopic.subject_id == 1)  # ADsP 전용
-        .order_by(MainTopic.id, SubTopic.id)
-    )
-    sub_topics = sub_topics_result.unique().scalars().all()
+    # 분류 체계는 캐시에서 조회 (카테고리 경로 포함, ADsP 전용)
+    sub_topics = await taxonomy_crud.get_sub_topics()
     sub_topic_ids = [sub_topic.id for sub_topic in sub_topics]
     
-    quiz_counts = {}
-    latest_quiz_times = {}
-    if sub_topic_ids:
-        quiz_counts_result = await session.execute(
-            select(Quiz.sub_topic_id, func.count(Quiz.id))
-            .where(Quiz.sub_topic_id.in_(sub_topic_ids))
-            .group_by(Quiz.sub_topic_id)
-        )
-        quiz_counts = {row[0]: row[1] for row in quiz_counts_result.all()}
-        
-        latest_quiz_times_result = await session.execute(
-            select(Quiz.sub_topic_id, func.max(Quiz.created_at))
-            .where(Quiz.sub_topic_id.in_(sub_topic_ids))
-            .group_by(Quiz.sub_topic_id)
-        )
-        latest_quiz_times = {row[0]: row[1] for row in latest_quiz_times_result.all()}
+    # 세부항목별 문제 재고 집계 (quizzes 전체 group by 대신 집계 테이블 조회)
+    quiz_stats_map = await stats_crud.get_sub_topic_quiz_stats_map(session, sub_topic_ids)
     
     for sub_topic in sub_topics:
-        subject_name = (
-            sub_topic.main_topic.subject.name
-            if sub_topic.main_topic and sub_topic.main_topic.subject
-            else "ADsP"
-        )
-        main_topic_name = sub_topic.main_topic.name if sub_topic.main_topic else "알 수 없음"
-        category = f"{subject_name} > {main_topic_name} > {sub_topic.name}"
+        category = sub_topic.category_path
         
-        quiz_count = quiz_counts.get(sub_topic.id, 0)
+        quiz_stats = quiz_stats_map.get(sub_topic.id)
+        quiz_count = quiz_stats.quiz_count if quiz_stats else 0
         quizzes_by_category[category] = quiz_count
         
         # 카테고리 상태 판단
-        status = "normal"
-        if quiz_count < 10:
+        if (
+            quiz_stats
+            and quiz_stats.consecutive_similarity_failures >= PRODUCTION_DIFFICULT_FAILURE_THRESHOLD
+        ):
+            status = "production_difficult"  # 유사도 재시도 초과로 생산이 연속 중단됨
+        elif quiz_count < 10:
             status = "insufficient"  # 부족 (10개 미만)
         else:
-            latest_created_at = latest_quiz_times.get(sub_topic.id)
-            if latest_created_at and sub_topic.updated_at:
-                if sub_topic.updated_at <= latest_created_at:
-                    status = "normal"
-                else:
-                    status = "normal"
-            else:
-                status = "normal"
+            status = "normal"
         
         category_status[category] = status
     
@@ -916,60 +905,22 @@ async def get_quiz_dashboard(
         .limit(10)
     )
     recent_quizzes_models = recent_quizzes_result.scalars().all()
-    recent_quiz_ids = [q.id for q in recent_quizzes_models]
-    
-    # 검증 상태별 개수 조회
-    validation_status_counts = await validation_crud.get_validation_status_counts(session)
-    
-    # 검증이 필요한 문제 ID 목록 조회
-    quiz_ids_needing_validation = await validation_crud.get_quizzes_needing_validation(session)
     
-    # 검증이 필요한 문제 상세 정보 조회
-    if quiz_ids_needing_validation:
-        quizzes_needing_validation_result = await session.execute(
-            select(Quiz)
-            .where(Quiz.id.in_(quiz_ids_needing_validation))
-            .order_by(Quiz.created_at.desc())
-        )
-        quizzes_needing_validation_models = quizzes_needing_validation_result.scalars().all()
-    else:
-        quizzes_needing_validation_models = []
-    
-    # 모든 quiz_id에 대한 validation_status 일괄 조회
-    all_quiz_ids = list(set(recent_quiz_ids + quiz_ids_needing_validation))
-    validation_statuses = await validation_crud.get_latest_validation_statuses(session, all_quiz_ids)
-    
-    # recent_quizzes에 validation_status 추가
-    recent_quizzes = []
-    for q in recent_quizzes_models:
-        quiz_dict = {
-            "id": q.id,
-            "subject_id": q.subject_id,
-            "question": q.question,
-            "options": q.options,
-            "correct_answer": q.correct_answer,
-            "explanation": q.explanation,
-            "source_url": q.source_url,
-            "created_at": q.created_at,
-            "validation_status": validation_statuses.get(q.id, "pending"),
-        }
-        recent_quizzes.append(quiz_schema.QuizResponse.model_validate(quiz_dict))
-    
-    # quizzes_needing_validation에 validation_status 추가
-    quizzes_needing_validation = []
-    for q in quizzes_needing_validation_models:
-        quiz_dict = {
-            "id": q.id,
-            "subject_id": q.subject_id,
-            "question": q.question,
-            "options": q.options,
-            "correct_answer": q.correct_answer,
-            "explanation": q.explanation,
-            "source_url": q.source_url,
-            "created_at": q.created_at,
-            "validation_status": validation_statuses.get(q.id, "pending"),
-        }
-        quizzes_needing_validation.append(quiz_schema.QuizResponse.model_validate(quiz_dict))
+    # 검증이 필요한 문제는 페이지 단위로 조회 (전체 개수는 검증 상태별 개수로 계산)
+    quizzes_needing_validation_models = await validation_crud.get_quizzes_needing_validation_page(
+        session, page=validation_page, limit=validation_limit
+    )
+    needing_validation_total = validation_status_counts["pending"] + validation_status_counts["invalid"]
+    
+    # 문제 행의 최신 검증 상태(비정규화 컬럼)를 그대로 사용 (추가 조회 없음)
+    recent_quizzes = [
+        quiz_schema.QuizResponse.from_quiz(q, q.latest_validation_status or "pending")
+        for q in recent_quizzes_models
+    ]
+    quizzes_needing_validation = [
+        quiz_schema.QuizResponse.from_quiz(q, q.latest_validation_status or "pending")
+        for q in quizzes_needing_validation_models
+    ]
     
     return quiz_schema.QuizDashboardResponse(
         total_quizzes=total_count or 0,
@@ -978,6 +929,10 @@ async def get_quiz_dashboard(
         validation_status=validation_status_counts,
         recent_quizzes=recent_quizzes,
         quizzes_needing_validation=quizzes_needing_validation,
+        quizzes_needing_validation_total=needing_validation_total,
+        validation_page=validation_page,
+        validation_limit=validation_limit,
+        validation_total_pages=(needing_validation_total + validation_limit - 1) // validation_limit,
     )
 
 
@@ -998,6 +953,15 @@ def _calculate_question_similarity(q1: str, q2: str) -> float:
     return calculate_question_similarity(q1, q2)
 
 
+def _combine_core_contents(core_items: Sequence[CoreContentItem]) -> str:
+    """핵심 정보 항목을 명확히 구분하여 하나의 생성 입력으로 결합 (최신순)"""
+    combined_parts = []
+    for idx, item in enumerate(core_items, 1):
+        source_type_label = "텍스트" if item.source_type == "text" else "YouTube URL"
+        combined_parts.append(f"[핵심 정보 {idx} - {source_type_label}]\n{item.content}")
+    return "\n\n".join(combined_parts)
+
+
 def _simple_keyword_check(question: str, category: str) -> bool:
     """간단한 키워드 기반 사전 필터링 (토큰 없이)
     
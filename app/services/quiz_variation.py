@@ -47,19 +47,8 @@ def vary_quiz_options(quiz: QuizResponse) -> QuizResponse:
             f"정답 인덱스 {quiz.correct_answer} → {new_correct_answer}"
         )
     
-    # 변형된 문제 반환
-    varied_quiz = QuizResponse(
-        id=quiz.id,
-        subject_id=quiz.subject_id,
-        question=quiz.question,
-        options=new_options,
-        correct_answer=new_correct_answer,
-        explanation=quiz.explanation,
-        source_url=quiz.source_url,
-        created_at=quiz.created_at,
-    )
-    
-    return varied_quiz
+    # 변형된 문제 반환 (재검증 없이 복사, validation_status 유지)
+    return quiz.model_copy(update={"options": new_options, "correct_answer": new_correct_answer})
 
 
 def vary_quiz_question(quiz: QuizResponse) -> QuizResponse:
@@ -132,16 +121,8 @@ def vary_quiz_question(quiz: QuizResponse) -> QuizResponse:
     # 원본과 다른 변형 선택
     variation = random.choice(variations)
     
-    varied_quiz = QuizResponse(
-        id=quiz.id,
-        subject_id=quiz.subject_id,
-        question=variation["question"],
-        options=variation["options"],
-        correct_answer=variation["correct_answer"],
-        explanation=quiz.explanation,
-        source_url=quiz.source_url,
-        created_at=quiz.created_at,
-    )
+    # 재검증 없이 복사 (validation_status 유지)
+    varied_quiz = quiz.model_copy(update=variation)
     
     logger.debug(f"문제 문장 변형: quiz_id={quiz.id}")
     
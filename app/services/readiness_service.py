@@ -0,0 +1,105 @@
+"""준비 상태 확인 (/ready)
+
+/health는 프로세스 생존만 확인하고, /ready는 요청을 받아도 되는지 판단합니다.
+- DB 왕복이 readiness_db_timeout 안에 끝나지 않거나 실패하면 준비 안 됨
+- 커넥션 풀 사용률이 readiness_pool_saturation_threshold 이상이면 준비 안 됨
+  (요청이 풀 대기열에 쌓이기 전에 로드밸런서가 트래픽을 다른 인스턴스로 돌리도록)
+- Gemini 동시 요청 슬롯, 작업 워커, 분류 체계 캐시 상태는 보고만 함
+  (AI/비동기 작업만 느려지는 상황에서 일반 조회 트래픽까지 빼지 않기 위해)
+"""
+import asyncio
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.core.db_pool import get_pool_status
+from app.crud.taxonomy import taxonomy_cache
+from app.models.base import get_engine
+from app.services.ai_service import get_gemini_limiter
+from app.services.job_service import job_worker_pool
+
+
+async def check_database(engine: AsyncEngine, timeout: float) -> dict:
+    """SELECT 1 왕복 시간 (커넥션 획득 대기 포함, timeout 초 초과 시 실패)"""
+    start = time.perf_counter()
+    try:
+        async with asyncio.timeout(timeout):
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+    except TimeoutError:
+        return {"status": "timeout", "latency_ms": round(timeout * 1000, 1)}
+    except Exception as e:
+        return {"status": "error", "error": e.__class__.__name__}
+    return {"status": "ok", "latency_ms": round((time.perf_counter() - start) * 1000, 1)}
+
+
+def pool_saturation(pool_status: dict) -> float | None:
+    """사용 중인 커넥션 / 최대 커넥션 수 (크기 제한이 없는 풀이면 None)"""
+    pool_size, max_overflow = pool_status["pool_size"], pool_status["max_overflow"]
+    if pool_size is None or max_overflow is None or max_overflow < 0:
+        return None
+    capacity = pool_size + max_overflow
+    if capacity <= 0:
+        return None
+    return round(pool_status["checked_out"] / capacity, 3)
+
+
+def check_pool(engine: AsyncEngine, threshold: float) -> dict:
+    """커넥션 풀 사용률"""
+    pool_status = get_pool_status(engine.pool)
+    saturation = pool_saturation(pool_status)
+    return {
+        "status": "saturated" if saturation is not None and saturation >= threshold else "ok",
+        "saturation": saturation,
+        "threshold": threshold,
+        "checked_out": pool_status["checked_out"],
+        "pool_size": pool_status["pool_size"],
+        "max_overflow": pool_status["max_overflow"],
+        "timeouts": pool_status.get("timeouts", 0),
+    }
+
+
+def check_ai() -> dict:
+    """Gemini 동시 요청 슬롯 사용 현황 (이 프로세스 기준)"""
+    limiter = get_gemini_limiter()
+    in_use = limiter.in_use
+    return {
+        "status": "saturated" if in_use >= limiter.max_concurrent else "ok",
+        "backend": settings.gemini_limiter_backend,
+        "in_use": in_use,
+        "max_concurrent": limiter.max_concurrent,
+        "api_key_configured": bool(settings.gemini_api_key),
+    }
+
+
+def check_workers() -> dict:
+    """비동기 작업 워커 생존 여부"""
+    alive = job_worker_pool.alive_workers
+    return {
+        "status": "ok" if alive == job_worker_pool.concurrency else "degraded",
+        "alive": alive,
+        "expected": job_worker_pool.concurrency,
+    }
+
+
+def check_caches() -> dict:
+    """프로세스 로컬 캐시 적재 여부"""
+    return {"taxonomy": {"warm": taxonomy_cache.is_warm, "version": taxonomy_cache.version}}
+
+
+async def check_readiness(engine: AsyncEngine | None = None) -> tuple[bool, dict]:
+    """(준비 여부, 항목별 상태)"""
+    engine = engine or get_engine()
+    database = await check_database(engine, settings.readiness_db_timeout)
+    pool = check_pool(engine, settings.readiness_pool_saturation_threshold)
+    ready = database["status"] == "ok" and pool["status"] == "ok"
+    return ready, {
+        "status": "ready" if ready else "unavailable",
+        "database": database,
+        "pool": pool,
+        "ai": check_ai(),
+        "workers": check_workers(),
+        "caches": check_caches(),
+    }
@@ -0,0 +1,68 @@
+"""서버 시작 시 준비 작업
+
+배포 직후 첫 요청이 커넥션 생성, 분류 체계 캐시 적재, SQL 컴파일 비용을 모두 떠안지 않도록
+lifespan에서 미리 수행합니다. 실패하거나 시간이 초과되어도 서버 시작은 막지 않습니다.
+"""
+import asyncio
+import contextlib
+import logging
+import time
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.core.config import settings
+from app.crud import quiz as quiz_crud, quiz_validation as validation_crud, taxonomy as taxonomy_crud
+from app.models.base import get_async_session_maker, get_engine
+
+logger = logging.getLogger(__name__)
+
+# 존재하지 않는 ID (결과 없이 쿼리 컴파일/준비만 수행)
+_WARMUP_ID = 0
+
+
+async def prewarm_connections(engine: AsyncEngine, count: int) -> None:
+    """커넥션 count개를 동시에 열었다가 풀에 반환 (pool_size 이내로 유지됨)"""
+    if count <= 0:
+        return
+    async with contextlib.AsyncExitStack() as stack:
+        await asyncio.gather(*(stack.enter_async_context(engine.connect()) for _ in range(count)))
+
+
+async def prewarm_statements(session: AsyncSession) -> None:
+    """자주 쓰는 조회 쿼리를 한 번씩 실행해 SQLAlchemy 컴파일 캐시를 채움
+
+    asyncpg prepared statement 캐시는 이 세션이 사용한 커넥션에만 채워집니다.
+    """
+    await quiz_crud.get_quiz_by_id(session, _WARMUP_ID)
+    await quiz_crud.get_quizzes_by_ids(session, [_WARMUP_ID])
+    await validation_crud.get_latest_validation_statuses(session, [_WARMUP_ID])
+    await validation_crud.get_validation_status_counts(session)
+
+
+async def prewarm() -> None:
+    """커넥션 풀, 분류 체계 캐시, 자주 쓰는 쿼리 준비"""
+    start = time.perf_counter()
+    connection_count = settings.db_prewarm_connections
+    if connection_count is None:
+        connection_count = settings.db_pool_size
+    await prewarm_connections(get_engine(), connection_count)
+
+    await taxonomy_crud.taxonomy_cache.get()
+    async with get_async_session_maker()() as session:
+        await prewarm_statements(session)
+    logger.info(
+        f"시작 준비 작업 완료: 커넥션 {connection_count}개, "
+        f"{(time.perf_counter() - start) * 1000:.0f}ms"
+    )
+
+
+async def run_startup_prewarm() -> None:
+    """lifespan용 준비 작업 (설정으로 끄거나, 실패/시간 초과 시 경고만 남기고 계속 시작)"""
+    if not settings.startup_prewarm:
+        return
+    try:
+        await asyncio.wait_for(prewarm(), timeout=settings.startup_prewarm_timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"시작 준비 작업 시간 초과 ({settings.startup_prewarm_timeout}초), 건너뛰고 시작합니다")
+    except Exception as e:
+        logger.warning(f"시작 준비 작업 실패, 건너뛰고 시작합니다: {e.__class__.__name__}: {e}")
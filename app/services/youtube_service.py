@@ -1,16 +1,53 @@
+import asyncio
 import hashlib
+import logging
+import random
 from typing import Any
 
-from youtube_transcript_api import YouTubeTranscriptApi
-from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound
+from app.core import deadline
+from app.core.config import settings
+from app.core.thread_pool import BoundedThreadPool
+from app.crud.youtube_transcript import transcript_cache
+from app.exceptions import DeadlineExceededError, TranscriptUnavailableError
 
+logger = logging.getLogger(__name__)
+
+# 자막 언어 우선순위
+TRANSCRIPT_LANGUAGES = ("ko", "en")
+
+# 자막 추출 전용 스레드 풀 (기본 executor를 Gemini 호출과 공유하지 않음)
+_transcript_pool = BoundedThreadPool(settings.transcript_fetch_workers, thread_name_prefix="transcript")
+
+
+async def get_transcript(video_id: str) -> str:
+    """캐시된 자막 반환, 없으면 추출 후 저장 (자막 없음 결과도 저장 후 ValueError)
+
+    캐시는 자체 세션을 짧게 열어 조회/저장하므로 자막 추출 동안 DB 커넥션을 잡고 있지 않습니다.
+    """
+    languages = ",".join(TRANSCRIPT_LANGUAGES)
+    cached = await transcript_cache.get(video_id, languages)
+    if cached is None:
+        try:
+            transcript = await extract_transcript(video_id)
+        except ValueError as e:
+            cached = await transcript_cache.put(video_id, languages, None, error=str(e))
+        else:
+            cached = await transcript_cache.put(video_id, languages, transcript)
+    if cached.transcript is None:
+        raise ValueError(cached.error or "자막을 찾을 수 없습니다")
+    return cached.transcript
+
+
+def _fetch_transcript_sync(video_id: str) -> str:
+    """자막 목록 조회 후 우선순위 언어 자막 다운로드 (동기 HTTP 호출, 스레드 풀에서 실행)"""
+    # youtube_transcript_api(requests 포함)는 자막 추출 시점에 import (서버 시작 시간 단축)
+    from youtube_transcript_api import YouTubeTranscriptApi
+    from youtube_transcript_api._errors import NoTranscriptFound, TranscriptsDisabled
 
-async def extract_transcript(video_id: str) -> str:
-    """YouTube 동영상 자막 추출"""
     try:
         api = YouTubeTranscriptApi()
         transcript_list = api.list(video_id)
-        transcript = transcript_list.find_transcript(["ko", "en"])
+        transcript = transcript_list.find_transcript(list(TRANSCRIPT_LANGUAGES))
         transcript_data = transcript.fetch()
         raw_data = transcript_data.to_raw_data()
         return " ".join([item["text"] for item in raw_data])
@@ -18,6 +55,56 @@ async def extract_transcript(video_id: str) -> str:
         raise ValueError(f"자막을 찾을 수 없습니다: {str(e)}")
 
 
+def _is_transient(error: Exception) -> bool:
+    """재시도하면 성공할 수 있는 오류 (네트워크 오류, YouTube HTTP 오류)"""
+    from requests import RequestException
+    from youtube_transcript_api._errors import YouTubeRequestFailed
+
+    return isinstance(error, (RequestException, YouTubeRequestFailed))
+
+
+def shutdown_transcript_pool() -> None:
+    """서버 종료 시 자막 추출 스레드 풀 정리"""
+    _transcript_pool.shutdown()
+
+
+async def extract_transcript(video_id: str) -> str:
+    """YouTube 동영상 자막 추출 (캐시를 거치지 않음, 보통은 get_transcript 사용)
+
+    동기 API 호출은 transcript_fetch_workers개로 제한된 스레드 풀에서 실행해 이벤트 루프를 막지 않습니다.
+    일시적 오류는 transcript_fetch_max_retries회까지 지수 백오프로 재시도하고,
+    시간 초과(transcript_fetch_timeout 또는 요청 데드라인)는 재시도하지 않습니다.
+    """
+    max_retries = settings.transcript_fetch_max_retries
+    attempt = 0
+    while True:
+        deadline.ensure_time_left("YouTube 자막 추출")
+        timeout = settings.transcript_fetch_timeout
+        remaining = deadline.get_remaining()
+        if remaining is not None:
+            timeout = min(timeout, remaining)
+        try:
+            return await _transcript_pool.run(_fetch_transcript_sync, video_id, timeout=timeout)
+        except TimeoutError:
+            logger.warning(f"YouTube 자막 추출 시간 초과: video_id={video_id}, {timeout:.1f}초")
+            if deadline.is_expired():
+                raise DeadlineExceededError("YouTube 자막 대기 중 요청 처리 시간이 초과되었습니다")
+            raise TranscriptUnavailableError("YouTube 자막 서버 응답이 지연되고 있습니다. 잠시 후 다시 시도해주세요.")
+        except Exception as e:
+            if not _is_transient(e):
+                raise
+            if attempt == max_retries:
+                logger.warning(f"YouTube 자막 추출 실패: video_id={video_id}, 에러={e.__class__.__name__}")
+                raise TranscriptUnavailableError() from e
+            delay = settings.transcript_fetch_backoff * (2 ** attempt) * random.uniform(0.5, 1.5)
+            logger.info(
+                f"YouTube 자막 추출 재시도 ({attempt + 1}/{max_retries}): "
+                f"video_id={video_id}, 에러={e.__class__.__name__}, {delay:.2f}초 후"
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
 def extract_video_id(url: str) -> str:
     """YouTube URL에서 video_id 추출"""
     if "youtube.com/watch?v=" in url:
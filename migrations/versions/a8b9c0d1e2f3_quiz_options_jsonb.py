@@ -0,0 +1,92 @@
+"""quiz_options_jsonb
+
+Revision ID: a8b9c0d1e2f3
+Revises: f7a8b9c0d1e2
+Create Date: 2026-02-06 10:00:00.000000
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a8b9c0d1e2f3"
+down_revision: Union[str, Sequence[str], None] = "f7a8b9c0d1e2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 4지선다
+MAX_OPTIONS = 4
+
+
+def _normalize_options(raw: str, correct_answer: int) -> tuple[list[dict], int] | None:
+    """기존 텍스트 선택지를 4지선다 리스트로 정리 (응답 변환 시 하던 제한 로직을 한 번만 적용)
+
+    정리가 필요 없으면 None을 반환합니다.
+    """
+    try:
+        options = json.loads(raw)
+    except (TypeError, ValueError):
+        return [], correct_answer
+    if not isinstance(options, list):
+        return [], correct_answer
+    if len(options) <= MAX_OPTIONS:
+        return None
+
+    if 0 <= correct_answer < len(options):
+        # 정답 1개 + 오답 3개, 정답은 첫 번째
+        wrong_options = [opt for i, opt in enumerate(options) if i != correct_answer]
+        kept = [options[correct_answer]] + wrong_options[:MAX_OPTIONS - 1]
+        new_correct_answer = 0
+    else:
+        # 정답 인덱스가 유효하지 않으면 처음 4개만 사용
+        kept = options[:MAX_OPTIONS]
+        new_correct_answer = correct_answer if correct_answer < MAX_OPTIONS else 0
+    return [{"index": i, "text": opt["text"]} for i, opt in enumerate(kept)], new_correct_answer
+
+
+def upgrade() -> None:
+    """quizzes.options를 TEXT에서 JSONB로 변경 (4개 초과 선택지는 이관 시 정리)"""
+    connection = op.get_bind()
+    quizzes = connection.execute(
+        sa.text("SELECT id, options, correct_answer FROM quizzes")
+    ).fetchall()
+
+    for quiz_id, raw_options, correct_answer in quizzes:
+        normalized = _normalize_options(raw_options, correct_answer)
+        if normalized is None:
+            continue
+        options, new_correct_answer = normalized
+        connection.execute(
+            sa.text("UPDATE quizzes SET options = :options, correct_answer = :correct_answer WHERE id = :id"),
+            {
+                "options": json.dumps(options, ensure_ascii=False),
+                "correct_answer": new_correct_answer,
+                "id": quiz_id,
+            },
+        )
+
+    op.alter_column(
+        "quizzes",
+        "options",
+        existing_type=sa.Text,
+        type_=JSONB,
+        existing_nullable=False,
+        postgresql_using="options::jsonb",
+    )
+
+
+def downgrade() -> None:
+    """quizzes.options를 TEXT로 되돌림 (정리된 선택지는 복원하지 않음)"""
+    op.alter_column(
+        "quizzes",
+        "options",
+        existing_type=JSONB,
+        type_=sa.Text,
+        existing_nullable=False,
+        postgresql_using="options::text",
+    )
@@ -0,0 +1,35 @@
+"""add_concurrency_leases_table
+
+Revision ID: c0d1e2f3a4b5
+Revises: b9c0d1e2f3a4
+Create Date: 2026-02-12 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c0d1e2f3a4b5"
+down_revision: Union[str, Sequence[str], None] = "b9c0d1e2f3a4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """concurrency_leases 테이블 생성 (여러 워커/컨테이너가 공유하는 Gemini 동시 요청 슬롯)"""
+    op.create_table(
+        "concurrency_leases",
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("slot", sa.Integer(), nullable=False),
+        sa.Column("holder", sa.String(length=100), nullable=True),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("name", "slot"),
+    )
+
+
+def downgrade() -> None:
+    """concurrency_leases 테이블 제거"""
+    op.drop_table("concurrency_leases")
@@ -0,0 +1,36 @@
+"""add_quiz_random_key
+
+Revision ID: c3d4e5f6a7b8
+Revises: b8c9d0e1f2a3
+Create Date: 2026-02-02 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3d4e5f6a7b8"
+down_revision: Union[str, Sequence[str], None] = "b8c9d0e1f2a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """랜덤 샘플링용 random_key 컬럼 및 인덱스 추가"""
+    # 기존 행은 PostgreSQL random() (0 이상 1 미만)으로 채움
+    op.add_column(
+        "quizzes",
+        sa.Column("random_key", sa.Float, server_default=sa.text("random()"), nullable=False),
+    )
+    op.create_index("ix_quizzes_subject_id_random_key", "quizzes", ["subject_id", "random_key"])
+    op.create_index("ix_quizzes_sub_topic_id_random_key", "quizzes", ["sub_topic_id", "random_key"])
+
+
+def downgrade() -> None:
+    """random_key 컬럼 및 인덱스 제거"""
+    op.drop_index("ix_quizzes_sub_topic_id_random_key", table_name="quizzes")
+    op.drop_index("ix_quizzes_subject_id_random_key", table_name="quizzes")
+    op.drop_column("quizzes", "random_key")
@@ -0,0 +1,38 @@
+"""add_youtube_transcripts_table
+
+Revision ID: d1e2f3a4b5c6
+Revises: c0d1e2f3a4b5
+Create Date: 2026-02-13 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d1e2f3a4b5c6"
+down_revision: Union[str, Sequence[str], None] = "c0d1e2f3a4b5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """youtube_transcripts 테이블 생성 (YouTube 자막 캐시, 자막 없음 결과 포함)"""
+    op.create_table(
+        "youtube_transcripts",
+        sa.Column("video_id", sa.String(length=20), nullable=False),
+        sa.Column("languages", sa.String(length=50), nullable=False),
+        sa.Column("transcript", sa.Text(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("video_id", "languages"),
+    )
+
+
+def downgrade() -> None:
+    """youtube_transcripts 테이블 제거"""
+    op.drop_table("youtube_transcripts")
@@ -0,0 +1,49 @@
+"""add_quiz_latest_validation
+
+Revision ID: d5e6f7a8b9c0
+Revises: c3d4e5f6a7b8
+Create Date: 2026-02-03 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d5e6f7a8b9c0"
+down_revision: Union[str, Sequence[str], None] = "c3d4e5f6a7b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """quizzes에 최신 검증 상태 컬럼 추가 및 기존 검증 이력으로 채우기"""
+    op.add_column("quizzes", sa.Column("latest_validation_status", sa.String(), nullable=True))
+    op.add_column("quizzes", sa.Column("latest_validated_at", sa.DateTime(timezone=True), nullable=True))
+    op.create_index(
+        op.f("ix_quizzes_latest_validation_status"), "quizzes", ["latest_validation_status"], unique=False
+    )
+
+    # 문제별 최신 검증 결과로 백필 (updated_at은 유지)
+    op.execute(
+        """
+        UPDATE quizzes AS q
+        SET latest_validation_status = v.validation_status,
+            latest_validated_at = v.validated_at
+        FROM (
+            SELECT DISTINCT ON (quiz_id) quiz_id, validation_status, validated_at
+            FROM quiz_validations
+            ORDER BY quiz_id, validated_at DESC, id DESC
+        ) AS v
+        WHERE q.id = v.quiz_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """최신 검증 상태 컬럼 제거"""
+    op.drop_index(op.f("ix_quizzes_latest_validation_status"), table_name="quizzes")
+    op.drop_column("quizzes", "latest_validated_at")
+    op.drop_column("quizzes", "latest_validation_status")
@@ -0,0 +1,30 @@
+"""add_job_owner_lease
+
+Revision ID: e2f3a4b5c6d7
+Revises: d1e2f3a4b5c6
+Create Date: 2026-02-14 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e2f3a4b5c6d7"
+down_revision: Union[str, Sequence[str], None] = "d1e2f3a4b5c6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """jobs에 실행 프로세스와 임대 만료 시각 추가 (여러 프로세스가 같은 작업을 중복 복구하지 않도록)"""
+    op.add_column("jobs", sa.Column("owner", sa.String(length=100), nullable=True))
+    op.add_column("jobs", sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """jobs의 실행 프로세스/임대 만료 시각 제거"""
+    op.drop_column("jobs", "lease_expires_at")
+    op.drop_column("jobs", "owner")
@@ -0,0 +1,56 @@
+"""add_sub_topic_quiz_stats
+
+Revision ID: e6f7a8b9c0d1
+Revises: d5e6f7a8b9c0
+Create Date: 2026-02-04 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e6f7a8b9c0d1"
+down_revision: Union[str, Sequence[str], None] = "d5e6f7a8b9c0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """세부항목별 문제 재고 집계 테이블 생성 및 기존 문제로 백필"""
+    op.create_table(
+        "sub_topic_quiz_stats",
+        sa.Column(
+            "sub_topic_id",
+            sa.Integer,
+            sa.ForeignKey("sub_topics.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("quiz_count", sa.Integer, server_default="0", nullable=False),
+        sa.Column("latest_quiz_created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_generation_attempt_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "consecutive_similarity_failures",
+            sa.Integer,
+            server_default="0",
+            nullable=False,
+            comment="유사 문제 재시도 초과로 생성이 중단된 연속 횟수",
+        ),
+    )
+
+    op.execute(
+        """
+        INSERT INTO sub_topic_quiz_stats (sub_topic_id, quiz_count, latest_quiz_created_at)
+        SELECT sub_topic_id, COUNT(*), MAX(created_at)
+        FROM quizzes
+        WHERE sub_topic_id IS NOT NULL
+        GROUP BY sub_topic_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """세부항목별 문제 재고 집계 테이블 제거"""
+    op.drop_table("sub_topic_quiz_stats")
@@ -0,0 +1,29 @@
+"""add_youtube_transcripts_expires_at_index
+
+Revision ID: f3a4b5c6d7e8
+Revises: e2f3a4b5c6d7
+Create Date: 2026-02-15 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f3a4b5c6d7e8"
+down_revision: Union[str, Sequence[str], None] = "e2f3a4b5c6d7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """youtube_transcripts.expires_at 인덱스 추가 (만료된 자막 캐시 주기적 삭제용)"""
+    op.create_index(
+        op.f("ix_youtube_transcripts_expires_at"), "youtube_transcripts", ["expires_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """youtube_transcripts.expires_at 인덱스 제거"""
+    op.drop_index(op.f("ix_youtube_transcripts_expires_at"), table_name="youtube_transcripts")
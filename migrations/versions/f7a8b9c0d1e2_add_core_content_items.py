@@ -0,0 +1,141 @@
+"""add_core_content_items
+
+Revision ID: f7a8b9c0d1e2
+Revises: e6f7a8b9c0d1
+Create Date: 2026-02-05 10:00:00.000000
+
+"""
+import hashlib
+import re
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f7a8b9c0d1e2"
+down_revision: Union[str, Sequence[str], None] = "e6f7a8b9c0d1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 기존 blob 형식 (최신 항목이 앞에 오도록 구분자로 결합)
+CORE_CONTENT_SEPARATOR = "\n\n--- 추가 데이터 ---\n\n"
+METADATA_PATTERN = re.compile(r'^\[source_type:([^\]]+)\]\s*(.*)$', re.DOTALL)
+
+LEGACY_VIEW_SQL = """
+CREATE VIEW sub_topic_core_content_legacy AS
+SELECT
+    sub_topic_id,
+    string_agg(
+        '[source_type:' || source_type || ']' || content,
+        E'\\n\\n--- 추가 데이터 ---\\n\\n'
+        ORDER BY position DESC
+    ) AS core_content
+FROM core_content_items
+GROUP BY sub_topic_id
+"""
+
+
+def _split_legacy_blob(core_content: str, default_source_type: str) -> list[tuple[str, str]]:
+    """기존 blob을 (source_type, content) 목록으로 분리 (최신순)"""
+    items = []
+    for part in core_content.split(CORE_CONTENT_SEPARATOR):
+        cleaned = part.strip()
+        if not cleaned:
+            continue
+        match = METADATA_PATTERN.match(cleaned)
+        if match:
+            items.append((match.group(1), match.group(2).strip()))
+        else:
+            items.append((default_source_type, cleaned))
+    return items
+
+
+def upgrade() -> None:
+    """핵심 정보 항목 테이블 생성, 기존 blob 분리 이관 후 호환 뷰로 대체"""
+    op.create_table(
+        "core_content_items",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column(
+            "sub_topic_id",
+            sa.Integer,
+            sa.ForeignKey("sub_topics.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("position", sa.Integer, nullable=False, comment="세부항목 내 추가 순번 (1부터, 클수록 최신)"),
+        sa.Column("source_type", sa.String, nullable=False, comment="소스 타입 (text | youtube_url)"),
+        sa.Column("content", sa.Text, nullable=False),
+        sa.Column("content_hash", sa.String(64), nullable=False, comment="content의 SHA-256 (hex)"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.UniqueConstraint("sub_topic_id", "position", name="uq_core_content_items_sub_topic_id_position"),
+    )
+    op.add_column(
+        "sub_topics",
+        sa.Column(
+            "core_content_count",
+            sa.Integer,
+            server_default="0",
+            nullable=False,
+            comment="핵심 정보 항목 수 (core_content_items 다음 position 발급용)",
+        ),
+    )
+
+    connection = op.get_bind()
+    sub_topics = connection.execute(
+        sa.text(
+            "SELECT id, core_content, source_type FROM sub_topics "
+            "WHERE core_content IS NOT NULL AND core_content <> ''"
+        )
+    ).fetchall()
+
+    items_table = sa.table(
+        "core_content_items",
+        sa.column("sub_topic_id", sa.Integer),
+        sa.column("position", sa.Integer),
+        sa.column("source_type", sa.String),
+        sa.column("content", sa.Text),
+        sa.column("content_hash", sa.String),
+    )
+    for sub_topic_id, core_content, source_type in sub_topics:
+        parts = _split_legacy_blob(core_content, source_type or "text")
+        if not parts:
+            continue
+        # blob은 최신 항목이 앞이므로 뒤에서부터 position 1을 부여
+        rows = [
+            {
+                "sub_topic_id": sub_topic_id,
+                "position": len(parts) - index,
+                "source_type": item_source_type,
+                "content": content,
+                "content_hash": hashlib.sha256(content.encode("utf-8")).hexdigest(),
+            }
+            for index, (item_source_type, content) in enumerate(parts)
+        ]
+        op.bulk_insert(items_table, rows)
+        connection.execute(
+            sa.text("UPDATE sub_topics SET core_content_count = :count WHERE id = :id"),
+            {"count": len(parts), "id": sub_topic_id},
+        )
+
+    op.drop_column("sub_topics", "core_content")
+    op.execute(LEGACY_VIEW_SQL)
+
+
+def downgrade() -> None:
+    """호환 뷰의 blob을 sub_topics.core_content로 복원하고 항목 테이블 제거"""
+    op.add_column(
+        "sub_topics",
+        sa.Column("core_content", sa.Text, nullable=True, comment="핵심 정보 텍스트"),
+    )
+    op.execute(
+        """
+        UPDATE sub_topics
+        SET core_content = legacy.core_content
+        FROM sub_topic_core_content_legacy AS legacy
+        WHERE legacy.sub_topic_id = sub_topics.id
+        """
+    )
+    op.execute("DROP VIEW sub_topic_core_content_legacy")
+    op.drop_column("sub_topics", "core_content_count")
+    op.drop_table("core_content_items")
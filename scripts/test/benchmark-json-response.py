@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""QuizListResponse(50문제) JSON 직렬화 마이크로 벤치마크
+
+사용법: python scripts/test/benchmark-json-response.py [--quizzes 50] [--repeat 2000]
+"""
+import argparse
+import sys
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse
+
+from app.core import responses
+from app.schemas.quiz import QuizListResponse, QuizOptionResponse, QuizResponse
+
+
+def build_quiz_rows(count: int) -> list[SimpleNamespace]:
+    """DB에서 읽은 Quiz 행과 같은 형태의 더미 데이터"""
+    created_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [
+        SimpleNamespace(
+            id=i,
+            subject_id=1,
+            question=f"데이터 분석 기획 단계에서 {i}번째로 고려해야 할 사항으로 옳은 것은?",
+            options=[
+                {"index": j, "text": f"분석 목표 정의서 작성 및 도메인 이슈 도출 {j}"}
+                for j in range(4)
+            ],
+            correct_answer=i % 4,
+            explanation="분석 기획은 문제 정의, 데이터 확보 가능성, 분석 방법론 검토 순으로 진행합니다." * 2,
+            source_url=None,
+            created_at=created_at,
+        )
+        for i in range(count)
+    ]
+
+
+def build_legacy(rows) -> QuizListResponse:
+    """기존 방식: dict → model_validate (선택지 검증 포함)"""
+    quizzes = [
+        QuizResponse.model_validate({
+            "id": row.id,
+            "subject_id": row.subject_id,
+            "question": row.question,
+            "options": row.options,
+            "correct_answer": row.correct_answer,
+            "explanation": row.explanation,
+            "source_url": row.source_url,
+            "created_at": row.created_at,
+            "validation_status": "pending",
+        })
+        for row in rows
+    ]
+    return QuizListResponse(quizzes=quizzes, total=len(quizzes))
+
+
+def build_constructed(rows) -> list[QuizResponse]:
+    """model_construct로 생성 (검증 생략, 파이썬 구현)"""
+    return [
+        QuizResponse.model_construct(
+            id=row.id,
+            subject_id=row.subject_id,
+            question=row.question,
+            options=[QuizOptionResponse.model_construct(index=opt["index"], text=opt["text"]) for opt in row.options],
+            correct_answer=row.correct_answer,
+            explanation=row.explanation,
+            source_url=row.source_url,
+            created_at=row.created_at,
+            validation_status="pending",
+        )
+        for row in rows
+    ]
+
+
+def build_fast(rows) -> QuizListResponse:
+    """from_quiz: 이미 역직렬화된 선택지로 생성"""
+    quizzes = [QuizResponse.from_quiz(row) for row in rows]
+    return QuizListResponse.model_construct(quizzes=quizzes, total=len(quizzes))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--quizzes", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    rows = build_quiz_rows(args.quizzes)
+    model = build_fast(rows)
+
+    cases = {
+        "기존: jsonable_encoder + json.dumps (JSONResponse)": lambda: JSONResponse(jsonable_encoder(model)).body,
+        "기존 + 응답 생성: model_validate → jsonable_encoder + json.dumps": (
+            lambda: JSONResponse(jsonable_encoder(build_legacy(rows))).body
+        ),
+        "model_dump + json_dumps (orjson)" if responses.orjson else "model_dump + json_dumps (표준 json)": (
+            lambda: responses.json_dumps(model.model_dump(mode="json"))
+        ),
+        "model_json_response (pydantic-core)": lambda: responses.model_json_response(model).body,
+        "from_quiz + model_json_response": lambda: responses.model_json_response(build_fast(rows)).body,
+    }
+    # QuizResponse.from_quiz 구현 선택 근거 (응답 객체 생성만 비교)
+    build_cases = {
+        "응답 생성: model_construct (파이썬 구현)": lambda: build_constructed(rows),
+        "응답 생성: from_quiz (dict model_validate, Rust 구현)": lambda: [QuizResponse.from_quiz(row) for row in rows],
+    }
+
+    print(f"QuizListResponse: 문제 {args.quizzes}개, 반복 {args.repeat}회 (orjson={'있음' if responses.orjson else '없음'})\n")
+    for name, func in cases.items():
+        size = len(func())
+        seconds = min(timeit.repeat(func, number=args.repeat, repeat=3))
+        print(f"{name:<60} {seconds / args.repeat * 1e6:9.1f} µs/회  {size:>7} bytes")
+    print()
+    for name, func in build_cases.items():
+        seconds = min(timeit.repeat(func, number=args.repeat, repeat=3))
+        print(f"{name:<60} {seconds / args.repeat * 1e6:9.1f} µs/회")
+
+
+if __name__ == "__main__":
+    main()
@@ -63,7 +63,7 @@ async def test_db_query(sub_topic_id: int = 1):
                 print(f"  - id: {sub_topic.id}")
                 print(f"  - name: {sub_topic.name}")
                 print(f"  - main_topic_id: {sub_topic.main_topic_id}")
-                print(f"  - core_content: {sub_topic.core_content[:50] if sub_topic.core_content else 'None'}...")
+                print(f"  - core_content_count: {sub_topic.core_content_count}")
                 print(f"  - created_at: {sub_topic.created_at}")
                 print(f"  - updated_at: {sub_topic.updated_at}")
             else:
@@ -72,7 +72,12 @@ async def test_db_query(sub_topic_id: int = 1):
             # 방법 2: Raw SQL 사용
             print(f"\n[방법 2] Raw SQL로 조회:")
             result = await session.execute(
-                text("SELECT id, name, main_topic_id, core_content, created_at, updated_at FROM sub_topics WHERE id = :id"),
+                text(
+                    "SELECT s.id, s.name, s.main_topic_id, legacy.core_content, s.created_at, s.updated_at "
+                    "FROM sub_topics s "
+                    "LEFT JOIN sub_topic_core_content_legacy legacy ON legacy.sub_topic_id = s.id "
+                    "WHERE s.id = :id"
+                ),
                 {"id": sub_topic_id}
             )
             row = result.first()
@@ -1,17 +1,31 @@
 """테스트 설정 및 픽스처"""
 import pytest
+from contextlib import contextmanager
 from typing import AsyncGenerator
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from app.models.base import Base, get_db
+from app.crud.taxonomy import taxonomy_cache
+from app.crud.youtube_transcript import transcript_cache
+from app.models.base import Base, get_db, get_read_db
 from app.main import app
 from fastapi.testclient import TestClient
 
 
+@pytest.fixture(autouse=True)
+def clear_local_caches():
+    """테스트마다 새 DB를 쓰므로 분류 체계/자막 캐시 초기화"""
+    taxonomy_cache.clear()
+    transcript_cache.clear()
+    yield
+    taxonomy_cache.clear()
+    transcript_cache.clear()
+
+
 @pytest.fixture(scope="function")
-async def test_db_session():
-    """테스트용 DB 세션"""
+async def test_db_session(monkeypatch):
+    """테스트용 DB 세션 (분류 체계 캐시도 이 DB에서 읽음)"""
     engine = create_async_engine(
         "sqlite+aiosqlite:///:memory:",
         connect_args={"check_same_thread": False},
@@ -25,6 +39,7 @@ async def test_db_session():
         engine, class_=AsyncSession, expire_on_commit=False
     )
     
+    monkeypatch.setattr(taxonomy_cache, "session_factory", async_session_maker)
     async with async_session_maker() as session:
         yield session
     
@@ -35,12 +50,55 @@ async def test_db_session():
 
 
 @pytest.fixture
-def client(test_db_session):
-    """FastAPI 테스트 클라이언트 (DB 의존성 오버라이드)"""
+def transcript_cache_db(test_db_session, monkeypatch):
+    """자막 캐시가 자체 세션을 테스트 DB에서 열도록 설정"""
+    session_factory = async_sessionmaker(test_db_session.bind, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(transcript_cache, "session_factory", session_factory)
+    return session_factory
+
+
+@pytest.fixture
+def client(test_db_session, transcript_cache_db):
+    """FastAPI 테스트 클라이언트 (DB/읽기 전용 DB 의존성, 자막 캐시 세션 오버라이드)"""
     async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
         yield test_db_session
     
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     client_instance = TestClient(app)
     yield client_instance
     app.dependency_overrides.clear()
+
+
+class QueryCounter:
+    """엔진에서 실행된 SQL 문 수집 (요청당 쿼리 수 회귀 방지용)"""
+
+    def __init__(self, sync_engine):
+        self._engine = sync_engine
+        self.statements: list[str] = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    @contextmanager
+    def assert_max_queries(self, max_count: int):
+        """블록 안에서 실행된 쿼리 수가 max_count 이하인지 검사"""
+        self.statements = []
+        event.listen(self._engine, "before_cursor_execute", self._record)
+        try:
+            yield self
+        finally:
+            event.remove(self._engine, "before_cursor_execute", self._record)
+        assert len(self.statements) <= max_count, (
+            f"쿼리 {len(self.statements)}개 실행 (최대 {max_count}개):\n" + "\n".join(self.statements)
+        )
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+@pytest.fixture
+def query_counter(test_db_session):
+    """테스트 DB 세션의 쿼리 수 검사 헬퍼"""
+    return QueryCounter(test_db_session.bind.sync_engine)
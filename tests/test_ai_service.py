@@ -49,3 +49,33 @@ async def test_generate_quiz_empty_response():
         
         with pytest.raises(ValueError, match="AI 응답이 비어있습니다"):
             await generate_quiz(request)
+
+
+@pytest.mark.asyncio
+async def test_generate_quiz_backoff_stops_at_deadline():
+    """503 재시도 대기 시간이 남은 데드라인보다 길면 즉시 중단"""
+    from google.genai.errors import ServerError
+
+    from app.core import deadline
+    from app.exceptions import DeadlineExceededError
+    from app.services.ai_service import generate_quiz_with_gemini
+
+    mock_client = MagicMock()
+    mock_client.models.generate_content = MagicMock(
+        side_effect=ServerError(503, {"error": {"code": 503, "status": "UNAVAILABLE"}})
+    )
+    sleep_mock = AsyncMock()
+
+    with patch("app.services.ai_service.get_gemini_client", return_value=mock_client), \
+            patch("app.services.ai_service.asyncio.sleep", sleep_mock):
+        deadline.set_deadline(1.0)
+        try:
+            with pytest.raises(DeadlineExceededError):
+                await generate_quiz_with_gemini(
+                    AIQuizGenerationRequest(source_text="테스트 텍스트", subject_name="데이터 분석")
+                )
+        finally:
+            deadline.set_deadline(None)
+
+    assert mock_client.models.generate_content.call_count == 1
+    sleep_mock.assert_not_called()
@@ -7,6 +7,7 @@ from app.models.core_content_auto import (
     CoreContentAutoRun,
     CoreContentAutoSetting,
 )
+from app.crud import sub_topic as sub_topic_crud
 from app.models.subject import Subject
 from app.models.main_topic import MainTopic
 from app.models.sub_topic import SubTopic
@@ -23,13 +24,12 @@ async def test_get_core_content(client, test_db_session):
         main_topic_id=1,
         name="세부항목1",
         description="테스트 세부항목",
-        core_content="핵심 정보 내용",
-        source_type="text"
     )
     test_db_session.add(subject)
     test_db_session.add(main_topic)
     test_db_session.add(sub_topic)
     await test_db_session.commit()
+    await sub_topic_crud.append_sub_topic_core_content(test_db_session, 1, "핵심 정보 내용", "text")
     
     response = client.get("/api/v1/core-content/1")
     
@@ -67,8 +67,7 @@ async def test_get_core_content_null(client, test_db_session):
         id=1,
         main_topic_id=1,
         name="세부항목1",
-        description="테스트 세부항목",
-        core_content=None
+        description="테스트 세부항목"
     )
     test_db_session.add(subject)
     test_db_session.add(main_topic)
@@ -95,8 +94,7 @@ async def test_post_core_content_success(client, test_db_session):
         id=1,
         main_topic_id=1,
         name="세부항목1",
-        description="테스트 세부항목",
-        core_content=None
+        description="테스트 세부항목"
     )
     test_db_session.add(subject)
     test_db_session.add(main_topic)
@@ -132,12 +130,12 @@ async def test_post_core_content_multiple(client, test_db_session):
         main_topic_id=1,
         name="세부항목1",
         description="테스트 세부항목",
-        core_content="첫 번째 내용"
     )
     test_db_session.add(subject)
     test_db_session.add(main_topic)
     test_db_session.add(sub_topic)
     await test_db_session.commit()
+    await sub_topic_crud.append_sub_topic_core_content(test_db_session, 1, "첫 번째 내용", "text")
     
     # 두 번째 핵심 정보 추가
     response = client.post(
@@ -155,10 +153,9 @@ async def test_post_core_content_multiple(client, test_db_session):
     assert isinstance(data["core_contents"], list)
     assert len(data["core_contents"]) == 2
     
-    # 핵심 정보 내용 확인
+    # 핵심 정보 내용 확인 (최신순)
     core_content_texts = [item["core_content"] for item in data["core_contents"]]
-    assert "두 번째 내용" in core_content_texts
-    assert "첫 번째 내용" in core_content_texts
+    assert core_content_texts == ["두 번째 내용", "첫 번째 내용"]
     
     # source_type 확인
     assert all(item["source_type"] == "text" for item in data["core_contents"])
@@ -174,8 +171,7 @@ async def test_post_core_content_invalid_category(client, test_db_session):
         id=1,
         main_topic_id=2,  # main_topic_id=2에 속함
         name="세부항목1",
-        description="테스트 세부항목",
-        core_content=None
+        description="테스트 세부항목"
     )
     test_db_session.add(subject)
     test_db_session.add(main_topic1)
@@ -207,8 +203,7 @@ async def test_post_core_content_main_topic_not_found(client, test_db_session):
         id=1,
         main_topic_id=1,
         name="세부항목1",
-        description="테스트 세부항목",
-        core_content=None
+        description="테스트 세부항목"
     )
     test_db_session.add(subject)
     test_db_session.add(main_topic)
@@ -261,15 +256,13 @@ async def test_post_core_content_auto_success(client, test_db_session):
         id=1,
         main_topic_id=1,
         name="R기초",
-        description="R 기초 문법",
-        core_content=None,
+        description="R 기초 문법"
     )
     sub_topic2 = SubTopic(
         id=2,
         main_topic_id=1,
         name="데이터 마트",
-        description="데이터 마트 관련",
-        core_content=None,
+        description="데이터 마트 관련"
     )
     test_db_session.add(subject)
     test_db_session.add(main_topic)
@@ -295,10 +288,9 @@ async def test_post_core_content_auto_success(client, test_db_session):
     assert len(data["candidates"]) >= 1
     assert data["updated_at"] is not None
     
-    updated_sub_topic = await test_db_session.get(SubTopic, 1)
-    assert updated_sub_topic is not None
-    assert updated_sub_topic.core_content is not None
-    assert "R기초에서 벡터" in updated_sub_topic.core_content
+    items = await sub_topic_crud.get_core_content_items(test_db_session, 1)
+    assert len(items) == 1
+    assert "R기초에서 벡터" in items[0].content
     
     run_result = await test_db_session.execute(select(CoreContentAutoRun))
     run = run_result.scalar_one()
@@ -314,8 +306,7 @@ async def test_post_core_content_auto_youtube_url(client, test_db_session, monke
         id=1,
         main_topic_id=1,
         name="데이터베이스의 정의와 특징",
-        description="DB 정의와 특징",
-        core_content=None,
+        description="DB 정의와 특징"
     )
     test_db_session.add(subject)
     test_db_session.add(main_topic)
@@ -359,8 +350,7 @@ async def test_post_core_content_auto_invalid_source_type(client, test_db_sessio
         id=1,
         main_topic_id=1,
         name="데이터와 정보",
-        description="테스트 세부항목",
-        core_content=None,
+        description="테스트 세부항목"
     )
     test_db_session.add(subject)
     test_db_session.add(main_topic)
@@ -390,15 +380,13 @@ async def test_post_core_content_auto_pending_and_review(client, test_db_session
         id=1,
         main_topic_id=1,
         name="데이터와 정보",
-        description="데이터의 정의",
-        core_content=None,
+        description="데이터의 정의"
     )
     sub_topic2 = SubTopic(
         id=2,
         main_topic_id=1,
         name="데이터베이스의 정의와 특징",
-        description="DB 정의와 특징",
-        core_content=None,
+        description="DB 정의와 특징"
     )
     test_db_session.add(subject)
     test_db_session.add(main_topic)
@@ -435,8 +423,8 @@ async def test_post_core_content_auto_pending_and_review(client, test_db_session
     assert approve_data["status"] in ("applied", "overridden")
     assert approve_data["final_sub_topic_id"] == 2
     
-    updated_sub_topic = await test_db_session.get(SubTopic, 2)
-    assert updated_sub_topic.core_content is not None
+    items = await sub_topic_crud.get_core_content_items(test_db_session, 2)
+    assert len(items) == 1
     
     override_result = await test_db_session.execute(select(CoreContentAutoOverride))
     override = override_result.scalar_one_or_none()
@@ -476,8 +464,7 @@ async def test_post_core_content_auto_reject(client, test_db_session):
         id=1,
         main_topic_id=1,
         name="데이터와 정보",
-        description="데이터의 정의",
-        core_content=None,
+        description="데이터의 정의"
     )
     test_db_session.add(subject)
     test_db_session.add(main_topic)
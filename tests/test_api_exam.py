@@ -18,7 +18,7 @@ async def test_start_exam(client, test_db_session):
         quiz = Quiz(
             subject_id=1,
             question=f"문제 {i}",
-            options='[{"index": 0, "text": "선택지1"}]',
+            options=[{"index": 0, "text": "선택지1"}],
             correct_answer=0,
             source_hash=f"hash_{i}",
         )
@@ -48,7 +48,7 @@ async def test_start_exam_insufficient_quizzes(client, test_db_session):
     quiz = Quiz(
         subject_id=1,
         question="문제 1",
-        options='[{"index": 0, "text": "선택지1"}]',
+        options=[{"index": 0, "text": "선택지1"}],
         correct_answer=0,
         source_hash="hash_1",
     )
@@ -73,7 +73,7 @@ async def test_submit_answer(client, test_db_session):
     quiz = Quiz(
         subject_id=1,
         question="테스트 문제",
-        options='[{"index": 0, "text": "선택지1"}]',
+        options=[{"index": 0, "text": "선택지1"}],
         correct_answer=0,
         source_hash="test_hash",
     )
@@ -113,7 +113,7 @@ async def test_get_exam_result(client, test_db_session):
     quiz = Quiz(
         subject_id=1,
         question="테스트 문제",
-        options='[{"index": 0, "text": "선택지1"}]',
+        options=[{"index": 0, "text": "선택지1"}],
         correct_answer=0,
         source_hash="test_hash",
     )
@@ -0,0 +1,125 @@
+"""답안 일괄 제출 API 테스트"""
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import exam as exam_crud
+from app.models.quiz import Quiz
+from app.models.subject import Subject
+
+OPTIONS = [{"index": i, "text": text} for i, text in enumerate(["가", "나", "다", "라"])]
+
+
+@pytest.fixture
+async def exam_session(test_db_session: AsyncSession) -> list[int]:
+    """정답이 0, 1, 2인 문제 3개로 시험 세션 생성"""
+    test_db_session.add(Subject(id=1, name="ADsP"))
+    quizzes = [
+        Quiz(subject_id=1, question=f"문제 {i}", options=OPTIONS, correct_answer=i, source_hash=f"batch_{i}")
+        for i in range(3)
+    ]
+    test_db_session.add_all(quizzes)
+    await test_db_session.commit()
+
+    quiz_ids = [quiz.id for quiz in quizzes]
+    await exam_crud.create_exam_records_bulk(test_db_session, quiz_ids, "batch_session")
+    await test_db_session.commit()
+    test_db_session.expunge_all()
+    return quiz_ids
+
+
+@pytest.mark.asyncio
+async def test_submit_batch_grades_all_answers(client, exam_session):
+    """일괄 제출 시 모든 답안을 채점하고 시험 결과 형식으로 반환"""
+    response = client.post(
+        "/api/v1/exam/submit-batch",
+        json={
+            "exam_session_id": "batch_session",
+            "answers": [
+                {"quiz_id": exam_session[0], "user_answer": 0},
+                {"quiz_id": exam_session[1], "user_answer": 3},
+                {"quiz_id": exam_session[2], "user_answer": 2},
+            ],
+        },
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["exam_session_id"] == "batch_session"
+    assert data["total_questions"] == 3
+    assert data["correct_count"] == 2
+    assert data["incorrect_count"] == 1
+    assert [r["quiz_id"] for r in data["records"]] == exam_session
+    assert [r["is_correct"] for r in data["records"]] == [True, False, True]
+    assert data["records"][0]["quiz"]["question"] == "문제 0"
+
+    result = client.get("/api/v1/exam/batch_session")
+    assert result.status_code == 200
+    assert result.json()["correct_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_submit_batch_keeps_existing_answers(client, exam_session):
+    """이미 제출된 답안은 덮어쓰지 않고, 나머지만 채점"""
+    client.post(
+        "/api/v1/exam/submit",
+        json={"exam_session_id": "batch_session", "quiz_id": exam_session[0], "user_answer": 1},
+    )
+
+    response = client.post(
+        "/api/v1/exam/submit-batch",
+        json={
+            "exam_session_id": "batch_session",
+            "answers": [
+                {"quiz_id": exam_session[0], "user_answer": 0},
+                {"quiz_id": exam_session[1], "user_answer": 1},
+            ],
+        },
+    )
+
+    assert response.status_code == 200
+    records = response.json()["records"]
+    assert [r["user_answer"] for r in records] == [1, 1, None]
+    assert [r["is_correct"] for r in records] == [False, True, None]
+
+
+@pytest.mark.asyncio
+async def test_submit_batch_unknown_quiz_rolls_back(client, exam_session):
+    """시험에 없는 문제가 섞이면 400, 아무 답안도 반영하지 않음"""
+    response = client.post(
+        "/api/v1/exam/submit-batch",
+        json={
+            "exam_session_id": "batch_session",
+            "answers": [
+                {"quiz_id": exam_session[0], "user_answer": 0},
+                {"quiz_id": 9999, "user_answer": 0},
+            ],
+        },
+    )
+
+    assert response.status_code == 400
+    result = client.get("/api/v1/exam/batch_session").json()
+    assert all(r["user_answer"] is None for r in result["records"])
+
+
+@pytest.mark.asyncio
+async def test_submit_batch_session_not_found(client, exam_session):
+    """존재하지 않는 시험 세션은 404"""
+    response = client.post(
+        "/api/v1/exam/submit-batch",
+        json={"exam_session_id": "missing", "answers": [{"quiz_id": exam_session[0], "user_answer": 0}]},
+    )
+
+    assert response.status_code == 404
+
+
+def test_submit_batch_duplicate_quiz_ids(client):
+    """같은 문제에 대한 중복 답안은 400"""
+    response = client.post(
+        "/api/v1/exam/submit-batch",
+        json={
+            "exam_session_id": "batch_session",
+            "answers": [{"quiz_id": 1, "user_answer": 0}, {"quiz_id": 1, "user_answer": 1}],
+        },
+    )
+
+    assert response.status_code == 400
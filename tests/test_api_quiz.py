@@ -89,7 +89,7 @@ async def test_generate_quiz_duplicate(client, test_db_session):
     quiz = Quiz(
         subject_id=1,
         question="기존 문제",
-        options='[{"index": 0, "text": "선택지1"}]',
+        options=[{"index": 0, "text": "선택지1"}],
         correct_answer=0,
         source_hash="test_hash",
     )
@@ -121,7 +121,7 @@ async def test_get_quiz(client, test_db_session):
     quiz = Quiz(
         subject_id=1,
         question="테스트 문제",
-        options='[{"index": 0, "text": "선택지1"}]',
+        options=[{"index": 0, "text": "선택지1"}],
         correct_answer=0,
         source_hash="test_hash",
     )
@@ -17,14 +17,14 @@ async def test_get_subjects(client, test_db_session):
     quiz1 = Quiz(
         subject_id=1,
         question="문제1",
-        options='[{"index": 0, "text": "선택지1"}]',
+        options=[{"index": 0, "text": "선택지1"}],
         correct_answer=0,
         source_hash="hash1",
     )
     quiz2 = Quiz(
         subject_id=1,
         question="문제2",
-        options='[{"index": 0, "text": "선택지1"}]',
+        options=[{"index": 0, "text": "선택지1"}],
         correct_answer=0,
         source_hash="hash2",
     )
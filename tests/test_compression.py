@@ -0,0 +1,137 @@
+"""응답 압축 미들웨어 및 대시보드 페이지네이션 테스트"""
+import gzip
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware, negotiate_encoding
+from app.crud import quiz_validation as validation_crud
+from app.models.quiz import Quiz
+from app.models.subject import Subject
+
+LARGE_BODY = "검증이 필요한 문제 " * 500
+
+
+@pytest.fixture
+def compressed_app() -> TestClient:
+    """압축 미들웨어만 붙인 최소 앱"""
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+    @app.get("/large")
+    async def large():
+        return PlainTextResponse(LARGE_BODY, headers={"ETag": '"v1"'})
+
+    @app.get("/not-modified")
+    async def not_modified():
+        return Response(status_code=304, headers={"ETag": '"v1"'})
+
+    @app.get("/small")
+    async def small():
+        return PlainTextResponse("작은 응답")
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for _ in range(5):
+                yield LARGE_BODY.encode("utf-8")
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    @app.get("/image")
+    async def image():
+        return PlainTextResponse(LARGE_BODY, media_type="image/png")
+
+    return TestClient(app)
+
+
+def test_negotiate_encoding():
+    """q값과 brotli 설치 여부에 따라 인코딩 선택"""
+    assert negotiate_encoding("gzip, deflate, br", brotli_available=True) == "br"
+    assert negotiate_encoding("gzip, deflate, br", brotli_available=False) == "gzip"
+    assert negotiate_encoding("br;q=0.5, gzip", brotli_available=True) == "gzip"
+    assert negotiate_encoding("gzip;q=0, identity") is None
+    assert negotiate_encoding("*", brotli_available=False) == "gzip"
+    assert negotiate_encoding("") is None
+
+
+def test_large_response_is_gzipped(compressed_app):
+    """임계값 이상 응답은 gzip 압축, 강한 ETag는 약한 ETag로 변경"""
+    response = compressed_app.get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["etag"] == 'W/"v1"'
+    assert int(response.headers["content-length"]) < len(LARGE_BODY.encode("utf-8"))
+    assert response.text == LARGE_BODY
+
+
+def test_small_and_excluded_responses_are_not_compressed(compressed_app):
+    """작은 응답과 이미 압축된 형식은 그대로 전달"""
+    small = compressed_app.get("/small", headers={"Accept-Encoding": "gzip"})
+    image = compressed_app.get("/image", headers={"Accept-Encoding": "gzip"})
+    identity = compressed_app.get("/large", headers={"Accept-Encoding": "identity"})
+
+    assert "content-encoding" not in small.headers
+    assert "content-encoding" not in image.headers
+    assert "content-encoding" not in identity.headers
+    assert identity.headers["vary"] == "Accept-Encoding"
+
+
+def test_not_modified_matches_compressed_validators(compressed_app):
+    """304는 본문 없이 전달하되 압축된 200과 같은 Vary/약한 ETag를 가짐"""
+    negotiated = compressed_app.get("/not-modified", headers={"Accept-Encoding": "gzip"})
+    identity = compressed_app.get("/not-modified", headers={"Accept-Encoding": "identity"})
+
+    assert negotiated.status_code == 304
+    assert "content-encoding" not in negotiated.headers
+    assert negotiated.headers["vary"] == "Accept-Encoding"
+    assert negotiated.headers["etag"] == 'W/"v1"'
+    assert identity.headers["vary"] == "Accept-Encoding"
+    assert identity.headers["etag"] == '"v1"'
+
+
+def test_streaming_response_is_compressed_per_chunk(compressed_app):
+    """스트리밍 응답은 Content-Length 없이 청크 단위로 압축"""
+    with compressed_app.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+        raw = b"".join(response.iter_raw())
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert gzip.decompress(raw).decode("utf-8") == LARGE_BODY * 5
+
+
+@pytest.mark.asyncio
+async def test_dashboard_paginates_quizzes_needing_validation(client, test_db_session):
+    """대시보드의 검증 필요 문제는 페이지 단위로 반환하고 전체 개수를 함께 제공"""
+    test_db_session.add(Subject(id=1, name="ADsP"))
+    quizzes = [
+        Quiz(
+            subject_id=1,
+            question=f"문제 {i}",
+            options=[{"index": j, "text": f"선택지{j}"} for j in range(4)],
+            correct_answer=0,
+            source_hash=f"dashboard_{i}",
+        )
+        for i in range(5)
+    ]
+    test_db_session.add_all(quizzes)
+    await test_db_session.commit()
+    await validation_crud.create_quiz_validation(test_db_session, quizzes[0].id, "valid")
+    await validation_crud.create_quiz_validation(test_db_session, quizzes[1].id, "invalid")
+
+    first = client.get("/api/v1/quiz/dashboard", params={"validation_limit": 3}).json()
+    second = client.get(
+        "/api/v1/quiz/dashboard", params={"validation_page": 2, "validation_limit": 3}
+    ).json()
+
+    assert first["quizzes_needing_validation_total"] == 4
+    assert first["validation_total_pages"] == 2
+    assert len(first["quizzes_needing_validation"]) == 3
+    assert len(second["quizzes_needing_validation"]) == 1
+    returned = first["quizzes_needing_validation"] + second["quizzes_needing_validation"]
+    statuses = {q["id"]: q["validation_status"] for q in returned}
+    assert quizzes[0].id not in statuses
+    assert statuses[quizzes[1].id] == "invalid"
+    assert client.get("/api/v1/quiz/dashboard", params={"validation_limit": 101}).status_code == 422
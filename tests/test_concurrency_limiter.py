@@ -0,0 +1,97 @@
+"""동시 실행 수 제한 (프로세스 내 / DB 임대) 테스트"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.crud import concurrency_lease as lease_crud
+from app.models.concurrency_lease import ConcurrencyLease
+from app.services.concurrency_limiter import LeaseLimiter, LocalLimiter
+
+
+@pytest.fixture
+def session_factory(test_db_session):
+    return async_sessionmaker(test_db_session.bind, class_=AsyncSession, expire_on_commit=False)
+
+
+def _lease_limiter(session_factory, max_concurrent: int = 1) -> LeaseLimiter:
+    return LeaseLimiter("test", max_concurrent, lease_ttl=30.0, poll_interval=0.01, session_factory=session_factory)
+
+
+@pytest.mark.asyncio
+async def test_local_limiter_times_out_when_full():
+    """슬롯이 모두 사용 중이면 timeout 후 asyncio.TimeoutError"""
+    limiter = LocalLimiter(1)
+    async with limiter.slot():
+        with pytest.raises(asyncio.TimeoutError):
+            async with limiter.slot(timeout=0.05):
+                pass
+    async with limiter.slot(timeout=0.05):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_lease_limiter_caps_across_instances(session_factory):
+    """서로 다른 인스턴스(프로세스)가 같은 슬롯 수를 공유"""
+    first, second = _lease_limiter(session_factory), _lease_limiter(session_factory)
+
+    async with first.slot():
+        with pytest.raises(asyncio.TimeoutError):
+            async with second.slot(timeout=0.1):
+                pass
+        # 취소된 시도의 DB 작업이 끝날 때까지 대기 (테스트 DB는 커넥션 하나를 공유)
+        await asyncio.gather(*second._cleanup_tasks)
+
+    # 반납 후에는 다른 인스턴스가 획득
+    async with second.slot(timeout=1.0):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_lease_limiter_reclaims_expired_lease(session_factory, test_db_session):
+    """반납하지 못하고 만료된 임대는 다른 인스턴스가 회수"""
+    crashed, other = _lease_limiter(session_factory), _lease_limiter(session_factory)
+    lease = await crashed.acquire()
+    lease.renew_task.cancel()
+
+    expired = datetime.now(timezone.utc) - timedelta(seconds=1)
+    await test_db_session.execute(update(ConcurrencyLease).values(expires_at=expired))
+    await test_db_session.commit()
+
+    async with other.slot(timeout=1.0):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_lease_limiter_allows_max_concurrent(session_factory):
+    """max_concurrent개까지는 동시에 획득"""
+    limiter = _lease_limiter(session_factory, max_concurrent=2)
+    leases = [await asyncio.wait_for(limiter.acquire(), timeout=1.0) for _ in range(2)]
+    assert sorted(lease.slot for lease in leases) == [0, 1]
+
+    for lease in leases:
+        await limiter.release(lease)
+
+
+@pytest.mark.asyncio
+async def test_lease_limiter_releases_lease_when_cancelled_during_acquire(session_factory, monkeypatch):
+    """임대 UPDATE가 커밋된 직후 timeout이 나도 슬롯이 묶이지 않고 반납됨"""
+    try_acquire_slot = lease_crud.try_acquire_slot
+
+    async def slow_try_acquire_slot(*args, **kwargs):
+        slot = await try_acquire_slot(*args, **kwargs)
+        await asyncio.sleep(0.2)
+        return slot
+
+    limiter, other = _lease_limiter(session_factory), _lease_limiter(session_factory)
+    monkeypatch.setattr(lease_crud, "try_acquire_slot", slow_try_acquire_slot)
+    with pytest.raises(asyncio.TimeoutError):
+        async with limiter.slot(timeout=0.05):
+            pass
+    monkeypatch.setattr(lease_crud, "try_acquire_slot", try_acquire_slot)
+
+    await asyncio.gather(*limiter._cleanup_tasks)
+    async with other.slot(timeout=0.5):
+        pass
@@ -0,0 +1,87 @@
+"""핵심 정보 항목 저장 테스트"""
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import sub_topic as sub_topic_crud
+from app.models.core_content_item import CoreContentItem
+from app.models.main_topic import MainTopic
+from app.models.sub_topic import SubTopic
+from app.models.subject import Subject
+
+
+@pytest.fixture
+async def sub_topic(test_db_session: AsyncSession):
+    """테스트용 세부항목 생성"""
+    test_db_session.add(Subject(id=1, name="ADsP"))
+    test_db_session.add(MainTopic(id=1, subject_id=1, name="주요항목1"))
+    test_db_session.add(SubTopic(id=1, main_topic_id=1, name="세부항목1"))
+    await test_db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_append_inserts_item_with_next_position(test_db_session, sub_topic):
+    """추가 시 항목 1행이 다음 position으로 저장되고 세부항목 카운터/source_type 갱신"""
+    await sub_topic_crud.append_sub_topic_core_content(test_db_session, 1, "첫 번째", "text")
+    updated = await sub_topic_crud.append_sub_topic_core_content(
+        test_db_session, 1, "https://youtu.be/abc", "youtube_url"
+    )
+
+    assert updated.core_content_count == 2
+    assert updated.source_type == "youtube_url"
+
+    items = await sub_topic_crud.get_core_content_items(test_db_session, 1)
+    assert [(item.position, item.content) for item in items] == [
+        (2, "https://youtu.be/abc"),
+        (1, "첫 번째"),
+    ]
+    assert items[1].content_hash == sub_topic_crud.hash_core_content("첫 번째")
+
+
+@pytest.mark.asyncio
+async def test_append_unknown_sub_topic_returns_none(test_db_session, sub_topic):
+    """존재하지 않는 세부항목에는 항목을 추가하지 않음"""
+    result = await sub_topic_crud.append_sub_topic_core_content(test_db_session, 999, "내용", "text")
+
+    assert result is None
+    count = await test_db_session.scalar(select(func.count()).select_from(CoreContentItem))
+    assert count == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_items_newest_first(test_db_session, sub_topic):
+    """스트리밍 조회는 최신 항목부터 반환"""
+    for index in range(3):
+        await sub_topic_crud.append_sub_topic_core_content(test_db_session, 1, f"내용 {index}", "text")
+
+    contents = [item.content async for item in sub_topic_crud.stream_core_content_items(test_db_session, 1)]
+
+    assert contents == ["내용 2", "내용 1", "내용 0"]
+
+
+@pytest.mark.asyncio
+async def test_build_legacy_core_content(test_db_session, sub_topic):
+    """항목 목록을 기존 blob 형식으로 재구성"""
+    await sub_topic_crud.append_sub_topic_core_content(test_db_session, 1, "오래된 내용", "text")
+    await sub_topic_crud.append_sub_topic_core_content(test_db_session, 1, "새 내용", "youtube_url")
+
+    items = await sub_topic_crud.get_core_content_items(test_db_session, 1)
+
+    assert sub_topic_crud.build_legacy_core_content(items) == (
+        "[source_type:youtube_url]새 내용"
+        f"{sub_topic_crud.CORE_CONTENT_SEPARATOR}"
+        "[source_type:text]오래된 내용"
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_replaces_items(test_db_session, sub_topic):
+    """교체 시 기존 항목을 지우고 단일 항목으로 저장"""
+    await sub_topic_crud.append_sub_topic_core_content(test_db_session, 1, "이전 1", "text")
+    await sub_topic_crud.append_sub_topic_core_content(test_db_session, 1, "이전 2", "text")
+
+    updated = await sub_topic_crud.update_sub_topic_core_content(test_db_session, 1, "교체된 내용", "text")
+
+    assert updated.core_content_count == 1
+    items = await sub_topic_crud.get_core_content_items(test_db_session, 1)
+    assert [(item.position, item.content) for item in items] == [(1, "교체된 내용")]
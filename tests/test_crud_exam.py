@@ -24,7 +24,7 @@ async def test_quiz(test_db_session: AsyncSession, test_subject: Subject):
     quiz = Quiz(
         subject_id=test_subject.id,
         question="테스트 문제",
-        options='[{"index": 0, "text": "선택지1"}]',
+        options=[{"index": 0, "text": "선택지1"}],
         correct_answer=0,
         source_hash="test_hash",
     )
@@ -75,6 +75,35 @@ async def test_create_exam_record_invalid_quiz(test_db_session: AsyncSession):
         )
 
 
+@pytest.mark.asyncio
+async def test_create_exam_records_bulk(test_db_session: AsyncSession, test_subject: Subject):
+    """시험 기록 일괄 생성 (요청 순서 유지, 생성 값 반환)"""
+    quiz_ids = []
+    for i in range(3):
+        quiz = Quiz(
+            subject_id=test_subject.id,
+            question=f"문제 {i}",
+            options=[{"index": 0, "text": "선택지1"}],
+            correct_answer=0,
+            source_hash=f"bulk_hash_{i}",
+        )
+        test_db_session.add(quiz)
+        await test_db_session.flush()
+        quiz_ids.append(quiz.id)
+
+    records = await exam_crud.create_exam_records_bulk(
+        test_db_session, list(reversed(quiz_ids)), "session_bulk"
+    )
+    await test_db_session.commit()
+
+    assert [r.quiz_id for r in records] == list(reversed(quiz_ids))
+    assert all(r.id is not None and r.created_at is not None for r in records)
+    assert all(r.user_answer is None for r in records)
+
+    stored = await exam_crud.get_exam_records_by_session(test_db_session, "session_bulk")
+    assert len(stored) == 3
+
+
 @pytest.mark.asyncio
 async def test_get_exam_records_by_session(test_db_session: AsyncSession, test_quiz: Quiz):
     """세션 ID로 기록 조회"""
@@ -127,3 +156,39 @@ async def test_update_exam_record_answer(test_db_session: AsyncSession, test_qui
     
     assert updated.user_answer == 0
     assert updated.is_correct is True
+
+
+@pytest.mark.asyncio
+async def test_submit_exam_answer(test_db_session: AsyncSession, test_quiz: Quiz):
+    """답안 제출 시 정답 여부를 함께 계산하고, 두 번째 제출은 갱신하지 않음"""
+    await exam_crud.create_exam_records_bulk(test_db_session, [test_quiz.id], "session_submit")
+    await test_db_session.commit()
+
+    record = await exam_crud.submit_exam_answer(test_db_session, "session_submit", test_quiz.id, 0)
+    await test_db_session.commit()
+
+    assert record is not None
+    assert record.user_answer == 0
+    assert record.is_correct is True
+
+    again = await exam_crud.submit_exam_answer(test_db_session, "session_submit", test_quiz.id, 1)
+    assert again is None
+
+    stored = await exam_crud.get_exam_record_by_session_and_quiz(
+        test_db_session, "session_submit", test_quiz.id
+    )
+    assert stored.user_answer == 0
+    assert stored.is_correct is True
+
+
+@pytest.mark.asyncio
+async def test_submit_exam_answer_wrong_and_missing(test_db_session: AsyncSession, test_quiz: Quiz):
+    """오답은 is_correct=False, 기록이 없으면 None"""
+    await exam_crud.create_exam_records_bulk(test_db_session, [test_quiz.id], "session_wrong")
+    await test_db_session.commit()
+
+    record = await exam_crud.submit_exam_answer(test_db_session, "session_wrong", test_quiz.id, 3)
+    assert record.is_correct is False
+
+    missing = await exam_crud.submit_exam_answer(test_db_session, "no_session", test_quiz.id, 0)
+    assert missing is None
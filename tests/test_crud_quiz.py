@@ -24,7 +24,7 @@ async def test_get_quiz_by_id(test_db_session: AsyncSession, test_subject: Subje
     quiz = Quiz(
         subject_id=test_subject.id,
         question="테스트 문제",
-        options='[{"index": 0, "text": "선택지1"}]',
+        options=[{"index": 0, "text": "선택지1"}],
         correct_answer=0,
         source_hash="test_hash",
     )
@@ -51,7 +51,7 @@ async def test_get_quiz_by_hash(test_db_session: AsyncSession, test_subject: Sub
     quiz = Quiz(
         subject_id=test_subject.id,
         question="테스트 문제",
-        options='[{"index": 0, "text": "선택지1"}]',
+        options=[{"index": 0, "text": "선택지1"}],
         correct_answer=0,
         source_hash=source_hash,
     )
@@ -97,7 +97,7 @@ async def test_get_random_quizzes(test_db_session: AsyncSession, test_subject: S
         quiz = Quiz(
             subject_id=test_subject.id,
             question=f"문제 {i}",
-            options='[{"index": 0, "text": "선택지1"}]',
+            options=[{"index": 0, "text": "선택지1"}],
             correct_answer=0,
             source_hash=f"hash_{i}",
         )
@@ -114,7 +114,7 @@ async def test_get_random_quizzes_insufficient(test_db_session: AsyncSession, te
     quiz = Quiz(
         subject_id=test_subject.id,
         question="문제 1",
-        options='[{"index": 0, "text": "선택지1"}]',
+        options=[{"index": 0, "text": "선택지1"}],
         correct_answer=0,
         source_hash="hash_1",
     )
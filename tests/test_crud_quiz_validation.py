@@ -0,0 +1,66 @@
+"""Quiz Validation CRUD 테스트"""
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import quiz_validation as validation_crud
+from app.models.quiz import Quiz
+from app.models.subject import Subject
+
+
+@pytest.fixture
+async def test_quizzes(test_db_session: AsyncSession):
+    """테스트용 과목과 문제 3개 생성"""
+    test_db_session.add(Subject(id=1, name="ADsP"))
+    quizzes = [
+        Quiz(
+            subject_id=1,
+            question=f"문제 {i}",
+            options=[{"index": 0, "text": "선택지1"}],
+            correct_answer=0,
+            source_hash=f"hash_{i}",
+        )
+        for i in range(3)
+    ]
+    test_db_session.add_all(quizzes)
+    await test_db_session.commit()
+    return quizzes
+
+
+@pytest.mark.asyncio
+async def test_create_quiz_validation_updates_latest_status(
+    test_db_session: AsyncSession, test_quizzes: list[Quiz]
+):
+    """검증 저장 시 문제의 최신 검증 상태 갱신"""
+    quiz = test_quizzes[0]
+    await validation_crud.create_quiz_validation(test_db_session, quiz.id, "invalid", validation_score=40)
+    validation = await validation_crud.create_quiz_validation(
+        test_db_session, quiz.id, "valid", validation_score=90
+    )
+
+    assert quiz.latest_validation_status == "valid"
+    assert quiz.latest_validated_at is not None
+
+    latest = await validation_crud.get_latest_validation(test_db_session, quiz.id)
+    assert latest.id == validation.id
+
+    statuses = await validation_crud.get_latest_validation_statuses(
+        test_db_session, [q.id for q in test_quizzes]
+    )
+    assert statuses == {quiz.id: "valid"}
+
+
+@pytest.mark.asyncio
+async def test_validation_counts_and_needing_validation(
+    test_db_session: AsyncSession, test_quizzes: list[Quiz]
+):
+    """상태별 개수와 검증 필요 목록은 최신 상태 기준"""
+    first, second, third = test_quizzes
+    await validation_crud.create_quiz_validation(test_db_session, first.id, "valid")
+    await validation_crud.create_quiz_validation(test_db_session, second.id, "valid")
+    await validation_crud.create_quiz_validation(test_db_session, second.id, "invalid")
+
+    counts = await validation_crud.get_validation_status_counts(test_db_session)
+    assert counts == {"valid": 1, "invalid": 1, "pending": 1}
+
+    needing = await validation_crud.get_quizzes_needing_validation(test_db_session)
+    assert sorted(needing) == sorted([second.id, third.id])
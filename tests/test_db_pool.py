@@ -0,0 +1,68 @@
+"""커넥션 풀 계측 테스트"""
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.api.v1 import admin
+from app.core.db_pool import InstrumentedAsyncPool, get_pool_status
+from app.core.metrics import Histogram
+
+
+@pytest.fixture
+async def pooled_engine():
+    """pool_size=1, overflow 없음, 짧은 타임아웃의 계측 엔진"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=InstrumentedAsyncPool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.1,
+    )
+    yield engine
+    await engine.dispose()
+
+
+def test_histogram_cumulative_buckets():
+    """히스토그램 버킷은 누적 개수"""
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 5.0):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["buckets"] == {"0.1": 1, "1.0": 3, "+Inf": 4}
+    assert snapshot["count"] == 4
+    assert snapshot["sum"] == pytest.approx(6.05)
+
+
+@pytest.mark.asyncio
+async def test_pool_records_checkouts_and_timeouts(pooled_engine):
+    """체크아웃 수, 사용 중 커넥션, 대기 타임아웃 기록"""
+    async with pooled_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        status = get_pool_status(pooled_engine.pool)
+        assert status["checked_out"] == 1
+
+        with pytest.raises(exc.TimeoutError):
+            async with pooled_engine.connect():
+                pass
+
+    status = get_pool_status(pooled_engine.pool)
+    assert status["pool_class"] == "InstrumentedAsyncPool"
+    assert status["checked_out"] == 0
+    assert status["checkouts"] == 1
+    assert status["timeouts"] == 1
+    assert status["connect_errors"] == 0
+    assert status["wait_time"]["count"] == 2
+
+
+def test_admin_pool_metrics_endpoint(client, pooled_engine, monkeypatch):
+    """관리자 풀 메트릭 API"""
+    monkeypatch.setattr(admin, "get_engine", lambda: pooled_engine)
+
+    response = client.get("/api/v1/admin/metrics/pool")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["pool_size"] == 1
+    assert data["max_overflow"] == 0
+    assert "+Inf" in data["wait_time"]["buckets"]
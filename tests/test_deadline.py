@@ -0,0 +1,68 @@
+"""요청 데드라인 테스트"""
+import asyncio
+
+import pytest
+from unittest.mock import MagicMock
+
+from app.core import deadline
+from app.exceptions import DeadlineExceededError
+
+
+@pytest.fixture(autouse=True)
+def reset_deadline():
+    """테스트 간 데드라인 초기화"""
+    deadline.set_deadline(None)
+    yield
+    deadline.set_deadline(None)
+
+
+def test_no_deadline():
+    """데드라인이 없으면 제한 없음"""
+    assert deadline.get_remaining() is None
+    assert deadline.is_expired() is False
+    deadline.ensure_time_left("테스트")
+
+
+def test_deadline_expired():
+    """데드라인 초과 시 예외 발생"""
+    deadline.set_deadline(0)
+    assert deadline.is_expired() is True
+    with pytest.raises(DeadlineExceededError):
+        deadline.ensure_time_left("테스트")
+
+
+def test_ensure_time_left_with_required_budget():
+    """남은 시간이 필요한 예산보다 적으면 예외 발생"""
+    deadline.set_deadline(1.0)
+    deadline.ensure_time_left("테스트", required_seconds=0.1)
+    with pytest.raises(DeadlineExceededError):
+        deadline.ensure_time_left("테스트", required_seconds=5.0)
+
+
+@pytest.mark.asyncio
+async def test_request_deadline_uses_header():
+    """X-Request-Timeout 헤더가 라우트 기본값보다 우선"""
+    request = MagicMock()
+    request.headers = {deadline.DEADLINE_HEADER: "5"}
+    await deadline.request_deadline(60.0)(request)
+    assert 4.0 < deadline.get_remaining() <= 5.0
+
+
+@pytest.mark.asyncio
+async def test_request_deadline_invalid_header_falls_back_to_default():
+    """잘못된 헤더 값은 무시하고 라우트 기본값 사용"""
+    request = MagicMock()
+    request.headers = {deadline.DEADLINE_HEADER: "abc"}
+    await deadline.request_deadline(30.0)(request)
+    assert 29.0 < deadline.get_remaining() <= 30.0
+
+
+@pytest.mark.asyncio
+async def test_deadline_is_task_local():
+    """다른 태스크의 데드라인은 서로 영향을 주지 않음"""
+    async def set_short():
+        deadline.set_deadline(0)
+        return deadline.is_expired()
+
+    assert await asyncio.create_task(set_short()) is True
+    assert deadline.get_remaining() is None
@@ -0,0 +1,137 @@
+"""HTTP 캐싱 (ETag/Last-Modified) 테스트"""
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core import http_cache
+from app.crud import sub_topic as sub_topic_crud
+from app.models.main_topic import MainTopic
+from app.models.quiz import Quiz
+from app.models.sub_topic import SubTopic
+from app.models.subject import Subject
+
+
+@pytest.fixture
+async def catalog(test_db_session):
+    """과목/주요항목/세부항목 생성"""
+    test_db_session.add(Subject(id=1, name="ADsP"))
+    test_db_session.add(MainTopic(id=1, subject_id=1, name="주요항목1"))
+    test_db_session.add(SubTopic(id=1, main_topic_id=1, name="세부항목1"))
+    await test_db_session.commit()
+
+
+def _request(headers: dict) -> MagicMock:
+    request = MagicMock()
+    request.headers = {key.lower(): value for key, value in headers.items()}
+    return request
+
+
+def test_compute_etag_is_strong_and_deterministic():
+    """같은 버전이면 같은 강한 ETag, 버전이 다르면 다른 ETag"""
+    etag = http_cache.compute_etag("main-topics", 3, "2026-01-01")
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == http_cache.compute_etag("main-topics", 3, "2026-01-01")
+    assert etag != http_cache.compute_etag("main-topics", 4, "2026-01-01")
+
+
+def test_if_none_match_uses_weak_comparison_and_lists():
+    """If-None-Match는 목록/약한 비교/와일드카드 지원"""
+    etag = http_cache.compute_etag("x")
+
+    assert http_cache.is_not_modified(_request({"If-None-Match": f'"other", W/{etag}'}), etag)
+    assert http_cache.is_not_modified(_request({"If-None-Match": "*"}), etag)
+    assert not http_cache.is_not_modified(_request({"If-None-Match": '"other"'}), etag)
+
+
+def test_if_modified_since():
+    """If-None-Match가 없으면 If-Modified-Since와 최종 수정 시각 비교 (naive는 UTC)"""
+    last_modified = datetime(2026, 1, 1, 12, 0, 0, 500000)
+    etag = http_cache.compute_etag("x")
+
+    assert http_cache.is_not_modified(
+        _request({"If-Modified-Since": "Thu, 01 Jan 2026 12:00:00 GMT"}), etag, last_modified
+    )
+    assert not http_cache.is_not_modified(
+        _request({"If-Modified-Since": "Thu, 01 Jan 2026 11:59:59 GMT"}), etag, last_modified
+    )
+    assert not http_cache.is_not_modified(_request({"If-Modified-Since": "invalid"}), etag, last_modified)
+
+
+@pytest.mark.asyncio
+async def test_main_topics_conditional_get(client, test_db_session, catalog):
+    """주요항목 목록: ETag 일치 시 본문 없는 304, 변경되면 새 ETag"""
+    first = client.get("/api/v1/main-topics")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert "max-age" in first.headers["cache-control"]
+    assert "last-modified" in first.headers
+
+    cached = client.get("/api/v1/main-topics", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    # 인코딩을 협상한 요청의 304는 압축 미들웨어가 약한 ETag로 바꿈
+    assert cached.headers["etag"] == f"W/{etag}"
+
+    test_db_session.add(MainTopic(id=2, subject_id=1, name="주요항목2"))
+    await test_db_session.commit()
+
+    changed = client.get("/api/v1/main-topics", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["total"] == 2
+
+
+@pytest.mark.asyncio
+async def test_list_ignores_if_modified_since_after_delete(client, test_db_session, catalog):
+    """목록은 삭제가 Last-Modified에 드러나지 않으므로 If-Modified-Since만으로 304를 주지 않음"""
+    test_db_session.add(MainTopic(id=2, subject_id=1, name="주요항목2"))
+    await test_db_session.commit()
+    last_modified = client.get("/api/v1/main-topics").headers["last-modified"]
+
+    await test_db_session.delete(await test_db_session.get(MainTopic, 2))
+    await test_db_session.commit()
+
+    response = client.get("/api/v1/main-topics", headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 200
+    assert response.json()["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_sub_topics_conditional_get(client, catalog):
+    """세부항목 목록 조건부 요청"""
+    first = client.get("/api/v1/main-topics/1/sub-topics")
+    etag = first.headers["etag"]
+
+    assert client.get("/api/v1/main-topics/1/sub-topics", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/api/v1/main-topics/999/sub-topics", headers={"If-None-Match": etag}).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_subjects_etag_changes_with_quiz_count(client, test_db_session, catalog):
+    """과목 목록은 문제 개수가 바뀌면 ETag 변경"""
+    etag = client.get("/api/v1/subjects").headers["etag"]
+    assert client.get("/api/v1/subjects", headers={"If-None-Match": etag}).status_code == 304
+
+    test_db_session.add(Quiz(subject_id=1, question="문제", options=[], correct_answer=0, source_hash="etag_hash"))
+    await test_db_session.commit()
+
+    changed = client.get("/api/v1/subjects", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()[0]["quiz_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_core_content_etag_changes_on_append(client, test_db_session, catalog):
+    """핵심 정보 조회: 항목 추가 시 ETag 변경, 관리 화면용으로 항상 재검증"""
+    first = client.get("/api/v1/core-content/1")
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == http_cache.REVALIDATE_CACHE_CONTROL
+    assert client.get("/api/v1/core-content/1", headers={"If-None-Match": etag}).status_code == 304
+
+    await sub_topic_crud.append_sub_topic_core_content(test_db_session, 1, "새 핵심 정보", "text")
+
+    changed = client.get("/api/v1/core-content/1", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["core_contents"][0]["core_content"] == "새 핵심 정보"
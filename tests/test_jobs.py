@@ -0,0 +1,212 @@
+"""비동기 작업 (Prefer: respond-async, 작업 워커, 재시작 복구) 테스트"""
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.api.v1.jobs import prefers_async
+from app.core.config import settings
+from app.core.progress import report_progress
+from app.crud import job as job_crud
+from app.exceptions import QuizNotFoundError
+from app.models.quiz import Quiz
+from app.models.subject import Subject
+from app.schemas import quiz as quiz_schema
+from app.services import job_service, quiz_service
+from app.services.job_service import JobWorkerPool
+
+
+@pytest.fixture
+async def quiz(test_db_session) -> Quiz:
+    test_db_session.add(Subject(id=1, name="ADsP"))
+    quiz = Quiz(subject_id=1, question="문제", options=[], correct_answer=0, source_hash="job_hash")
+    test_db_session.add(quiz)
+    await test_db_session.commit()
+    return quiz
+
+
+@pytest.fixture
+def worker_pool(test_db_session) -> JobWorkerPool:
+    """테스트 DB를 쓰는 작업 워커 풀 (워커 태스크 없이 run_job/recover 직접 호출)"""
+    session_factory = async_sessionmaker(test_db_session.bind, class_=AsyncSession, expire_on_commit=False)
+    return JobWorkerPool(session_factory=session_factory, concurrency=1)
+
+
+def _validation_response(quiz_id: int) -> quiz_schema.QuizValidationResponse:
+    return quiz_schema.QuizValidationResponse(
+        quiz_id=quiz_id, is_valid=True, category="ADsP", validation_score=0.9, feedback="좋음",
+    )
+
+
+def test_prefers_async_parses_prefer_header():
+    """Prefer 헤더의 여러 선호 중 respond-async 인식"""
+    request = MagicMock()
+    request.headers = {"prefer": "return=minimal, respond-async; wait=10"}
+    assert prefers_async(request)
+
+    request.headers = {"prefer": "return=minimal"}
+    assert not prefers_async(request)
+
+
+@pytest.mark.asyncio
+async def test_validate_with_prefer_returns_accepted_job(client, quiz):
+    """Prefer: respond-async면 202와 작업 상태 URL 반환, 작업 조회 가능"""
+    response = client.post(f"/api/v1/quiz/{quiz.id}/validate", headers={"Prefer": "respond-async"})
+
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] == "queued"
+    assert response.headers["location"] == f"/api/v1/jobs/{job['id']}"
+    assert response.headers["preference-applied"] == "respond-async"
+
+    status_response = client.get(response.headers["location"])
+    assert status_response.status_code == 200
+    assert status_response.json()["job_type"] == job_service.JOB_VALIDATE
+    assert "retry-after" in status_response.headers
+
+    assert client.post("/api/v1/quiz/999/validate", headers={"Prefer": "respond-async"}).status_code == 404
+    assert client.get("/api/v1/jobs/unknown").status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_run_job_stores_result(test_db_session, worker_pool, quiz, monkeypatch):
+    """작업 성공 시 동기 API 응답과 같은 형식의 결과와 진행률 100 저장"""
+    async def fake_validate(session, quiz_id):
+        return _validation_response(quiz_id)
+
+    monkeypatch.setattr(quiz_service, "validate_quiz", fake_validate)
+    job = await job_crud.create_job(test_db_session, job_service.JOB_VALIDATE, {"quiz_id": quiz.id})
+
+    await worker_pool.run_job(job.id)
+
+    job = await job_crud.get_job(test_db_session, job.id)
+    assert job.status == job_crud.JOB_SUCCEEDED
+    assert job.result["is_valid"] is True
+    assert job.progress == 100
+    assert job.attempts == 1
+
+    # 이미 끝난 작업은 다시 실행하지 않음
+    await worker_pool.run_job(job.id)
+    assert (await job_crud.get_job(test_db_session, job.id)).attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_validate_job_releases_connection_during_ai_call(test_db_session, quiz, monkeypatch):
+    """검증 작업은 Gemini 호출 동안 트랜잭션(커넥션)을 잡고 있지 않고, 결과는 이후에 저장"""
+    session_maker = async_sessionmaker(test_db_session.bind, class_=AsyncSession, expire_on_commit=False)
+    sessions: list[AsyncSession] = []
+
+    def session_factory() -> AsyncSession:
+        session = session_maker()
+        sessions.append(session)
+        return session
+
+    in_transaction_during_call: list[bool] = []
+
+    async def fake_validate_with_gemini(**kwargs):
+        in_transaction_during_call.append(any(session.in_transaction() for session in sessions))
+        return {"is_valid": True, "validation_score": 0.9, "feedback": "좋음", "issues": []}
+
+    monkeypatch.setattr(quiz_service.ai_service, "validate_quiz_with_gemini", fake_validate_with_gemini)
+    pool = JobWorkerPool(session_factory=session_factory, concurrency=1)
+    job = await job_crud.create_job(test_db_session, job_service.JOB_VALIDATE, {"quiz_id": quiz.id})
+
+    await pool.run_job(job.id)
+
+    assert in_transaction_during_call == [False]
+    job = await job_crud.get_job(test_db_session, job.id)
+    assert job.status == job_crud.JOB_SUCCEEDED
+    assert job.result["is_valid"] is True
+
+
+@pytest.mark.asyncio
+async def test_run_job_records_app_error(test_db_session, worker_pool, monkeypatch):
+    """애플리케이션 예외는 예외 핸들러와 같은 code/detail 형식으로 기록"""
+    async def missing_quiz(session, quiz_id):
+        raise QuizNotFoundError(quiz_id)
+
+    monkeypatch.setattr(quiz_service, "validate_quiz", missing_quiz)
+    job = await job_crud.create_job(test_db_session, job_service.JOB_VALIDATE, {"quiz_id": 999})
+
+    await worker_pool.run_job(job.id)
+
+    job = await job_crud.get_job(test_db_session, job.id)
+    assert job.status == job_crud.JOB_FAILED
+    assert job.error == {"code": "QuizNotFoundError", "detail": "문제를 찾을 수 없습니다: 999", "status_code": 404}
+
+
+@pytest.mark.asyncio
+async def test_run_job_reports_progress(test_db_session, worker_pool, monkeypatch):
+    """서비스에서 보고한 진행률을 작업 실행 중에 기록"""
+    observed = []
+
+    async def fake_generate(session, request):
+        await report_progress(1, 2)
+        observed.append((await job_crud.get_job(test_db_session, job.id)).progress)
+        return quiz_schema.StudyModeQuizListResponse(quizzes=[], total_count=0)
+
+    monkeypatch.setattr(quiz_service, "generate_study_quizzes", fake_generate)
+    job = await job_crud.create_job(
+        test_db_session, job_service.JOB_GENERATE_STUDY, {"sub_topic_id": 1, "quiz_count": 2}
+    )
+
+    await worker_pool.run_job(job.id)
+
+    assert observed == [50]
+    assert (await job_crud.get_job(test_db_session, job.id)).status == job_crud.JOB_SUCCEEDED
+
+
+@pytest.mark.asyncio
+async def test_recover_resumes_or_fails_interrupted_jobs(test_db_session, worker_pool):
+    """재시작 복구: 대기 작업 재예약, 시도 횟수가 남은 실행 작업 재개, 초과한 작업은 실패"""
+    queued = await job_crud.create_job(test_db_session, job_service.JOB_VALIDATE, {"quiz_id": 1})
+    resumable = await job_crud.create_job(test_db_session, job_service.JOB_VALIDATE, {"quiz_id": 2})
+    exhausted = await job_crud.create_job(test_db_session, job_service.JOB_VALIDATE, {"quiz_id": 3})
+    for job, attempts in ((resumable, 1), (exhausted, settings.job_max_attempts)):
+        job.status = job_crud.JOB_RUNNING
+        job.attempts = attempts
+    await test_db_session.commit()
+
+    await worker_pool.recover()
+
+    submitted = []
+    while not worker_pool._queue.empty():
+        submitted.append(worker_pool._queue.get_nowait())
+    assert sorted(submitted) == sorted([queued.id, resumable.id])
+    assert (await job_crud.get_job(test_db_session, resumable.id)).status == job_crud.JOB_QUEUED
+    failed = await job_crud.get_job(test_db_session, exhausted.id)
+    assert failed.status == job_crud.JOB_FAILED
+    assert failed.error["code"] == "JOB_INTERRUPTED"
+
+
+@pytest.mark.asyncio
+async def test_recover_skips_jobs_running_in_other_process(test_db_session):
+    """같은 DB를 쓰는 다른 프로세스가 실행 중인 작업은 임대가 만료된 뒤에만 복구"""
+    session_factory = async_sessionmaker(test_db_session.bind, class_=AsyncSession, expire_on_commit=False)
+    running_pool = JobWorkerPool(session_factory=session_factory, concurrency=1)
+    starting_pool = JobWorkerPool(session_factory=session_factory, concurrency=1)
+    job = await job_crud.create_job(test_db_session, job_service.JOB_VALIDATE, {"quiz_id": 1})
+    assert await job_crud.claim_job(test_db_session, job.id, running_pool.owner, settings.job_lease_ttl)
+
+    await starting_pool.recover()
+
+    assert starting_pool._queue.empty()
+    job = await job_crud.get_job(test_db_session, job.id)
+    assert job.status == job_crud.JOB_RUNNING
+    assert job.owner == running_pool.owner
+
+    # 실행하던 프로세스가 종료되어 임대가 만료되면 복구
+    job.lease_expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+    await test_db_session.commit()
+    await starting_pool.recover()
+
+    assert starting_pool._queue.get_nowait() == job.id
+    assert (await job_crud.get_job(test_db_session, job.id)).status == job_crud.JOB_QUEUED
+
+    # 다시 실행되는 동안 이전 프로세스가 늦게 끝나도 결과를 덮어쓰지 않음
+    assert await job_crud.claim_job(test_db_session, job.id, starting_pool.owner, settings.job_lease_ttl)
+    assert not await job_crud.finish_job(test_db_session, job.id, result={"stale": True}, owner=running_pool.owner)
+    job = await job_crud.get_job(test_db_session, job.id)
+    assert job.status == job_crud.JOB_RUNNING
+    assert job.owner == starting_pool.owner
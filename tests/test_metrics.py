@@ -0,0 +1,101 @@
+"""Prometheus 메트릭 및 요청/DB 계측 테스트"""
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core import instrumentation, metrics
+from app.core.db_pool import PoolMetrics, pool_metric_families
+from app.core.instrumentation import instrument_engine
+from app.core.metrics import MetricsRegistry
+from app.models.subject import Subject
+
+
+def test_registry_renders_text_exposition_format():
+    """레이블 이스케이프, 히스토그램 bucket/sum/count 형식"""
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "요청 수", ("path",))
+    latency = registry.histogram("latency_seconds", "지연", buckets=(0.1, 1.0))
+    requests.labels('a"b\\c\n').inc(2)
+    latency.labels().observe(0.5)
+
+    text = registry.render()
+
+    assert "# TYPE requests_total counter" in text
+    assert 'requests_total{path="a\\"b\\\\c\\n"} 2' in text
+    assert 'latency_seconds_bucket{le="0.1"} 0' in text
+    assert 'latency_seconds_bucket{le="1.0"} 1' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 1' in text
+    assert "latency_seconds_count 1" in text
+    assert text.endswith("\n")
+
+
+def test_registry_rejects_duplicates_and_wrong_labels():
+    """같은 이름 중복 등록, 레이블 개수 불일치는 오류"""
+    registry = MetricsRegistry()
+    family = registry.gauge("in_progress", "진행 중", ("route",))
+
+    with pytest.raises(ValueError):
+        registry.gauge("in_progress", "진행 중")
+    with pytest.raises(ValueError):
+        family.labels("a", "b")
+
+
+@pytest.mark.asyncio
+async def test_request_metrics_use_route_template(client, test_db_session):
+    """route 레이블은 실제 경로가 아닌 라우트 템플릿, 요청당 쿼리 수 기록"""
+    instrument_engine(test_db_session.bind.sync_engine)
+    test_db_session.add(Subject(id=1, name="ADsP"))
+    await test_db_session.commit()
+    route = "/api/v1/quiz/{quiz_id}"
+    before = metrics.HTTP_REQUESTS.labels("GET", route, "404").value
+    query_histogram = metrics.DB_QUERIES_PER_REQUEST.labels(route)
+    queries_before = query_histogram.snapshot()
+
+    assert client.get("/api/v1/quiz/999").status_code == 404
+    client.get("/no-such-path")
+
+    assert metrics.HTTP_REQUESTS.labels("GET", route, "404").value == before + 1
+    assert metrics.HTTP_REQUESTS.labels("GET", instrumentation.UNMATCHED_ROUTE, "404").value >= 1
+    queries_after = query_histogram.snapshot()
+    assert queries_after["count"] == queries_before["count"] + 1
+    assert queries_after["sum"] > queries_before["sum"]
+
+
+def test_metrics_endpoint(client):
+    """/metrics는 Prometheus 텍스트 형식으로 응답"""
+    client.get("/health")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'http_requests_total{method="GET",route="/health",status="200"}' in response.text
+    assert "# TYPE event_loop_lag_seconds histogram" in response.text
+
+
+def test_pool_metric_families_expose_existing_pool_metrics():
+    """풀 수집 함수는 풀에 누적된 메트릭 객체를 그대로 노출"""
+    pool = MagicMock()
+    pool.metrics = PoolMetrics()
+    pool.metrics.checkouts.inc(3)
+    pool.metrics.wait_time.observe(0.2)
+
+    lines = [line for family in pool_metric_families(pool) for line in family.render()]
+
+    assert "db_pool_checkouts_total 3" in lines
+    assert "db_pool_wait_seconds_count 1" in lines
+
+
+@pytest.mark.asyncio
+async def test_event_loop_lag_detects_blocking_call():
+    """루프를 막는 동기 호출이 있으면 지연으로 기록"""
+    task = asyncio.create_task(instrumentation.monitor_event_loop_lag(0.01))
+    lag_before = metrics.EVENT_LOOP_LAG.labels().snapshot()["sum"]
+    await asyncio.sleep(0.02)
+    time.sleep(0.1)
+    await asyncio.sleep(0.02)
+    task.cancel()
+
+    assert metrics.EVENT_LOOP_LAG.labels().snapshot()["sum"] - lag_before >= 0.05
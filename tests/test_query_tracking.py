@@ -0,0 +1,105 @@
+"""요청당 SQL 쿼리 추적 (Server-Timing, 쿼리 예산) 테스트"""
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from app.core.config import Settings
+from app.core.instrumentation import (
+    QUERY_BUDGET_LOG,
+    QUERY_BUDGET_RAISE,
+    QueryBudget,
+    RequestInstrumentationMiddleware,
+    instrument_engine,
+    statement_shape,
+)
+from app.exceptions import QueryBudgetExceededError
+from app.models.subject import Subject
+
+
+@pytest.fixture
+async def instrumented_session(test_db_session):
+    """쿼리 계측 이벤트를 등록한 테스트 세션 (과목 3개)"""
+    instrument_engine(test_db_session.bind.sync_engine)
+    test_db_session.add_all([Subject(id=i, name=f"과목{i}") for i in range(1, 4)])
+    await test_db_session.commit()
+    return test_db_session
+
+
+def _n_plus_one_client(session, query_budget: QueryBudget) -> TestClient:
+    """과목마다 따로 조회하는(N+1) 라우트를 가진 앱"""
+    app = FastAPI()
+
+    @app.exception_handler(QueryBudgetExceededError)
+    async def handle_budget_error(request, exc):
+        return JSONResponse(status_code=exc.status_code, content={"detail": exc.message})
+
+    @app.get("/subjects")
+    async def list_subjects():
+        names = []
+        for subject_id in (1, 2, 3):
+            result = await session.execute(select(Subject.name).where(Subject.id == subject_id))
+            names.append(result.scalar_one())
+        return names
+
+    app.add_middleware(RequestInstrumentationMiddleware, record_metrics=False, query_budget=query_budget)
+    return TestClient(app)
+
+
+def test_statement_shape_ignores_whitespace_and_in_list_length():
+    """공백과 IN 목록 길이가 달라도 같은 형태"""
+    first = statement_shape("SELECT id\n  FROM quizzes WHERE id IN (?, ?, ?)")
+    second = statement_shape("SELECT id FROM quizzes WHERE id IN ($1, $2)")
+
+    assert first == second == "SELECT id FROM quizzes WHERE id IN (?)"
+
+
+@pytest.mark.asyncio
+async def test_server_timing_header_reports_queries(instrumented_session):
+    """응답의 Server-Timing 헤더에 요청 중 실행한 쿼리 수/시간"""
+    client = _n_plus_one_client(instrumented_session, QueryBudget(max_queries=30, repeat_limit=5))
+
+    response = client.get("/subjects")
+
+    assert response.status_code == 200
+    server_timing = response.headers["server-timing"]
+    assert 'desc="3 queries"' in server_timing
+    assert server_timing.startswith("db;dur=")
+    assert "app;dur=" in server_timing
+
+
+def test_server_timing_defaults_to_development_only():
+    """Server-Timing 헤더는 명시하지 않으면 development에서만 켬"""
+    assert Settings(environment="development").server_timing_enabled
+    assert not Settings(environment="production").server_timing_enabled
+    assert Settings(environment="production", server_timing_header=True).server_timing_enabled
+
+
+@pytest.mark.asyncio
+async def test_repeated_statement_raises_in_raise_mode(instrumented_session):
+    """raise 모드: 같은 형태의 쿼리가 허용 횟수를 넘으면 해당 쿼리 전에 중단"""
+    client = _n_plus_one_client(
+        instrumented_session, QueryBudget(max_queries=30, repeat_limit=2, mode=QUERY_BUDGET_RAISE)
+    )
+
+    response = client.get("/subjects")
+
+    assert response.status_code == 500
+    assert "3회 반복" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_query_budget_logs_in_log_mode(instrumented_session, caplog):
+    """log 모드: 응답은 정상, 요청 종료 시 경고 로그"""
+    client = _n_plus_one_client(
+        instrumented_session, QueryBudget(max_queries=2, repeat_limit=5, mode=QUERY_BUDGET_LOG)
+    )
+
+    with caplog.at_level(logging.WARNING, logger="app.core.instrumentation"):
+        response = client.get("/subjects")
+
+    assert response.status_code == 200
+    assert any("쿼리 3개 실행 (예산 2개)" in record.getMessage() for record in caplog.records)
@@ -0,0 +1,69 @@
+"""문제 일괄 조회 API 테스트"""
+import pytest
+
+from app.models.quiz import Quiz
+from app.models.subject import Subject
+from app.schemas.quiz import MAX_BATCH_QUIZ_IDS_QUERY
+
+OPTIONS = [{"index": i, "text": text} for i, text in enumerate(["가", "나", "다", "라"])]
+
+
+@pytest.fixture
+async def quizzes(test_db_session) -> list[Quiz]:
+    """문제 3개 생성 (두 번째 문제만 검증 완료)"""
+    test_db_session.add(Subject(id=1, name="ADsP"))
+    quizzes = [
+        Quiz(subject_id=1, question=f"문제{i}", options=OPTIONS, correct_answer=0, source_hash=f"batch_{i}")
+        for i in range(3)
+    ]
+    quizzes[1].latest_validation_status = "valid"
+    test_db_session.add_all(quizzes)
+    await test_db_session.commit()
+    return quizzes
+
+
+@pytest.mark.asyncio
+async def test_get_quizzes_preserves_order_and_reports_missing(client, quizzes, query_counter):
+    """요청 순서 유지, 중복 ID는 한 번만, 없는 ID는 missing_ids, 쿼리 1개"""
+    ids = [quizzes[2].id, 999, quizzes[0].id, quizzes[1].id, quizzes[2].id]
+
+    with query_counter.assert_max_queries(1):
+        response = client.get("/api/v1/quiz", params={"ids": ",".join(map(str, ids))})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [quiz["id"] for quiz in body["quizzes"]] == [quizzes[2].id, quizzes[0].id, quizzes[1].id]
+    assert body["missing_ids"] == [999]
+    assert body["total"] == 3
+    assert [quiz["validation_status"] for quiz in body["quizzes"]] == ["pending", "pending", "valid"]
+    assert body["quizzes"][0]["options"] == OPTIONS
+
+
+@pytest.mark.asyncio
+async def test_get_quizzes_matches_single_quiz_response(client, quizzes):
+    """일괄 조회 항목은 단건 조회와 같은 QuizResponse"""
+    single = client.get(f"/api/v1/quiz/{quizzes[1].id}").json()
+    batch = client.get("/api/v1/quiz", params={"ids": str(quizzes[1].id)}).json()
+
+    assert batch["quizzes"] == [single]
+
+
+@pytest.mark.asyncio
+async def test_get_quizzes_rejects_invalid_ids(client, quizzes):
+    """숫자가 아닌 ID, 빈 목록, 최대 개수 초과는 400"""
+    too_many = ",".join(str(i) for i in range(MAX_BATCH_QUIZ_IDS_QUERY + 1))
+
+    assert client.get("/api/v1/quiz", params={"ids": "1,a"}).status_code == 400
+    assert client.get("/api/v1/quiz", params={"ids": ","}).status_code == 400
+    assert client.get("/api/v1/quiz", params={"ids": too_many}).status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_post_batch_variant(client, quizzes):
+    """긴 목록용 POST 본문 버전"""
+    response = client.post("/api/v1/quiz/batch", json={"ids": [quizzes[1].id, 12345]})
+
+    assert response.status_code == 200
+    assert [quiz["id"] for quiz in response.json()["quizzes"]] == [quizzes[1].id]
+    assert response.json()["missing_ids"] == [12345]
+    assert client.post("/api/v1/quiz/batch", json={"ids": []}).status_code == 422
@@ -0,0 +1,87 @@
+"""문제 선택지 JSONB 저장 및 응답 변환 테스트"""
+import pytest
+
+from app.models.quiz import Quiz
+from app.models.subject import Subject
+from app.schemas.exam import ExamRecordResponse
+from app.schemas.quiz import QuizOptionResponse, QuizResponse
+
+OPTIONS = [{"index": i, "text": text} for i, text in enumerate(["가", "나", "다", "라"])]
+
+
+@pytest.fixture
+async def quiz(test_db_session) -> Quiz:
+    """선택지 4개짜리 문제 생성"""
+    test_db_session.add(Subject(id=1, name="ADsP"))
+    quiz = Quiz(subject_id=1, question="문제", options=OPTIONS, correct_answer=2, source_hash="options_hash")
+    test_db_session.add(quiz)
+    await test_db_session.commit()
+    await test_db_session.refresh(quiz)
+    return quiz
+
+
+@pytest.mark.asyncio
+async def test_options_round_trip_as_list(test_db_session, quiz):
+    """선택지는 문자열이 아닌 리스트로 저장/조회"""
+    test_db_session.expunge_all()
+    loaded = await test_db_session.get(Quiz, quiz.id)
+
+    assert loaded.options == OPTIONS
+
+
+@pytest.mark.asyncio
+async def test_from_quiz_matches_validated_response(quiz):
+    """from_quiz는 검증 경로와 같은 응답을 만듦"""
+    response = QuizResponse.from_quiz(quiz, "valid")
+    validated = QuizResponse.model_validate({
+        "id": quiz.id,
+        "subject_id": quiz.subject_id,
+        "question": quiz.question,
+        "options": quiz.options,
+        "correct_answer": quiz.correct_answer,
+        "explanation": quiz.explanation,
+        "source_url": quiz.source_url,
+        "created_at": quiz.created_at,
+        "validation_status": "valid",
+    })
+
+    assert response.model_dump() == validated.model_dump()
+    assert isinstance(response.options[0], QuizOptionResponse)
+
+
+@pytest.mark.asyncio
+async def test_from_quiz_hides_answer(quiz):
+    """시험용 응답은 정답을 숨김"""
+    response = QuizResponse.from_quiz(quiz, hide_answer=True)
+
+    assert response.correct_answer is None
+    assert response.validation_status == "pending"
+
+
+@pytest.mark.asyncio
+async def test_nested_orm_quiz_uses_from_quiz(quiz):
+    """시험 기록의 quiz 관계(ORM 객체)도 from_quiz로 변환"""
+    record = type("Record", (), {
+        "id": 1,
+        "quiz_id": quiz.id,
+        "user_answer": 2,
+        "is_correct": True,
+        "quiz": quiz,
+        "created_at": quiz.created_at,
+    })()
+
+    response = ExamRecordResponse.model_validate(record)
+
+    assert response.quiz.options[2].text == "다"
+    assert response.quiz.validation_status == "pending"
+
+
+def test_update_quiz_stores_options_list(client, test_db_session, quiz):
+    """문제 수정 시 선택지를 리스트로 저장하고 그대로 반환"""
+    new_options = [{"index": i, "text": f"새 선택지{i}"} for i in range(4)]
+
+    response = client.put(f"/api/v1/quiz/{quiz.id}", json={"options": new_options, "correct_answer": 1})
+
+    assert response.status_code == 200
+    assert response.json()["options"] == new_options
+    assert response.json()["correct_answer"] == 1
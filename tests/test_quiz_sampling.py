@@ -0,0 +1,132 @@
+"""문제 랜덤 샘플링 테스트"""
+from collections import Counter
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import quiz_sampling
+from app.models.quiz import Quiz
+from app.models.subject import Subject
+
+QUIZ_COUNT = 20
+SAMPLE_SIZE = 5
+ITERATIONS = 300
+
+
+async def _create_quizzes(session: AsyncSession, ids: list[int]) -> None:
+    """테스트용 과목과 문제 생성"""
+    session.add(Subject(id=1, name="ADsP"))
+    for quiz_id in ids:
+        session.add(Quiz(
+            id=quiz_id,
+            subject_id=1,
+            question=f"문제 {quiz_id}",
+            options=[{"index": 0, "text": "선택지1"}],
+            correct_answer=0,
+            source_hash=f"hash_{quiz_id}",
+        ))
+    await session.commit()
+
+
+async def _frequencies(session: AsyncSession, strategy: str | None) -> Counter:
+    """반복 샘플링 후 문제별 추출 횟수 집계"""
+    counter: Counter = Counter()
+    for _ in range(ITERATIONS):
+        quizzes = await quiz_sampling.sample_quizzes(
+            session, [Quiz.subject_id == 1], SAMPLE_SIZE, strategy=strategy
+        )
+        ids = [quiz.id for quiz in quizzes]
+        assert len(ids) == SAMPLE_SIZE
+        assert len(set(ids)) == SAMPLE_SIZE
+        counter.update(ids)
+    return counter
+
+
+def _assert_uniform(counter: Counter, quiz_ids: list[int]) -> None:
+    """모든 문제가 기대 빈도 근처로 뽑혔는지 확인 (약 4.5 표준편차 허용)"""
+    expected = ITERATIONS * SAMPLE_SIZE / len(quiz_ids)
+    for quiz_id in quiz_ids:
+        assert expected * 0.55 < counter[quiz_id] < expected * 1.45, (quiz_id, counter[quiz_id])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "strategy",
+    [
+        quiz_sampling.STRATEGY_ORDER_BY_RANDOM,
+        quiz_sampling.STRATEGY_ID_RANGE,
+        quiz_sampling.STRATEGY_RANDOM_KEY,
+    ],
+)
+async def test_sampling_strategies_are_uniform(test_db_session: AsyncSession, strategy: str):
+    """각 전략의 추출 빈도가 균등"""
+    quiz_ids = list(range(1, QUIZ_COUNT + 1))
+    await _create_quizzes(test_db_session, quiz_ids)
+
+    counter = await _frequencies(test_db_session, strategy)
+    _assert_uniform(counter, quiz_ids)
+
+
+@pytest.mark.asyncio
+async def test_sparse_ids_fall_back_to_random_key(test_db_session: AsyncSession):
+    """id가 희소하면 id_range에서 random_key로 전환해도 균등 추출"""
+    quiz_ids = [i * 1000 for i in range(1, QUIZ_COUNT + 1)]
+    await _create_quizzes(test_db_session, quiz_ids)
+
+    counter = await _frequencies(test_db_session, None)
+    _assert_uniform(counter, quiz_ids)
+
+
+@pytest.mark.asyncio
+async def test_sampling_respects_exclusions(test_db_session: AsyncSession):
+    """제외 목록의 문제는 추출되지 않음"""
+    quiz_ids = list(range(1, QUIZ_COUNT + 1))
+    await _create_quizzes(test_db_session, quiz_ids)
+    excluded = quiz_ids[:15]
+
+    for strategy in (
+        quiz_sampling.STRATEGY_ORDER_BY_RANDOM,
+        quiz_sampling.STRATEGY_ID_RANGE,
+        quiz_sampling.STRATEGY_RANDOM_KEY,
+    ):
+        quizzes = await quiz_sampling.sample_quizzes(
+            test_db_session, [Quiz.subject_id == 1], 10,
+            exclude_quiz_ids=excluded, strategy=strategy,
+        )
+        assert sorted(quiz.id for quiz in quizzes) == quiz_ids[15:]
+
+
+@pytest.mark.asyncio
+async def test_random_key_sampling_does_not_write(test_db_session: AsyncSession):
+    """random_key 샘플링은 읽기만 수행 (random_key를 갱신하지 않음)"""
+    quiz_ids = [i * 1000 for i in range(1, 81)]
+    await _create_quizzes(test_db_session, quiz_ids)
+    result = await test_db_session.execute(select(Quiz.id, Quiz.random_key))
+    keys_before = dict(result.all())
+
+    statements: list[str] = []
+    engine = test_db_session.bind.sync_engine
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        quizzes = await quiz_sampling.sample_quizzes(
+            test_db_session, [Quiz.subject_id == 1], 10, strategy=quiz_sampling.STRATEGY_RANDOM_KEY
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert len({quiz.id for quiz in quizzes}) == 10
+    assert all(statement.lstrip().upper().startswith("SELECT") for statement in statements)
+    result = await test_db_session.execute(select(Quiz.id, Quiz.random_key))
+    assert dict(result.all()) == keys_before
+
+
+def test_choose_strategy_by_size():
+    """후보 규모에 따른 전략 선택"""
+    assert quiz_sampling.choose_strategy(100) == quiz_sampling.STRATEGY_ORDER_BY_RANDOM
+    assert quiz_sampling.choose_strategy(100_000) == quiz_sampling.STRATEGY_ID_RANGE
+    assert quiz_sampling.choose_strategy(100_000, total_hint=30) == quiz_sampling.STRATEGY_ORDER_BY_RANDOM
@@ -32,7 +32,7 @@ def mock_sub_topic():
     """모킹된 세부항목"""
     sub_topic = MagicMock()
     sub_topic.id = 1
-    sub_topic.core_content = "테스트 핵심 정보"
+    sub_topic.core_content_count = 1
     sub_topic.main_topic = MagicMock()
     sub_topic.main_topic.subject_id = 1
     sub_topic.main_topic.subject = MagicMock()
@@ -43,9 +43,9 @@ def mock_sub_topic():
 @pytest.mark.asyncio
 async def test_generate_quiz_subject_not_found(mock_db_session, mock_subject):
     """과목을 찾을 수 없을 때 예외 발생"""
-    from app.crud import subject as subject_crud
+    from app.crud import taxonomy as taxonomy_crud
     
-    with patch.object(subject_crud, "get_subject_by_id", return_value=None):
+    with patch.object(taxonomy_crud, "get_subject", return_value=None):
         request = quiz_schema.QuizCreateRequest(
             source_type="text",
             source_text="테스트 텍스트",
@@ -59,9 +59,9 @@ async def test_generate_quiz_subject_not_found(mock_db_session, mock_subject):
 @pytest.mark.asyncio
 async def test_generate_quiz_invalid_request_url(mock_db_session, mock_subject):
     """URL 타입인데 source_url이 없을 때 예외 발생"""
-    from app.crud import subject as subject_crud
+    from app.crud import taxonomy as taxonomy_crud
     
-    with patch.object(subject_crud, "get_subject_by_id", return_value=mock_subject):
+    with patch.object(taxonomy_crud, "get_subject", return_value=mock_subject):
         request = quiz_schema.QuizCreateRequest(
             source_type="url",
             source_url=None,
@@ -75,9 +75,9 @@ async def test_generate_quiz_invalid_request_url(mock_db_session, mock_subject):
 @pytest.mark.asyncio
 async def test_generate_quiz_invalid_request_text(mock_db_session, mock_subject):
     """텍스트 타입인데 source_text가 없을 때 예외 발생"""
-    from app.crud import subject as subject_crud
+    from app.crud import taxonomy as taxonomy_crud
     
-    with patch.object(subject_crud, "get_subject_by_id", return_value=mock_subject):
+    with patch.object(taxonomy_crud, "get_subject", return_value=mock_subject):
         request = quiz_schema.QuizCreateRequest(
             source_type="text",
             source_text=None,
@@ -108,7 +108,7 @@ async def test_generate_study_quizzes_no_core_content(mock_db_session, mock_sub_
     """핵심 정보가 없을 때 예외 발생"""
     from app.crud import sub_topic as sub_topic_crud
     
-    mock_sub_topic.core_content = None
+    mock_sub_topic.core_content_count = 0
     
     with patch.object(sub_topic_crud, "get_sub_topic_with_core_content", return_value=mock_sub_topic):
         request = quiz_schema.StudyModeQuizCreateRequest(
@@ -135,7 +135,7 @@ async def test_get_next_study_quiz_no_core_content(mock_db_session, mock_sub_top
     """핵심 정보가 없을 때 예외 발생"""
     from app.crud import sub_topic as sub_topic_crud
     
-    mock_sub_topic.core_content = None
+    mock_sub_topic.core_content_count = 0
     
     with patch.object(sub_topic_crud, "get_sub_topic_with_core_content", return_value=mock_sub_topic):
         with pytest.raises(InvalidQuizRequestError):
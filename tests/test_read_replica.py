@@ -0,0 +1,65 @@
+"""읽기 복제본 라우팅 테스트"""
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.models import base
+
+
+def _session_maker(url: str):
+    return async_sessionmaker(create_async_engine(url), class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture
+def replica_state(monkeypatch):
+    """복제본 선택 상태를 테스트별로 초기화"""
+    monkeypatch.setattr(base, "_replica_down_until", {})
+    monkeypatch.setattr(base, "_read_cursor", iter(range(1000)))
+    monkeypatch.setattr(base, "_async_session_maker", _session_maker("sqlite+aiosqlite:///:memory:"))
+
+
+async def _open_read_session():
+    generator = base.get_read_db()
+    session = await generator.__anext__()
+    return generator, session
+
+
+def test_choose_replica_order_round_robin(replica_state):
+    """복제본은 라운드 로빈으로 선택"""
+    assert base.choose_replica_order(3) == [0, 1, 2]
+    assert base.choose_replica_order(3) == [1, 2, 0]
+    assert base.choose_replica_order(3) == [2, 0, 1]
+    assert base.choose_replica_order(0) == []
+
+
+def test_choose_replica_order_skips_down_replica(replica_state):
+    """연결 실패한 복제본은 cooldown 동안 제외"""
+    base.mark_replica_down(1)
+    assert base.choose_replica_order(3) == [0, 2]
+
+
+@pytest.mark.asyncio
+async def test_get_read_db_uses_replica(replica_state, monkeypatch):
+    """정상 복제본이 있으면 복제본 세션 사용"""
+    monkeypatch.setattr(base, "_read_session_makers", [_session_maker("sqlite+aiosqlite:///:memory:")])
+
+    generator, session = await _open_read_session()
+    assert base.is_read_replica(session)
+    assert (await session.execute(text("SELECT 1"))).scalar() == 1
+    await generator.aclose()
+
+
+@pytest.mark.asyncio
+async def test_get_read_db_falls_back_to_primary(replica_state, monkeypatch):
+    """복제본 연결 실패 시 primary로 대체하고 복제본을 제외 처리"""
+    monkeypatch.setattr(
+        base,
+        "_read_session_makers",
+        [_session_maker("sqlite+aiosqlite:////nonexistent-dir/replica.db")],
+    )
+
+    generator, session = await _open_read_session()
+    assert not base.is_read_replica(session)
+    assert (await session.execute(text("SELECT 1"))).scalar() == 1
+    assert base.choose_replica_order(1) == []
+    await generator.aclose()
@@ -0,0 +1,60 @@
+"""준비 상태 확인 (/ready) 테스트"""
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.config import settings
+from app.services import readiness_service
+
+
+@pytest.fixture
+async def small_pool_engine():
+    """커넥션 1개짜리 풀 (사용 중이면 사용률 100%)"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite://", poolclass=AsyncAdaptedQueuePool, pool_size=1, max_overflow=0, pool_timeout=5,
+    )
+    yield engine
+    await engine.dispose()
+
+
+def test_pool_saturation():
+    """사용 중 커넥션 / (pool_size + max_overflow), 제한 없는 풀은 None"""
+    status = {"pool_size": 5, "max_overflow": 5, "checked_out": 9}
+    assert readiness_service.pool_saturation(status) == 0.9
+    assert readiness_service.pool_saturation({**status, "max_overflow": -1}) is None
+    assert readiness_service.pool_saturation({"pool_size": None, "max_overflow": None, "checked_out": None}) is None
+
+
+def test_ready_reports_dependencies(client, test_db_session, monkeypatch):
+    """DB가 응답하면 200과 항목별 상태 반환"""
+    monkeypatch.setattr(readiness_service, "get_engine", lambda: test_db_session.bind)
+
+    response = client.get("/ready")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "ready"
+    assert body["database"]["status"] == "ok"
+    assert body["database"]["latency_ms"] >= 0
+    assert body["ai"]["max_concurrent"] == settings.gemini_max_concurrent
+    assert set(body["workers"]) == {"status", "alive", "expected"}
+    assert "taxonomy" in body["caches"]
+
+
+@pytest.mark.asyncio
+async def test_ready_unavailable_when_pool_saturated(small_pool_engine, monkeypatch):
+    """풀이 가득 차면 DB 확인은 제한 시간 내 실패하고 준비 안 됨"""
+    monkeypatch.setattr(settings, "readiness_db_timeout", 0.05)
+
+    ready, report = await readiness_service.check_readiness(small_pool_engine)
+    assert ready
+
+    async with small_pool_engine.connect():
+        ready, report = await readiness_service.check_readiness(small_pool_engine)
+
+    assert not ready
+    assert report["status"] == "unavailable"
+    assert report["pool"]["status"] == "saturated"
+    assert report["pool"]["saturation"] == 1.0
+    assert report["database"]["status"] == "timeout"
+
@@ -0,0 +1,89 @@
+"""JSON 응답 렌더링 테스트"""
+import json
+from datetime import date, datetime, timezone
+from enum import Enum
+
+import pytest
+
+from app.core import responses
+from app.core.responses import FastJSONResponse, json_dumps, model_json_response
+from app.models.quiz import Quiz
+from app.models.subject import Subject
+from app.schemas.quiz import QuizOptionResponse
+
+
+class _Status(Enum):
+    VALID = "valid"
+
+
+def test_json_dumps_same_output_without_orjson(monkeypatch):
+    """JSON 기본 타입이 아닌 값도 orjson 설치 여부와 관계없이 같은 bytes로 직렬화"""
+    content = {
+        "error": ValueError("잘못된 값"),
+        "at": datetime(2026, 1, 1, 9, 30, 0, 123, tzinfo=timezone.utc),
+        "day": date(2026, 1, 2),
+        "status": _Status.VALID,
+        1: "키",
+    }
+    body = json_dumps(content)
+    monkeypatch.setattr(responses, "orjson", None)
+
+    assert json_dumps(content) == body
+    assert json.loads(body) == {
+        "error": "잘못된 값",
+        "at": "2026-01-01T09:30:00.000123+00:00",
+        "day": "2026-01-02",
+        "status": "valid",
+        "1": "키",
+    }
+
+
+def test_fast_json_response_renders_bytes():
+    """FastJSONResponse는 dict를 UTF-8 JSON으로 렌더링"""
+    response = FastJSONResponse(status_code=404, content={"detail": "없음"})
+
+    assert response.status_code == 404
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == {"detail": "없음"}
+
+
+def test_model_json_response_matches_model_dump_json():
+    """model_json_response는 model_dump_json과 같은 본문과 지정한 상태 코드를 반환"""
+    option = QuizOptionResponse(index=0, text="선택지")
+
+    response = model_json_response(option, status_code=201)
+
+    assert response.status_code == 201
+    assert response.body == option.model_dump_json().encode("utf-8")
+
+
+@pytest.mark.asyncio
+async def test_quiz_api_returns_unescaped_json(client, test_db_session):
+    """문제 조회 API 응답 본문에 한글이 그대로 포함"""
+    test_db_session.add(Subject(id=1, name="ADsP"))
+    quiz = Quiz(
+        subject_id=1,
+        question="데이터 분석 문제",
+        options=[{"index": i, "text": f"선택지{i}"} for i in range(4)],
+        correct_answer=0,
+        source_hash="response_hash",
+    )
+    test_db_session.add(quiz)
+    await test_db_session.commit()
+
+    response = client.get(f"/api/v1/quiz/{quiz.id}")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert "데이터 분석 문제".encode("utf-8") in response.content
+    assert response.json()["options"][3]["text"] == "선택지3"
+
+
+def test_validation_error_with_exception_context_renders(client):
+    """검증 오류 ctx의 예외 객체도 문자열로 직렬화되어 422 반환"""
+    response = client.post("/api/v1/quiz/generate", json={"source_type": "url", "source_url": ""})
+
+    assert response.status_code == 422
+    error = response.json()["detail"][0]
+    assert error["loc"] == ["body", "source_url"]
+    assert "source_url" in error["ctx"]["error"]
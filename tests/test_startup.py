@@ -0,0 +1,69 @@
+"""서버 시작 시간 (지연 import, 시작 준비 작업) 테스트"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.crud.taxonomy import taxonomy_cache
+from app.models.subject import Subject
+from app.services import warmup_service
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# app.main import 시 불러오면 안 되는 무거운 SDK (실제 호출 시점에 import)
+LAZY_MODULES = ("google.genai", "youtube_transcript_api")
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """python -X importtime 결과를 {모듈: 누적 import 시간(µs)}으로 파싱"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_app_import_does_not_load_heavy_sdks():
+    """app.main import 시 Gemini/YouTube SDK를 불러오지 않음"""
+    times = _import_times("app.main")
+
+    assert "app.main" in times
+    loaded = [name for name in times if name.startswith(LAZY_MODULES)]
+    slowest = sorted(times.items(), key=lambda item: item[1], reverse=True)[:10]
+    assert not loaded, f"지연 import 대상이 로드됨: {loaded}\n느린 import: {slowest}"
+
+
+@pytest.mark.asyncio
+async def test_prewarm_connections_and_statements(test_db_session):
+    """커넥션 준비와 자주 쓰는 쿼리 실행은 데이터가 없어도 성공"""
+    test_db_session.add(Subject(id=1, name="ADsP"))
+    await test_db_session.commit()
+
+    await warmup_service.prewarm_connections(test_db_session.bind, 2)
+    await warmup_service.prewarm_statements(test_db_session)
+    snapshot = await taxonomy_cache.get()
+
+    assert snapshot.subjects[1].name == "ADsP"
+
+
+@pytest.mark.asyncio
+async def test_startup_prewarm_failure_does_not_block_startup(monkeypatch):
+    """준비 작업이 실패해도 예외 없이 넘어감"""
+    async def broken_prewarm():
+        raise ConnectionRefusedError("db down")
+
+    monkeypatch.setattr(warmup_service, "prewarm", broken_prewarm)
+    monkeypatch.setattr(warmup_service.settings, "startup_prewarm", True)
+
+    await warmup_service.run_startup_prewarm()
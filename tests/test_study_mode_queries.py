@@ -0,0 +1,54 @@
+"""학습 모드 요청당 쿼리 수 테스트"""
+import pytest
+
+from app.crud import quiz_validation as validation_crud
+from app.models.core_content_item import CoreContentItem
+from app.models.main_topic import MainTopic
+from app.models.quiz import Quiz
+from app.models.sub_topic import SubTopic
+from app.models.subject import Subject
+
+CACHED_QUIZ_COUNT = 30
+# 세부항목 조회, 최신 문제, 문제 수, 샘플링(개수+조회), 검증 상태 일괄 조회 + 여유분
+MAX_STUDY_QUERIES = 8
+
+
+@pytest.fixture
+async def study_sub_topic(test_db_session):
+    """충분한 캐시 문제(30개)가 있는 세부항목 생성"""
+    test_db_session.add(Subject(id=1, name="ADsP"))
+    test_db_session.add(MainTopic(id=1, subject_id=1, name="주요항목1"))
+    test_db_session.add(SubTopic(id=1, main_topic_id=1, name="세부항목1", core_content_count=1))
+    test_db_session.add(CoreContentItem(
+        sub_topic_id=1, position=1, source_type="text", content="핵심 정보", content_hash="hash",
+    ))
+    for i in range(CACHED_QUIZ_COUNT):
+        test_db_session.add(Quiz(
+            subject_id=1,
+            sub_topic_id=1,
+            question=f"데이터 분석 개념 {i}번에 대한 설명으로 옳은 것은? 고유어{i}x{i * 7}",
+            options=[{"index": i, "text": text} for i, text in enumerate(["가", "나", "다", "라"])],
+            correct_answer=0,
+            source_hash=f"study_hash_{i}",
+        ))
+    await test_db_session.commit()
+    await validation_crud.create_quiz_validation(test_db_session, 1, "valid")
+
+
+@pytest.mark.parametrize("quiz_count", [5, 20])
+def test_generate_study_quizzes_query_count_is_constant(
+    client, study_sub_topic, query_counter, quiz_count
+):
+    """반환 문제 수와 무관하게 요청당 쿼리 수 일정 (문제별 검증 상태 조회 없음)"""
+    with query_counter.assert_max_queries(MAX_STUDY_QUERIES):
+        response = client.post(
+            "/api/v1/quiz/generate-study",
+            json={"sub_topic_id": 1, "quiz_count": quiz_count},
+        )
+
+    assert response.status_code == 201
+    quizzes = response.json()["quizzes"]
+    assert len(quizzes) > 0
+    statuses = {q["id"]: q["validation_status"] for q in quizzes}
+    if 1 in statuses:
+        assert statuses[1] == "valid"
@@ -0,0 +1,92 @@
+"""세부항목별 문제 재고 집계 테스트"""
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import quiz as quiz_crud, sub_topic_quiz_stats as stats_crud
+from app.models.main_topic import MainTopic
+from app.models.quiz import Quiz
+from app.models.sub_topic import SubTopic
+from app.models.subject import Subject
+from app.schemas.ai import AIQuizGenerationResponse, AIQuizOption
+from app.services import quiz_service
+
+
+@pytest.fixture
+async def sub_topics(test_db_session: AsyncSession):
+    """테스트용 과목/주요항목/세부항목 2개 생성"""
+    test_db_session.add(Subject(id=1, name="ADsP"))
+    test_db_session.add(MainTopic(id=1, subject_id=1, name="주요항목1"))
+    test_db_session.add(SubTopic(id=1, main_topic_id=1, name="세부항목1"))
+    test_db_session.add(SubTopic(id=2, main_topic_id=1, name="세부항목2"))
+    await test_db_session.commit()
+
+
+async def _create_quiz(session: AsyncSession, sub_topic_id: int, index: int) -> Quiz:
+    ai_response = AIQuizGenerationResponse(
+        question=f"문제 {index}",
+        options=[AIQuizOption(index=i, text=f"선택지{i}") for i in range(4)],
+        correct_answer=0,
+        explanation="해설",
+    )
+    return await quiz_crud.create_quiz(
+        session,
+        subject_id=1,
+        ai_response=ai_response,
+        source_hash=f"stats_hash_{index}",
+        sub_topic_id=sub_topic_id,
+    )
+
+
+@pytest.mark.asyncio
+async def test_stats_follow_create_rehome_and_delete(test_db_session: AsyncSession, sub_topics):
+    """문제 생성/세부항목 재배치/삭제 시 집계 갱신"""
+    quizzes = [await _create_quiz(test_db_session, 1, i) for i in range(3)]
+
+    stats = await stats_crud.get_sub_topic_quiz_stats(test_db_session, 1)
+    assert stats.quiz_count == 3
+    assert stats.latest_quiz_created_at is not None
+    assert await quiz_crud.get_quiz_count_by_sub_topic_id(test_db_session, 1) == 3
+
+    await quiz_crud.update_quiz(test_db_session, quizzes[0].id, sub_topic_id=2)
+    assert (await stats_crud.get_sub_topic_quiz_stats(test_db_session, 1)).quiz_count == 2
+    assert (await stats_crud.get_sub_topic_quiz_stats(test_db_session, 2)).quiz_count == 1
+
+    await test_db_session.delete(quizzes[0])
+    await test_db_session.commit()
+    stats = await stats_crud.get_sub_topic_quiz_stats(test_db_session, 2)
+    assert stats.quiz_count == 0
+    assert stats.latest_quiz_created_at is None
+
+
+@pytest.mark.asyncio
+async def test_record_generation_attempt(test_db_session: AsyncSession, sub_topics):
+    """연속 생산 실패 횟수 누적 및 성공 시 초기화"""
+    for _ in range(2):
+        await stats_crud.record_generation_attempt(test_db_session, 1, similarity_failed=True)
+    await test_db_session.commit()
+
+    stats = await stats_crud.get_sub_topic_quiz_stats(test_db_session, 1)
+    assert stats.consecutive_similarity_failures == 2
+    assert stats.last_generation_attempt_at is not None
+    assert stats.quiz_count == 0
+
+    await stats_crud.record_generation_attempt(test_db_session, 1, similarity_failed=False)
+    await test_db_session.commit()
+    stats = await stats_crud.get_sub_topic_quiz_stats(test_db_session, 1)
+    assert stats.consecutive_similarity_failures == 0
+
+
+@pytest.mark.asyncio
+async def test_dashboard_reports_production_difficult(test_db_session: AsyncSession, sub_topics):
+    """연속 생산 실패가 임계값 이상이면 production_difficult"""
+    await _create_quiz(test_db_session, 2, 0)
+    for _ in range(quiz_service.PRODUCTION_DIFFICULT_FAILURE_THRESHOLD):
+        await stats_crud.record_generation_attempt(test_db_session, 1, similarity_failed=True)
+    await test_db_session.commit()
+
+    dashboard = await quiz_service.get_quiz_dashboard(test_db_session)
+
+    assert dashboard.total_quizzes == 1
+    assert dashboard.category_status["ADsP > 주요항목1 > 세부항목1"] == "production_difficult"
+    assert dashboard.category_status["ADsP > 주요항목1 > 세부항목2"] == "insufficient"
+    assert dashboard.quizzes_by_category["ADsP > 주요항목1 > 세부항목2"] == 1
@@ -0,0 +1,137 @@
+"""분류 체계 캐시 테스트"""
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud import sub_topic as sub_topic_crud, taxonomy as taxonomy_crud
+from app.crud.taxonomy import taxonomy_cache
+from app.models.main_topic import MainTopic
+from app.models.sub_topic import SubTopic
+from app.models.subject import Subject
+
+
+@pytest.fixture
+async def taxonomy(test_db_session: AsyncSession):
+    """과목 1개, 주요항목 2개, 세부항목 3개 생성"""
+    test_db_session.add(Subject(id=1, name="ADsP"))
+    test_db_session.add(MainTopic(id=1, subject_id=1, name="데이터 이해"))
+    test_db_session.add(MainTopic(id=2, subject_id=1, name="데이터 분석"))
+    test_db_session.add(SubTopic(id=3, main_topic_id=2, name="회귀분석"))
+    test_db_session.add(SubTopic(id=1, main_topic_id=1, name="데이터의 이해"))
+    test_db_session.add(SubTopic(id=2, main_topic_id=1, name="데이터 가치"))
+    await test_db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_category_path_and_order(test_db_session, taxonomy):
+    """카테고리 경로를 미리 만들고 주요항목 → 세부항목 순으로 반환"""
+    sub_topics = await taxonomy_crud.get_sub_topics()
+
+    assert [st.id for st in sub_topics] == [1, 2, 3]
+    assert sub_topics[2].category_path == "ADsP > 데이터 분석 > 회귀분석"
+    assert sub_topics[2].main_topic.subject.name == "ADsP"
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_runs_no_queries(test_db_session, taxonomy, query_counter):
+    """적재 후에는 DB를 조회하지 않음"""
+    await taxonomy_crud.get_sub_topics()
+
+    with query_counter.assert_max_queries(0):
+        assert (await taxonomy_crud.get_subject(1)).name == "ADsP"
+        assert (await taxonomy_crud.get_sub_topic(2)).name == "데이터 가치"
+
+
+@pytest.mark.asyncio
+async def test_commit_invalidates_and_rollback_does_not(test_db_session, taxonomy):
+    """분류 체계 쓰기가 커밋되면 무효화, 롤백되면 유지"""
+    await taxonomy_crud.get_sub_topics()
+    version = taxonomy_cache.version
+
+    sub_topic = await test_db_session.get(SubTopic, 3)
+    sub_topic.name = "변경 전 이름"
+    await test_db_session.flush()
+    await test_db_session.rollback()
+    assert taxonomy_cache.version == version
+
+    sub_topic = await test_db_session.get(SubTopic, 3)
+    sub_topic.name = "다중회귀분석"
+    await test_db_session.commit()
+    assert taxonomy_cache.version > version
+
+    cached = await taxonomy_crud.get_sub_topic(3)
+    assert cached.category_path == "ADsP > 데이터 분석 > 다중회귀분석"
+
+
+@pytest.mark.asyncio
+async def test_invalidation_during_load_forces_reload(test_db_session, taxonomy, monkeypatch):
+    """적재 중 무효화되면 적재한 스냅샷은 다음 조회 때 오래된 것으로 취급"""
+    original_load = taxonomy_crud._load_snapshot
+
+    async def load_and_invalidate(session, version):
+        snapshot = await original_load(session, version)
+        taxonomy_cache.invalidate()
+        return snapshot
+
+    monkeypatch.setattr(taxonomy_crud, "_load_snapshot", load_and_invalidate)
+    first = await taxonomy_cache.get()
+    monkeypatch.setattr(taxonomy_crud, "_load_snapshot", original_load)
+
+    second = await taxonomy_cache.get()
+    assert second is not first
+    assert second.version == taxonomy_cache.version
+
+
+@pytest.mark.asyncio
+async def test_ttl_expiry_reloads(test_db_session, taxonomy, monkeypatch):
+    """TTL이 지나면 다른 프로세스의 변경 반영을 위해 다시 읽음"""
+    first = await taxonomy_cache.get()
+    monkeypatch.setattr(settings, "taxonomy_cache_ttl", 0.0)
+
+    assert await taxonomy_cache.get() is not first
+
+
+@pytest.mark.asyncio
+async def test_change_from_other_process_is_detected(test_db_session, taxonomy, monkeypatch):
+    """다른 프로세스의 삭제(세션 이벤트 없이 커밋)는 확인 주기가 지나면 반영"""
+    assert await taxonomy_crud.get_sub_topic(3) is not None
+
+    async with test_db_session.bind.begin() as conn:
+        await conn.execute(delete(SubTopic.__table__).where(SubTopic.__table__.c.id == 3))
+    assert await taxonomy_crud.get_sub_topic(1) is not None
+    assert 3 in (await taxonomy_cache.get()).sub_topics
+
+    monkeypatch.setattr(settings, "taxonomy_cache_check_interval", 0.0)
+    assert 3 not in (await taxonomy_cache.get()).sub_topics
+
+
+@pytest.mark.asyncio
+async def test_unchanged_check_keeps_snapshot(test_db_session, taxonomy, monkeypatch, query_counter):
+    """확인 주기가 지나도 변경이 없으면 변경 감지 쿼리 한 번만 실행하고 스냅샷 유지"""
+    first = await taxonomy_cache.get()
+    monkeypatch.setattr(settings, "taxonomy_cache_check_interval", 0.0)
+
+    with query_counter.assert_max_queries(1):
+        assert await taxonomy_cache.get() is first
+
+
+@pytest.mark.asyncio
+async def test_core_content_state_is_never_cached(test_db_session, taxonomy):
+    """분류 체계가 캐시되어 있어도 핵심 정보 상태는 최신 값을 반환"""
+    before = await sub_topic_crud.get_sub_topic_with_core_content(test_db_session, 1)
+    assert before.core_content_count == 0
+
+    await sub_topic_crud.append_sub_topic_core_content(test_db_session, 1, "핵심 정보", "youtube_url")
+    after = await sub_topic_crud.get_sub_topic_with_core_content(test_db_session, 1)
+
+    assert after.core_content_count == 1
+    assert after.source_type == "youtube_url"
+    assert after.updated_at >= before.updated_at
+    assert after.category_path == "ADsP > 데이터 이해 > 데이터의 이해"
+
+
+@pytest.mark.asyncio
+async def test_missing_sub_topic_returns_none(test_db_session, taxonomy):
+    """존재하지 않는 세부항목은 None"""
+    assert await sub_topic_crud.get_sub_topic_with_core_content(test_db_session, 999) is None
@@ -1,6 +1,18 @@
 """YouTube 서비스 테스트"""
+import asyncio
+import time
+
 import pytest
+import requests
+from sqlalchemy import select
 
+from app.core.config import settings
+from app.core.thread_pool import BoundedThreadPool
+from app.crud.youtube_transcript import transcript_cache
+from app.exceptions import TranscriptUnavailableError
+from app.models.youtube_transcript import YoutubeTranscript
+from app.services import youtube_service
+from app.services.job_service import JobWorkerPool
 from app.services.youtube_service import extract_video_id, generate_hash
 
 
@@ -45,3 +57,172 @@ def test_generate_hash_different_texts():
     hash2 = generate_hash("text2")
     
     assert hash1 != hash2
+
+
+@pytest.mark.asyncio
+async def test_get_transcript_caches_in_memory_and_db(transcript_cache_db, monkeypatch):
+    """같은 영상은 자막 API를 한 번만 호출하고, 메모리 캐시가 비어도 DB에서 반환"""
+    calls = []
+
+    async def fake_extract_transcript(video_id: str) -> str:
+        calls.append(video_id)
+        return "테스트 자막"
+
+    monkeypatch.setattr(youtube_service, "extract_transcript", fake_extract_transcript)
+
+    assert await youtube_service.get_transcript("video1") == "테스트 자막"
+    assert await youtube_service.get_transcript("video1") == "테스트 자막"
+    transcript_cache.clear()
+    assert await youtube_service.get_transcript("video1") == "테스트 자막"
+
+    assert calls == ["video1"]
+
+
+@pytest.mark.asyncio
+async def test_get_transcript_does_not_hold_session_while_fetching(
+    test_db_session, transcript_cache_db, monkeypatch,
+):
+    """자막 추출 중에는 캐시 세션을 닫아 두고, 호출자의 세션은 건드리지 않음"""
+    opened = []
+
+    def tracking_session_factory():
+        session = transcript_cache_db()
+        opened.append(session)
+        return session
+
+    async def fake_extract_transcript(video_id: str) -> str:
+        assert opened and not any(session.in_transaction() for session in opened)
+        return "테스트 자막"
+
+    monkeypatch.setattr(transcript_cache, "session_factory", tracking_session_factory)
+    monkeypatch.setattr(youtube_service, "extract_transcript", fake_extract_transcript)
+
+    assert await youtube_service.get_transcript("video4") == "테스트 자막"
+    assert not test_db_session.in_transaction()
+
+
+@pytest.mark.asyncio
+async def test_get_transcript_caches_missing_transcript(transcript_cache_db, monkeypatch):
+    """자막 없음 결과도 저장해 다시 호출하지 않고 같은 오류 반환"""
+    calls = []
+
+    async def fake_extract_transcript(video_id: str) -> str:
+        calls.append(video_id)
+        raise ValueError("자막을 찾을 수 없습니다: 비활성화")
+
+    monkeypatch.setattr(youtube_service, "extract_transcript", fake_extract_transcript)
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="비활성화"):
+            await youtube_service.get_transcript("video2")
+    assert calls == ["video2"]
+
+
+@pytest.mark.asyncio
+async def test_get_transcript_refetches_after_ttl(transcript_cache_db, monkeypatch):
+    """TTL이 지난 결과는 다시 추출"""
+    calls = []
+
+    async def fake_extract_transcript(video_id: str) -> str:
+        calls.append(video_id)
+        return f"자막 {len(calls)}"
+
+    monkeypatch.setattr(youtube_service, "extract_transcript", fake_extract_transcript)
+    monkeypatch.setattr(settings, "transcript_cache_ttl", -1.0)
+
+    assert await youtube_service.get_transcript("video3") == "자막 1"
+    assert await youtube_service.get_transcript("video3") == "자막 2"
+
+
+@pytest.mark.asyncio
+async def test_worker_purges_expired_transcripts(transcript_cache_db, monkeypatch):
+    """작업 워커의 주기적 정리는 만료된 자막 행만 삭제하고 transcript_purge_interval 안에는 다시 실행하지 않음"""
+    await transcript_cache.put("fresh", "ko", "자막")
+    monkeypatch.setattr(settings, "transcript_cache_ttl", -1.0)
+    await transcript_cache.put("expired", "ko", "자막")
+    pool = JobWorkerPool(session_factory=transcript_cache_db, concurrency=1)
+
+    await pool.purge_expired_transcripts()
+    async with transcript_cache_db() as session:
+        remaining = (await session.scalars(select(YoutubeTranscript.video_id))).all()
+    assert remaining == ["fresh"]
+
+    await transcript_cache.put("expired", "ko", "자막")
+    await pool.purge_expired_transcripts()
+    async with transcript_cache_db() as session:
+        assert await session.get(YoutubeTranscript, ("expired", "ko")) is not None
+
+
+@pytest.fixture
+def transcript_pool(monkeypatch):
+    """테스트마다 새 자막 추출 스레드 풀"""
+    pool = BoundedThreadPool(2, thread_name_prefix="test-transcript")
+    monkeypatch.setattr(youtube_service, "_transcript_pool", pool)
+    monkeypatch.setattr(settings, "transcript_fetch_backoff", 0.0)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_extract_transcript_keeps_event_loop_responsive(transcript_pool, monkeypatch):
+    """느린 동기 자막 API를 기다리는 동안에도 이벤트 루프는 다른 작업을 처리"""
+    def slow_fetch(video_id: str) -> str:
+        time.sleep(0.3)
+        return "느린 자막"
+
+    monkeypatch.setattr(youtube_service, "_fetch_transcript_sync", slow_fetch)
+
+    gaps = []
+
+    async def ticker():
+        last = time.perf_counter()
+        while True:
+            await asyncio.sleep(0.01)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+
+    ticker_task = asyncio.create_task(ticker())
+    try:
+        assert await youtube_service.extract_transcript("slow") == "느린 자막"
+    finally:
+        ticker_task.cancel()
+
+    assert len(gaps) >= 10
+    assert max(gaps) < 0.1
+
+
+@pytest.mark.asyncio
+async def test_extract_transcript_times_out(transcript_pool, monkeypatch):
+    """제한 시간이 지나면 스레드를 기다리지 않고 503 오류"""
+    monkeypatch.setattr(youtube_service, "_fetch_transcript_sync", lambda video_id: time.sleep(0.5))
+    monkeypatch.setattr(settings, "transcript_fetch_timeout", 0.05)
+
+    start = time.perf_counter()
+    with pytest.raises(TranscriptUnavailableError):
+        await youtube_service.extract_transcript("hang")
+    assert time.perf_counter() - start < 0.3
+
+
+@pytest.mark.asyncio
+async def test_extract_transcript_retries_transient_errors(transcript_pool, monkeypatch):
+    """네트워크 오류는 재시도하고, 자막 없음은 재시도하지 않음"""
+    calls = []
+
+    def flaky_fetch(video_id: str) -> str:
+        calls.append(video_id)
+        if video_id == "missing":
+            raise ValueError("자막을 찾을 수 없습니다")
+        if len(calls) == 1:
+            raise requests.ConnectionError("연결 끊김")
+        return "자막"
+
+    monkeypatch.setattr(youtube_service, "_fetch_transcript_sync", flaky_fetch)
+
+    assert await youtube_service.extract_transcript("flaky") == "자막"
+    assert calls == ["flaky", "flaky"]
+
+    calls.clear()
+    with pytest.raises(ValueError):
+        await youtube_service.extract_transcript("missing")
+    assert calls == ["missing"]